@@ -29,15 +29,26 @@ class RegistrationSerializer(serializers.ModelSerializer):
         return value
 
     def create(self, validated_data):
+        """Create user, token and profile, with password_hash when the password was already hashed off the request"""
+
         validated_data.pop('repeated_password')
         username = validated_data.pop('username')
         user_type = validated_data.pop('type', 'customer')
 
-        user = User.objects.create_user(
-            username=username,
-            email=validated_data['email'],
-            password=validated_data['password'],
-        )
+        password_hash = validated_data.pop('password_hash', None)
+        if password_hash is None:
+            user = User.objects.create_user(
+                username=username,
+                email=validated_data['email'],
+                password=validated_data['password'],
+            )
+        else:
+            user = User.objects.model(
+                username=User.normalize_username(username),
+                email=User.objects.normalize_email(validated_data['email']),
+            )
+            user.password = password_hash
+            user.save(using=User.objects.db)
 
         Token.objects.create(user=user)
         Profile.objects.create(user=user, type=user_type)
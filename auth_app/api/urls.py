@@ -1,9 +1,12 @@
 from django.urls import path
-from .views import RegisterView, LoginView, LogoutView
+from .views import RegisterView, LoginView, LogoutView, TokenRefreshView, AsyncRegisterView, AsyncLoginView
 
 
 urlpatterns = [
     path('registration/', RegisterView.as_view(), name='registration'),
     path('login/', LoginView.as_view(), name='login'),
+    path('registration/async/', AsyncRegisterView.as_view(), name='registration-async'),
+    path('login/async/', AsyncLoginView.as_view(), name='login-async'),
     path('logout/', LogoutView.as_view(), name='logout'),
+    path('token/refresh/', TokenRefreshView.as_view(), name='token-refresh'),
 ]
\ No newline at end of file
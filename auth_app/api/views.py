@@ -1,14 +1,48 @@
+from asgiref.sync import sync_to_async
+from django.views import View
+from django.http import Http404, JsonResponse
+from django.views.decorators.csrf import csrf_exempt
 from django.contrib.auth import authenticate
+from django.contrib.auth.models import User
+from django.contrib.auth.hashers import make_password
 
 from rest_framework import status
 from rest_framework.views import APIView
+from rest_framework.request import Request
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.exceptions import APIException, AuthenticationFailed
 from rest_framework.authtoken.models import Token
 from rest_framework.permissions import AllowAny, IsAuthenticated
 
+from auth_app.signed_tokens import signed_token_settings, issue_token, revocations
+from auth_app.hashing import HashingPoolFull, run_hashing
 from .serializers import RegistrationSerializer
 
 
+def signed_token_fields(user):
+    """access_token and expires_in for the response when signed tokens are enabled"""
+
+    if not signed_token_settings()['ENABLED']:
+        return {}
+    return issue_token(user)
+
+
+def token_payload(user, token):
+    return {
+        "token": token.key,
+        "username": user.username,
+        "email": user.email,
+        "user_id": user.id,
+        **signed_token_fields(user)
+    }
+
+
+def login_payload(user):
+    token, created = Token.objects.get_or_create(user=user)
+    return token_payload(user, token)
+
+
 class RegisterView(APIView):
     """API view for user registration."""
     
@@ -18,12 +52,7 @@ class RegisterView(APIView):
         serializer = RegistrationSerializer(data=request.data)
         if serializer.is_valid():
             user = serializer.save()
-            return Response({
-                "token": user.auth_token.key,
-                "username": user.username,
-                "email": user.email,
-                "user_id": user.id
-            }, status=status.HTTP_201_CREATED)
+            return Response(token_payload(user, user.auth_token), status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
@@ -42,13 +71,7 @@ class LoginView(APIView):
         user = authenticate(username=username, password=password)
         
         if user:
-            token, created = Token.objects.get_or_create(user=user)
-            return Response({
-                "token": token.key,
-                "username": user.username,
-                "email": user.email,
-                "user_id": user.id
-            }, status=status.HTTP_200_OK)
+            return Response(login_payload(user), status=status.HTTP_200_OK)
         
         return Response({"error": "Invalid username or password."}, status=status.HTTP_400_BAD_REQUEST)
     
@@ -59,6 +82,88 @@ class LogoutView(APIView):
     permission_classes = [IsAuthenticated]
 
     def post(self, request):
+        if isinstance(request.auth, dict):
+            revocations.revoke(request.auth)
+            return Response({"message": "Logout successful. Token revoked."}, status=status.HTTP_200_OK)
         request.user.auth_token.delete()
         return Response({"message": "Logout successful. Token deleted."}, status=status.HTTP_200_OK)
-    
\ No newline at end of file
+
+
+class TokenRefreshView(APIView):
+    """API view for exchanging a valid token for a new signed access token."""
+    
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        """Re-read the user and profile so deactivation and type changes apply, then revoke the old signed token"""
+        
+        if not signed_token_settings()['ENABLED']:
+            raise Http404
+        user = User.objects.select_related('profile').filter(id=request.user.id, is_active=True).first()
+        if user is None:
+            raise AuthenticationFailed("User inactive or deleted.")
+        if isinstance(request.auth, dict):
+            revocations.revoke(request.auth)
+        return Response(issue_token(user), status=status.HTTP_200_OK)
+
+
+class AsyncAuthView(View):
+    """
+    Base for the async login and registration endpoints.
+
+    Password hashing runs on the bounded hashing pool (auth_app.hashing) instead of the request
+    worker; when the pool is full the request is answered with 503 and Retry-After.
+    Like DRF views these endpoints are CSRF exempt and parse the body with DEFAULT_PARSER_CLASSES.
+    """
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        return csrf_exempt(super().as_view(**initkwargs))
+
+    async def post(self, request):
+        drf_request = Request(request, parsers=[parser() for parser in api_settings.DEFAULT_PARSER_CLASSES])
+        try:
+            data = drf_request.data
+        except APIException as exc:
+            return JsonResponse({'detail': exc.detail}, status=exc.status_code)
+        try:
+            return await self.handle(request, data)
+        except HashingPoolFull:
+            response = JsonResponse({"error": "Too many requests, please try again shortly."}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+            response['Retry-After'] = '1'
+            return response
+
+
+class AsyncRegisterView(AsyncAuthView):
+    """Async API view for user registration."""
+
+    async def handle(self, request, data):
+        serializer = RegistrationSerializer(data=data)
+        if not await sync_to_async(serializer.is_valid)():
+            return JsonResponse(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        password_hash = await run_hashing(make_password, serializer.validated_data['password'])
+        user = await sync_to_async(serializer.save)(password_hash=password_hash)
+        payload = await sync_to_async(token_payload)(user, user.auth_token)
+        return JsonResponse(payload, status=status.HTTP_201_CREATED)
+
+
+class AsyncLoginView(AsyncAuthView):
+    """Async API view for user authentication."""
+
+    async def handle(self, request, data):
+        if not isinstance(data, dict):
+            data = {}
+        username = data.get('username')
+        password = data.get('password')
+
+        if not username or not password:
+            return JsonResponse({"error": "Username and password are required."}, status=status.HTTP_400_BAD_REQUEST)
+
+        # authenticate() runs the configured backends, hashes for unknown users, upgrades outdated
+        # hashes and sends user_login_failed, all on the hashing pool.
+        user = await run_hashing(authenticate, request, username=username, password=password)
+        if user:
+            return JsonResponse(await sync_to_async(login_payload)(user), status=status.HTTP_200_OK)
+
+        return JsonResponse({"error": "Invalid username or password."}, status=status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,77 @@
+from django.core import signing
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework import exceptions
+from rest_framework.authentication import BaseAuthentication, TokenAuthentication, get_authorization_header
+from rest_framework.authtoken.models import Token
+
+from auth_app.cache import get_cached_user, cache_user, restore_user
+from auth_app.signed_tokens import signed_token_settings, read_token, is_expired, revocations, user_values
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    Token authentication that loads the user and its profile in one query and caches both.
+
+    request.user.profile is attached at authentication, so permissions and views need no
+    further lookup. Token -> user entries live in a local LRU backed by the shared cache and
+    are dropped when the token is deleted (logout) and whenever the user or profile is saved,
+    e.g. deactivated. Other worker processes may keep their local copy for up to
+    AUTH_TOKEN_CACHE['LOCAL_TTL'] seconds.
+    """
+
+    def authenticate_credentials(self, key):
+        user = get_cached_user(key)
+        if user is not None:
+            if not user.is_active:
+                raise exceptions.AuthenticationFailed(_('User inactive or deleted.'))
+            token = Token.from_db(DEFAULT_DB_ALIAS, ['key', 'user_id'], [key, user.id])
+            token.user = user
+            return user, token
+
+        try:
+            token = Token.objects.select_related('user__profile').get(key=key)
+        except Token.DoesNotExist:
+            raise exceptions.AuthenticationFailed(_('Invalid token.'))
+        if not token.user.is_active:
+            raise exceptions.AuthenticationFailed(_('User inactive or deleted.'))
+
+        cache_user(key, token.user)
+        return token.user, token
+
+
+class SignedTokenAuthentication(BaseAuthentication):
+    """
+    Authentication with 'Authorization: Bearer <signed token>' when SIGNED_TOKENS['ENABLED'] is set.
+
+    The user and profile are rebuilt from the token's claims without any lookup; request.auth
+    holds the claims. Other schemes are left to the opaque token authentication.
+    """
+
+    keyword = 'Bearer'
+
+    def authenticate(self, request):
+        auth = get_authorization_header(request).split()
+        if not auth or auth[0].lower() != self.keyword.lower().encode() or not signed_token_settings()['ENABLED']:
+            return None
+        if len(auth) != 2:
+            raise exceptions.AuthenticationFailed(_('Invalid token header.'))
+
+        try:
+            claims = read_token(auth[1].decode())
+            user = user_values(claims)
+        except (signing.BadSignature, UnicodeError, KeyError):
+            raise exceptions.AuthenticationFailed(_('Invalid token.'))
+        if is_expired(claims):
+            raise exceptions.AuthenticationFailed(_('Token expired.'))
+        if revocations.is_revoked(claims):
+            raise exceptions.AuthenticationFailed(_('Token revoked.'))
+        if not user['is_active']:
+            raise exceptions.AuthenticationFailed(_('User inactive or deleted.'))
+
+        profile = {'id': claims['pid'], 'user_id': claims['uid'], 'type': claims['typ']} if claims['pid'] else None
+        return restore_user(user, profile), claims
+
+    def authenticate_header(self, request):
+        return self.keyword
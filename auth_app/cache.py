@@ -0,0 +1,117 @@
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.contrib.auth.models import User
+
+from core import metrics
+from profiles_app.models import Profile
+
+
+# The password hash is deferred, so it is neither cached nor overwritten by saving a cached user.
+USER_FIELDS = [field.attname for field in User._meta.concrete_fields if field.attname != 'password']
+# Permissions only need the profile's id and type, other profile fields load lazily when used.
+PROFILE_FIELDS = ['id', 'user_id', 'type']
+
+
+def token_cache_settings():
+    return settings.AUTH_TOKEN_CACHE
+
+
+class LocalTokenCache:
+    """Bounded in-process LRU of token key -> cached user fields, entries expire after LOCAL_TTL seconds"""
+
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            values, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return values
+
+    def set(self, key, values):
+        options = token_cache_settings()
+        with self._lock:
+            self._entries[key] = (values, time.monotonic() + options['LOCAL_TTL'])
+            self._entries.move_to_end(key)
+            while len(self._entries) > options['MAX_ENTRIES']:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+local_tokens = LocalTokenCache()
+
+
+def token_cache_key(key):
+    """Shared cache key derived from a digest, so raw tokens never end up in the cache backend"""
+
+    return 'auth:token:' + hashlib.sha256(key.encode()).hexdigest()
+
+
+def get_cached_user(key):
+    """User of a token with its profile attached, from the local LRU or the shared cache, or None"""
+
+    values = local_tokens.get(key)
+    if values is None:
+        values = cache.get(token_cache_key(key))
+        if values is not None:
+            local_tokens.set(key, values)
+    metrics.increment('auth_cache.hit' if values is not None else 'auth_cache.miss')
+    if values is None:
+        return None
+
+    return restore_user(values['user'], values['profile'])
+
+
+def restore_user(user_values, profile_values):
+    """Rebuild a user and its profile from known field values without a query, missing fields are deferred"""
+
+    user = restore_instance(User, user_values)
+    profile = None
+    if profile_values is not None:
+        profile = restore_instance(Profile, profile_values)
+        Profile.user.field.set_cached_value(profile, user)
+    User.profile.related.set_cached_value(user, profile)
+    return user
+
+
+def restore_instance(model, values):
+    names = [field.attname for field in model._meta.concrete_fields if field.attname in values]
+    return model.from_db(DEFAULT_DB_ALIAS, names, [values[name] for name in names])
+
+
+def cache_user(key, user):
+    """Remember a user loaded together with its profile (or the lack of one)"""
+
+    profile = getattr(user, 'profile', None)
+    values = {
+        'user': {name: getattr(user, name) for name in USER_FIELDS},
+        'profile': {name: getattr(profile, name) for name in PROFILE_FIELDS} if profile is not None else None,
+    }
+    cache.set(token_cache_key(key), values, token_cache_settings()['SHARED_TTL'])
+    local_tokens.set(key, values)
+
+
+def invalidate_token(key):
+    local_tokens.delete(key)
+    cache.delete(token_cache_key(key))
+    metrics.increment('auth_cache.invalidation')
@@ -0,0 +1,72 @@
+"""
+Bounded thread pool for password hashing.
+
+PBKDF2 releases the GIL inside hashlib, so a few threads hash in parallel while the
+event loop keeps serving other requests. At most PASSWORD_HASHING['MAX_PENDING'] jobs
+may run or wait; further requests are rejected instead of queueing without bound.
+Jobs may use the database (authenticate() looks the user up and may upgrade the stored
+hash), so each job closes its thread's connection when it finishes.
+"""
+
+import time
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import connection
+
+from core import metrics
+
+
+_executor = None
+_pending = 0
+_lock = threading.Lock()
+
+
+class HashingPoolFull(Exception):
+    """Raised when MAX_PENDING hashing jobs are already running or queued"""
+
+
+def hashing_settings():
+    return settings.PASSWORD_HASHING
+
+
+def get_executor():
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=hashing_settings()['WORKERS'], thread_name_prefix='password-hashing')
+    return _executor
+
+
+def release(future):
+    global _pending
+    with _lock:
+        _pending -= 1
+    metrics.increment('password_hashing.completed')
+
+
+async def run_hashing(func, *args, **kwargs):
+    """Run a hashing function on the pool, counted as password_hashing.submitted / rejected / completed"""
+
+    global _pending
+    with _lock:
+        if _pending >= hashing_settings()['MAX_PENDING']:
+            metrics.increment('password_hashing.rejected')
+            raise HashingPoolFull
+        _pending += 1
+    metrics.increment('password_hashing.submitted')
+
+    submitted_at = time.monotonic()
+
+    def job():
+        metrics.increment('password_hashing.queue_ms', round((time.monotonic() - submitted_at) * 1000))
+        try:
+            return func(*args, **kwargs)
+        finally:
+            connection.close()
+
+    future = get_executor().submit(job)
+    future.add_done_callback(release)
+    return await asyncio.wrap_future(future)
@@ -0,0 +1,45 @@
+from django.dispatch import receiver
+from django.contrib.auth.models import User
+from django.db.models.signals import post_save, post_delete
+
+from rest_framework.authtoken.models import Token
+
+from auth_app.cache import invalidate_token
+from auth_app.signed_tokens import revocations
+from profiles_app.models import Profile
+
+
+@receiver(post_delete, sender=Token)
+def invalidate_deleted_token(sender, instance, **kwargs):
+    invalidate_token(instance.key)
+
+
+@receiver(post_save, sender=User)
+def invalidate_tokens_of_user(sender, instance, created, update_fields=None, **kwargs):
+    """Deactivation and other changes must not be served from the token cache, deactivation also revokes signed tokens"""
+
+    if created or update_fields == frozenset(['last_login']):
+        return
+    invalidate_tokens(instance.id)
+    if not instance.is_active:
+        revocations.revoke_user(instance.id)
+
+
+@receiver(post_save, sender=Profile)
+@receiver(post_delete, sender=Profile)
+def invalidate_tokens_of_profile(sender, instance, **kwargs):
+    """The profile is cached together with its user"""
+
+    invalidate_tokens(instance.user_id)
+
+
+def invalidate_tokens(user_id):
+    for key in Token.objects.filter(user_id=user_id).values_list('key', flat=True):
+        invalidate_token(key)
+
+
+@receiver(post_delete, sender=User)
+def revoke_signed_tokens_of_deleted_user(sender, instance, **kwargs):
+    """Signed tokens of a deleted user would otherwise still authenticate until they expire"""
+
+    revocations.revoke_user(instance.id)
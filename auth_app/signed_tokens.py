@@ -0,0 +1,99 @@
+"""
+Stateless access tokens signed with HMAC-SHA256 (django.core.signing and SECRET_KEY).
+
+A token carries the user id, the user fields that permissions and serializers read
+(USER_CLAIMS), profile id, profile type, issue and expiry time, so it is verified and the
+user rebuilt in CPU without a database or cache lookup. Revocations (logout, refresh,
+deactivation) are kept in the memory of each worker process until the revoked tokens
+expire anyway, which is why SIGNED_TOKENS['LIFETIME_SECONDS'] should stay short.
+"""
+
+import time
+import uuid
+import threading
+
+from django.conf import settings
+from django.core import signing
+
+
+SALT = 'auth_app.signed_tokens'
+# User fields restored from the claims; any other field is loaded lazily on first access.
+USER_CLAIMS = ['username', 'is_active', 'is_staff', 'is_superuser']
+
+
+def signed_token_settings():
+    return settings.SIGNED_TOKENS
+
+
+class RevocationList:
+    """Revoked token ids until their expiry and users whose tokens issued up to a moment are revoked"""
+
+    def __init__(self):
+        self._tokens = {}
+        self._users = {}
+        self._lock = threading.Lock()
+
+    def revoke(self, claims):
+        with self._lock:
+            self._purge(time.time())
+            self._tokens[claims['jti']] = claims['exp']
+
+    def revoke_user(self, user_id):
+        with self._lock:
+            self._purge(time.time())
+            self._users[user_id] = time.time()
+
+    def is_revoked(self, claims):
+        with self._lock:
+            return claims['jti'] in self._tokens or claims['iat'] <= self._users.get(claims['uid'], -1)
+
+    def clear(self):
+        with self._lock:
+            self._tokens.clear()
+            self._users.clear()
+
+    def _purge(self, now):
+        """Forget revocations of tokens that have expired on their own"""
+
+        for jti in [jti for jti, expires_at in self._tokens.items() if expires_at <= now]:
+            del self._tokens[jti]
+        lifetime = signed_token_settings()['LIFETIME_SECONDS']
+        for user_id in [user_id for user_id, revoked_at in self._users.items() if revoked_at + lifetime < now]:
+            del self._users[user_id]
+
+
+revocations = RevocationList()
+
+
+def issue_token(user):
+    """Signed token for the user and its profile, returns {'access_token', 'expires_in'}"""
+
+    lifetime = signed_token_settings()['LIFETIME_SECONDS']
+    profile = getattr(user, 'profile', None)
+    issued_at = int(time.time())
+    claims = {
+        'uid': user.id,
+        **{name: getattr(user, name) for name in USER_CLAIMS},
+        'pid': profile.id if profile is not None else None,
+        'typ': profile.type if profile is not None else None,
+        'iat': issued_at,
+        'exp': issued_at + lifetime,
+        'jti': uuid.uuid4().hex,
+    }
+    return {'access_token': signing.dumps(claims, salt=SALT), 'expires_in': lifetime}
+
+
+def read_token(token):
+    """Claims of a token with a valid signature, raises signing.BadSignature otherwise"""
+
+    return signing.loads(token, salt=SALT)
+
+
+def is_expired(claims):
+    return claims['exp'] <= time.time()
+
+
+def user_values(claims):
+    """Field values of the token's user, raises KeyError for tokens without the expected claims"""
+
+    return {'id': claims['uid'], **{name: claims[name] for name in USER_CLAIMS}}
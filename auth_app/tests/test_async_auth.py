@@ -0,0 +1,131 @@
+from django.urls import reverse
+from django.test import override_settings
+from django.contrib.auth.models import User
+from django.contrib.auth.signals import user_login_failed
+
+from rest_framework import status
+from rest_framework.test import APITransactionTestCase
+from rest_framework.authtoken.models import Token
+
+from core import metrics
+from profiles_app.models import Profile
+
+
+class AsyncAuthTests(APITransactionTestCase):
+    """
+    Test suite for the async login and registration endpoints.
+
+    authenticate() queries the database from a hashing pool thread, which only sees committed rows.
+    """
+
+    def setUp(self):
+        """Creates a test user for login tests."""
+
+        metrics.reset()
+        self.test_user = User.objects.create_user(username="testuser", email="testuser@example.com", password="testpassword")
+
+    def test_async_login(self):
+        """Tests login with valid credentials returns the same token as the DRF endpoint."""
+
+        response = self.client.post(reverse('login-async'), {"username": "testuser", "password": "testpassword"}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['token'], Token.objects.get(user=self.test_user).key)
+        self.assertEqual(response.json()['user_id'], self.test_user.id)
+        self.assertEqual(metrics.snapshot()['counters']['password_hashing.completed'], 1)
+
+    def test_async_login_invalid_credentials(self):
+        """Tests wrong passwords, unknown users and missing fields return 400."""
+
+        for data in [
+            {"username": "testuser", "password": "wrongpassword"},
+            {"username": "nobody", "password": "testpassword"},
+            {"username": "testuser"},
+        ]:
+            response = self.client.post(reverse('login-async'), data, format='json')
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn('error', response.json())
+        self.assertEqual(metrics.snapshot()['counters']['password_hashing.submitted'], 2)
+
+    def test_async_login_inactive_user(self):
+        """Tests inactive users cannot log in."""
+
+        self.test_user.is_active = False
+        self.test_user.save()
+
+        response = self.client.post(reverse('login-async'), {"username": "testuser", "password": "testpassword"}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_async_login_failure_signal(self):
+        """Tests failed logins go through authenticate() and send user_login_failed."""
+
+        failures = []
+        def receiver(sender, credentials, **kwargs):
+            failures.append(credentials['username'])
+        user_login_failed.connect(receiver)
+        self.addCleanup(user_login_failed.disconnect, receiver)
+
+        self.client.post(reverse('login-async'), {"username": "testuser", "password": "wrongpassword"}, format='json')
+
+        self.assertEqual(failures, ['testuser'])
+
+    @override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher', 'django.contrib.auth.hashers.PBKDF2PasswordHasher'])
+    def test_async_login_rehashes_password(self):
+        """Tests a changed preferred hasher upgrades the stored hash on login."""
+
+        response = self.client.post(reverse('login-async'), {"username": "testuser", "password": "testpassword"}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.test_user.refresh_from_db()
+        self.assertTrue(self.test_user.password.startswith('md5$'))
+
+    def test_async_login_malformed_json(self):
+        """Tests malformed bodies return DRF's parse error."""
+
+        response = self.client.post(reverse('login-async'), '{"username":', content_type='application/json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('JSON parse error', response.json()['detail'])
+
+    def test_async_registration(self):
+        """Tests registration creates a usable password, token and profile."""
+
+        response = self.client.post(reverse('registration-async'), {
+            "username": "John_Doe",
+            "email": "john.doe@EXAMPLE.com",
+            "password": "password123",
+            "repeated_password": "password123",
+            "type": "business"
+        }, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        user = User.objects.get(username="John_Doe")
+        self.assertEqual(user.email, "john.doe@example.com")
+        self.assertTrue(user.check_password("password123"))
+        self.assertEqual(response.json()['token'], user.auth_token.key)
+        self.assertEqual(Profile.objects.get(user=user).type, 'business')
+
+    def test_async_registration_invalid(self):
+        """Tests mismatching passwords return the serializer errors without hashing."""
+
+        response = self.client.post(reverse('registration-async'), {
+            "username": "John_Doe",
+            "email": "john.doe@example.com",
+            "password": "password123",
+            "repeated_password": "other",
+        }, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('password', response.json())
+        self.assertNotIn('password_hashing.submitted', metrics.snapshot()['counters'])
+
+    @override_settings(PASSWORD_HASHING={'WORKERS': 1, 'MAX_PENDING': 0})
+    def test_full_pool_returns_503(self):
+        """Tests requests are rejected instead of queued once the pool is full."""
+
+        response = self.client.post(reverse('login-async'), {"username": "testuser", "password": "testpassword"}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(response['Retry-After'], '1')
+        self.assertEqual(metrics.snapshot()['counters']['password_hashing.rejected'], 1)
@@ -0,0 +1,88 @@
+from django.db import connection
+from django.urls import reverse
+from django.core.cache import cache
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth.models import User
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework.authtoken.models import Token
+
+from auth_app.cache import local_tokens
+from profiles_app.models import Profile
+from offers_app.models import Offer, OfferDetail
+
+
+class ProfileAuthenticationTests(APITestCase):
+    """Test suite for loading the profile together with the authenticated user."""
+
+    def setUp(self):
+        """Creates a customer and a business with tokens and an offer to order."""
+
+        cache.clear()
+        local_tokens.clear()
+        self.customer_user = User.objects.create_user(username="customer1", email="customer@example.com", password="password123")
+        self.customer_profile = Profile.objects.create(user=self.customer_user, type='customer')
+        self.customer_token = Token.objects.create(user=self.customer_user)
+
+        self.business_user = User.objects.create_user(username="business1", email="business1@example.com", password="password123")
+        self.business_profile = Profile.objects.create(user=self.business_user, type='business')
+
+        offer = Offer.objects.create(creator=self.business_profile, title="Website Design", description="Design")
+        self.offer_detail = OfferDetail.objects.create(
+            offer=offer, title="Basic Package", revisions=3, delivery_time_in_days=5, price=150.00,
+            features=["Logo Design"], offer_type="basic"
+        )
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.customer_token.key)
+
+    def auth_queries(self, context):
+        """Queries reading the token, user or profile tables directly"""
+
+        tables = ['FROM "authtoken_token"', 'FROM "auth_user"', 'FROM "profiles_app_profile"']
+        return [query['sql'] for query in context.captured_queries if any(table in query['sql'] for table in tables)]
+
+    def create_order(self):
+        return self.client.post(reverse('orders-list-create'), {'offer_detail_id': self.offer_detail.id}, format='json')
+
+    def test_user_and_profile_loaded_in_one_query(self):
+        """Tests that a cold request authenticates and filters by the profile with one query."""
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(reverse('orders-list-create'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        queries = self.auth_queries(context)
+        self.assertEqual(len(queries), 1)
+        self.assertIn('"profiles_app_profile"', queries[0])
+
+    def test_cached_requests_need_no_auth_queries(self):
+        """Tests that warm requests reuse the cached user and profile."""
+
+        self.client.get(reverse('orders-list-create'))
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(reverse('orders-list-create'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.auth_queries(context), [])
+
+    def test_profile_change_invalidates_cache(self):
+        """Tests that a changed profile type applies to the next request."""
+
+        self.create_order()
+        self.customer_profile.type = 'business'
+        self.customer_profile.save()
+
+        response = self.create_order()
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_user_without_profile(self):
+        """Tests that users without a profile are denied instead of failing."""
+
+        user = User.objects.create_user(username="staff", email="staff@example.com", password="password123")
+        token = Token.objects.create(user=user)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + token.key)
+
+        for _ in range(2):
+            response = self.create_order()
+            self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -0,0 +1,149 @@
+from django.db import connection
+from django.urls import reverse
+from django.core.cache import cache
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth.models import User
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from auth_app.cache import local_tokens
+from auth_app.signed_tokens import revocations
+from profiles_app.models import Profile
+
+
+SIGNED_TOKENS = {'ENABLED': True, 'LIFETIME_SECONDS': 900}
+
+
+@override_settings(SIGNED_TOKENS=SIGNED_TOKENS)
+class SignedTokenTests(APITestCase):
+    """Test suite for the optional stateless signed access tokens."""
+
+    def setUp(self):
+        """Creates a customer and logs in to obtain both token kinds."""
+
+        cache.clear()
+        local_tokens.clear()
+        revocations.clear()
+        self.user = User.objects.create_user(username="testuser", email="testuser@example.com", password="testpassword")
+        self.profile = Profile.objects.create(user=self.user, type='customer')
+        self.login = self.client.post(reverse('login'), {"username": "testuser", "password": "testpassword"}, format='json').data
+        self.url = reverse('orders-list-create')
+
+    def bearer(self, token):
+        self.client.credentials(HTTP_AUTHORIZATION='Bearer ' + token)
+
+    def test_login_and_registration_issue_signed_tokens(self):
+        """Tests that both endpoints return an access token next to the opaque token."""
+
+        self.assertIn('token', self.login)
+        self.assertEqual(self.login['expires_in'], 900)
+
+        response = self.client.post(reverse('registration'), {
+            "username": "newuser", "email": "new@example.com", "password": "pw123456",
+            "repeated_password": "pw123456", "type": "business"
+        }, format='json')
+        self.assertIn('access_token', response.data)
+
+    def test_signed_token_needs_no_lookup(self):
+        """Tests that a signed token authenticates without reading tokens, users or profiles."""
+
+        self.bearer(self.login['access_token'])
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        tables = ['"authtoken_token"', 'FROM "auth_user"', 'FROM "profiles_app_profile"']
+        self.assertEqual([query for query in context.captured_queries if any(table in query['sql'] for table in tables)], [])
+
+    def test_opaque_token_still_works(self):
+        """Tests that both token kinds are accepted side by side."""
+
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.login['token'])
+
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_200_OK)
+
+    def test_invalid_and_expired_tokens_are_rejected(self):
+        """Tests that tampered and expired tokens return 401."""
+
+        self.bearer(self.login['access_token'][:-2] + 'xx')
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_401_UNAUTHORIZED)
+
+        with self.settings(SIGNED_TOKENS={**SIGNED_TOKENS, 'LIFETIME_SECONDS': 0}):
+            self.client.credentials()
+            token = self.client.post(reverse('login'), {"username": "testuser", "password": "testpassword"}, format='json').data['access_token']
+        self.bearer(token)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(response.data['detail'], 'Token expired.')
+
+    def test_logout_revokes_signed_token(self):
+        """Tests that logging out with a signed token revokes only that token."""
+
+        self.bearer(self.login['access_token'])
+        self.assertEqual(self.client.post(reverse('logout')).status_code, status.HTTP_200_OK)
+
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_401_UNAUTHORIZED)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.login['token'])
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_200_OK)
+
+    def test_refresh_replaces_token(self):
+        """Tests that refreshing issues a new token with the current profile and revokes the old one."""
+
+        self.profile.type = 'business'
+        self.profile.save()
+        self.bearer(self.login['access_token'])
+        response = self.client.post(reverse('token-refresh'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_401_UNAUTHORIZED)
+
+        self.bearer(response.data['access_token'])
+        self.assertEqual(self.client.get(reverse('orders-upcoming')).status_code, status.HTTP_200_OK)
+
+    def test_staff_checks_need_no_lookup(self):
+        """Tests that is_staff and username come from the claims instead of lazy user queries."""
+
+        self.user.is_staff = True
+        self.user.save()
+        self.client.credentials()
+        token = self.client.post(reverse('login'), {"username": "testuser", "password": "testpassword"}, format='json').data['access_token']
+        self.bearer(token)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse('metrics'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.bearer(self.login['access_token'])
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse('metrics'))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_deleted_user_is_rejected(self):
+        """Tests that tokens of a deleted user return 401 instead of failing on a lazy load."""
+
+        self.user.delete()
+        self.bearer(self.login['access_token'])
+
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_deactivation_revokes_signed_tokens(self):
+        """Tests that tokens issued before a deactivation are rejected."""
+
+        self.user.is_active = False
+        self.user.save()
+        self.bearer(self.login['access_token'])
+
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_401_UNAUTHORIZED)
+
+    @override_settings(SIGNED_TOKENS={**SIGNED_TOKENS, 'ENABLED': False})
+    def test_disabled_mode(self):
+        """Tests that nothing is issued or accepted while signed tokens are disabled."""
+
+        response = self.client.post(reverse('login'), {"username": "testuser", "password": "testpassword"}, format='json')
+        self.assertNotIn('access_token', response.data)
+
+        self.bearer(self.login['access_token'])
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(self.client.post(reverse('token-refresh')).status_code, status.HTTP_401_UNAUTHORIZED)
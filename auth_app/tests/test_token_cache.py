@@ -0,0 +1,103 @@
+from django.db import connection
+from django.urls import reverse
+from django.core.cache import cache
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth.models import User
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework.authtoken.models import Token
+
+from core import metrics
+from auth_app.cache import LocalTokenCache, local_tokens, token_cache_key
+from profiles_app.models import Profile
+
+
+class TokenCacheTests(APITestCase):
+    """Test suite for the cached token authentication."""
+
+    def setUp(self):
+        """Creates a user with a token and clears both cache layers."""
+
+        cache.clear()
+        local_tokens.clear()
+        metrics.reset()
+        self.user = User.objects.create_user(username="testuser", email="testuser@example.com", password="testpassword")
+        self.profile = Profile.objects.create(user=self.user, type='customer')
+        self.token = Token.objects.create(user=self.user)
+        self.url = reverse('profile-detail', kwargs={'pk': self.profile.id})
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.token.key)
+
+    def token_queries(self, context):
+        return [query for query in context.captured_queries if 'authtoken_token' in query['sql']]
+
+    def test_repeated_requests_skip_token_lookup(self):
+        """Tests that only the first request reads the token table."""
+
+        with CaptureQueriesContext(connection) as first:
+            self.client.get(self.url)
+        with CaptureQueriesContext(connection) as second:
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(self.token_queries(first)), 1)
+        self.assertEqual(self.token_queries(second), [])
+        self.assertEqual(metrics.snapshot()['hit_rates']['auth_cache'], 0.5)
+
+    def test_shared_cache_serves_other_processes(self):
+        """Tests that an empty local cache falls back to the shared cache without the password hash."""
+
+        self.client.get(self.url)
+        local_tokens.clear()
+
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(self.url)
+
+        self.assertEqual(self.token_queries(context), [])
+        self.assertNotIn('password', cache.get(token_cache_key(self.token.key)))
+
+    def test_logout_invalidates_token(self):
+        """Tests that a logged-out token is rejected right away."""
+
+        self.client.get(self.url)
+        self.client.post(reverse('logout'))
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertIsNone(cache.get(token_cache_key(self.token.key)))
+
+    def test_deactivated_user_is_rejected(self):
+        """Tests that deactivating a user drops the cached token."""
+
+        self.client.get(self.url)
+        self.user.is_active = False
+        self.user.save()
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    @override_settings(AUTH_TOKEN_CACHE={'MAX_ENTRIES': 2, 'LOCAL_TTL': 60, 'SHARED_TTL': 60})
+    def test_local_cache_is_bounded_lru(self):
+        """Tests that the least recently used entry is evicted first."""
+
+        lru = LocalTokenCache()
+        lru.set('a', {'id': 1})
+        lru.set('b', {'id': 2})
+        lru.get('a')
+        lru.set('c', {'id': 3})
+
+        self.assertIsNone(lru.get('b'))
+        self.assertEqual(lru.get('a'), {'id': 1})
+        self.assertEqual(lru.get('c'), {'id': 3})
+
+    @override_settings(AUTH_TOKEN_CACHE={'MAX_ENTRIES': 2, 'LOCAL_TTL': 0, 'SHARED_TTL': 60})
+    def test_local_entries_expire(self):
+        """Tests that local entries are not used after LOCAL_TTL."""
+
+        lru = LocalTokenCache()
+        lru.set('a', {'id': 1})
+
+        self.assertIsNone(lru.get('a'))
@@ -1,7 +1,8 @@
 from django.urls import path
-from .views import BaseInfoView
+from .views import BaseInfoView, MetricsView
 
 
 urlpatterns = [
     path('base-info/', BaseInfoView.as_view(), name='base-info'),
+    path('metrics/', MetricsView.as_view(), name='metrics'),
 ]
@@ -1,12 +1,13 @@
-from django.db.models import Avg
+from django.db.models import Sum
 
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from rest_framework.permissions import AllowAny
+from rest_framework.permissions import AllowAny, IsAdminUser
 
+from core import metrics
 from offers_app.models import Offer
-from reviews_app.models import Reviews
+from reviews_app.models import BusinessRatingStats
 from profiles_app.models import Profile
 from .serializers import BaseInfoSerializer
 
@@ -18,10 +19,9 @@ class BaseInfoView(APIView):
     serializer_class = BaseInfoSerializer
     
     def get(self, request):
-        review_count = Reviews.objects.count()
-        
-        avg_rating = Reviews.objects.aggregate(Avg('rating'))['rating__avg']
-        average_rating = round(float(avg_rating), 1) if avg_rating else 0.0
+        totals = BusinessRatingStats.objects.aggregate(review_count=Sum('review_count'), rating_sum=Sum('rating_sum'))
+        review_count = totals['review_count'] or 0
+        average_rating = round(totals['rating_sum'] / review_count, 1) if review_count else 0.0
         
         business_profile_count = Profile.objects.filter(type='business').count()
         
@@ -36,3 +36,12 @@ class BaseInfoView(APIView):
         
         serializer = self.serializer_class(data)
         return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+class MetricsView(APIView):
+    """API view for the cache and worker pool counters of the serving process, staff only"""
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response(metrics.snapshot(), status=status.HTTP_200_OK)
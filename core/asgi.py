@@ -2,6 +2,9 @@
 ASGI config for core project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+Serve the project through it (e.g. ``uvicorn core.asgi:application``) so that
+streaming endpoints like ``/api/orders/events/`` run as coroutines instead of
+holding a worker thread per open connection.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/6.0/howto/deployment/asgi/
@@ -0,0 +1,38 @@
+"""
+In-process counters for cache and worker pool efficiency.
+
+Counters live in the memory of each worker process and start at zero on restart,
+so read ``/api/metrics/`` per worker or ship the values to a metrics system.
+"""
+
+import threading
+from collections import Counter
+
+
+_lock = threading.Lock()
+_counters = Counter()
+
+
+def increment(name, amount=1):
+    with _lock:
+        _counters[name] += amount
+
+
+def snapshot():
+    """Copy of all counters plus a hit rate for every counter pair named <prefix>.hit / <prefix>.miss"""
+
+    with _lock:
+        counters = dict(_counters)
+
+    hit_rates = {}
+    for name, hits in counters.items():
+        if name.endswith('.hit'):
+            prefix = name[:-len('.hit')]
+            lookups = hits + counters.get(f'{prefix}.miss', 0)
+            hit_rates[prefix] = round(hits / lookups, 4) if lookups else None
+    return {'counters': counters, 'hit_rates': hit_rates}
+
+
+def reset():
+    with _lock:
+        _counters.clear()
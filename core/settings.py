@@ -52,6 +52,7 @@ INSTALLED_APPS = [
     'orders_app',
     'reviews_app',
     'base_info_app',
+    'media_app',
 ]
 
 MIDDLEWARE = [
@@ -107,6 +108,16 @@ DATABASES = {
 }
 
 
+# Cache for computed API payloads. Switch to a shared backend (e.g. Redis) when running several workers.
+# https://docs.djangoproject.com/en/6.0/topics/cache/
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
 
@@ -143,14 +154,97 @@ USE_TZ = True
 
 STATIC_URL = 'static/'
 
+# Uploaded media is content-addressed: each distinct file is stored once under its SHA-256 digest.
+# Clean up unreferenced blobs with `python manage.py prune_blobs`.
+STORAGES = {
+    'default': {
+        'BACKEND': 'media_app.storage.ContentAddressedStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage',
+    },
+}
+
+# Media serving (media_app.views.MediaFileView). Set ACCEL_HEADER to 'X-Accel-Redirect' (nginx, files
+# exposed under the internal location ACCEL_PREFIX) or 'X-Sendfile' (Apache/lighttpd, absolute paths) to
+# let the proxy transfer the file. MAX_AGE applies to files outside the immutable blob store.
+MEDIA_SERVING = {
+    'ACCEL_HEADER': None,
+    'ACCEL_PREFIX': '/protected-media/',
+    'MAX_AGE': 3600,
+}
+
+# Resumable uploads (/api/uploads/). Offer images may be up to MAX_BYTES, profile pictures keep
+# PROFILE_AVATARS['MAX_UPLOAD_BYTES']. A user may hold MAX_OPEN_SESSIONS open sessions; sessions
+# without a chunk for EXPIRE_HOURS are expired and deleted by `manage.py expire_uploads`.
+MEDIA_UPLOADS = {
+    'MAX_BYTES': 20 * 1024 * 1024,
+    'MAX_CHUNK_BYTES': 5 * 1024 * 1024,
+    'EXPIRE_HOURS': 24,
+    'MAX_OPEN_SESSIONS': 5,
+}
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/6.0/ref/settings/#default-auto-field
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.TokenAuthentication',
+        'auth_app.authentication.CachedTokenAuthentication',
+        'auth_app.authentication.SignedTokenAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
-}
\ No newline at end of file
+}
+
+# Token -> user lookups of CachedTokenAuthentication: a local LRU of MAX_ENTRIES per process, trusted for
+# LOCAL_TTL seconds (the longest another process may serve a logged-out token), in front of the shared cache.
+AUTH_TOKEN_CACHE = {
+    'MAX_ENTRIES': 10000,
+    'LOCAL_TTL': 5,
+    'SHARED_TTL': 300,
+}
+
+# Optional stateless access tokens: with ENABLED, login and registration also return a short-lived
+# HMAC-signed 'access_token' for 'Authorization: Bearer ...', renewed at /api/token/refresh/.
+SIGNED_TOKENS = {
+    'ENABLED': False,
+    'LIFETIME_SECONDS': 15 * 60,
+}
+
+# Password hashing of the async login/registration endpoints runs on a pool of WORKERS threads; with
+# MAX_PENDING jobs running or queued, further requests get 503 instead of waiting.
+PASSWORD_HASHING = {
+    'WORKERS': 4,
+    'MAX_PENDING': 64,
+}
+
+# Order change feed (/api/orders/changes/): rows are only returned once they are this old, so writes
+# whose transaction commits after their updated_at timestamp are not skipped by a cursor already past it.
+ORDER_CHANGES = {
+    'SAFETY_LAG_SECONDS': 5,
+}
+
+# Order event stream (Server-Sent Events at /api/orders/events/, served by core.asgi).
+# Use 'orders_app.events.RedisEventBackend' with OPTIONS {'url': ...} to share events between workers.
+# Browsers open the stream with a single-use ticket from /api/orders/events/ticket/ that expires after
+# TICKET_SECONDS; tickets live in the default cache, which must be shared between workers.
+ORDER_EVENTS = {
+    'BACKEND': 'orders_app.events.InMemoryEventBackend',
+    'OPTIONS': {},
+    'KEEPALIVE_SECONDS': 15,
+    'TICKET_SECONDS': 30,
+}
+
+# Profile picture processing. Uploads are resized into square variants per size in FORMAT and
+# FALLBACK_FORMAT on a background thread pool after the upload commits; set ASYNC to False to
+# process inline (e.g. in tests).
+PROFILE_AVATARS = {
+    'SIZES': [64, 128, 256],
+    'LIST_SIZE': 64,
+    'FORMAT': 'WEBP',
+    'FALLBACK_FORMAT': 'JPEG',
+    'MAX_UPLOAD_BYTES': 5 * 1024 * 1024,
+    'WORKERS': 2,
+    'ASYNC': True,
+}
@@ -0,0 +1,44 @@
+"""
+Streaming response bodies under WSGI and ASGI.
+
+Under ASGI Django reads a synchronous StreamingHttpResponse iterator with sync_to_async(list),
+so the whole body is built in memory before the first byte is sent. ASGI requests therefore
+get an async iterator that pulls the synchronous one a chunk at a time in a worker thread.
+"""
+
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+
+
+def is_asgi(request):
+    """Whether the (Django or DRF) request is served by the ASGI handler"""
+
+    return isinstance(getattr(request, '_request', request), ASGIRequest)
+
+
+async def iterate_in_chunks(iterator, chunk_size, thread_sensitive=True):
+    """
+    Async iterator over a synchronous one, taking chunk_size items per thread hop.
+
+    Iterators that use the database must stay thread sensitive; plain file reads may
+    run on any thread.
+    """
+
+    next_chunk = sync_to_async(lambda: list(islice(iterator, chunk_size)), thread_sensitive=thread_sensitive)
+    try:
+        while chunk := await next_chunk():
+            for item in chunk:
+                yield item
+    finally:
+        if hasattr(iterator, 'close'):
+            await sync_to_async(iterator.close, thread_sensitive=thread_sensitive)()
+
+
+def streaming_content(request, iterator, chunk_size, thread_sensitive=True):
+    """The iterator itself under WSGI, a chunked async iterator over it under ASGI"""
+
+    if is_asgi(request):
+        return iterate_in_chunks(iterator, chunk_size, thread_sensitive)
+    return iterator
@@ -17,7 +17,8 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import path, include
 from django.conf import settings
-from django.conf.urls.static import static
+
+from media_app.views import MediaFileView
 
 urlpatterns = [
     path('admin/', admin.site.urls),
@@ -28,6 +29,6 @@ urlpatterns = [
     path('api/', include('orders_app.urls')),
     path('api/', include('reviews_app.urls')),
     path('api/', include('base_info_app.urls')),
+    path('api/', include('media_app.urls')),
+    path(settings.MEDIA_URL.lstrip('/') + '<path:path>', MediaFileView.as_view(), name='media'),
 ]
-
-urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
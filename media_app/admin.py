@@ -0,0 +1,32 @@
+from django.contrib import admin
+from .models import StoredBlob, UploadSession
+
+
+@admin.register(StoredBlob)
+class StoredBlobAdmin(admin.ModelAdmin):
+    """Read-only admin for the blobs of the content-addressed media storage"""
+    
+    list_display = ['name', 'size', 'ref_count', 'created_at', 'updated_at']
+    list_filter = ['created_at']
+    search_fields = ['name', 'digest']
+    
+    def has_add_permission(self, request):
+        return False
+    
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(UploadSession)
+class UploadSessionAdmin(admin.ModelAdmin):
+    """Read-only admin for resumable uploads in progress"""
+    
+    list_display = ['id', 'owner', 'target', 'object_id', 'filename', 'received', 'size', 'updated_at']
+    list_filter = ['target', 'updated_at']
+    search_fields = ['owner__username', 'filename']
+    
+    def has_add_permission(self, request):
+        return False
+    
+    def has_change_permission(self, request, obj=None):
+        return False
@@ -0,0 +1,50 @@
+import posixpath
+
+from rest_framework import serializers
+from django.core.validators import get_available_image_extensions
+
+from media_app.models import UploadSession
+from media_app.uploads import max_upload_bytes
+from offers_app.models import Offer
+
+
+class UploadSessionSerializer(serializers.ModelSerializer):
+    """Serializer for starting a resumable upload and reporting how many bytes have been received"""
+
+    object_id = serializers.IntegerField(required=False, allow_null=True)
+
+    class Meta:
+        model = UploadSession
+        fields = ['id', 'target', 'object_id', 'filename', 'size', 'received', 'created_at', 'updated_at']
+        read_only_fields = ['id', 'received', 'created_at', 'updated_at']
+
+    def validate_filename(self, value):
+        """Keep only the base name and require an image extension"""
+
+        value = posixpath.basename(value.replace('\\', '/'))
+        extension = posixpath.splitext(value)[1].lower().lstrip('.')
+        if extension not in get_available_image_extensions():
+            raise serializers.ValidationError("Upload an image file.")
+        return value
+
+    def validate_size(self, value):
+        if value < 1:
+            raise serializers.ValidationError("The file must not be empty.")
+        return value
+
+    def validate(self, attrs):
+        """Offer images need an offer of the current user, profile pictures always target the own profile"""
+
+        user = self.context['request'].user
+        if attrs['target'] == 'profile_file':
+            profile = getattr(user, 'profile', None)
+            if profile is None:
+                raise serializers.ValidationError({'target': "You have no profile."})
+            attrs['object_id'] = profile.id
+        elif not Offer.objects.filter(id=attrs.get('object_id'), creator__user_id=user.id).exists():
+            raise serializers.ValidationError({'object_id': "Offer not found or not yours."})
+
+        limit = max_upload_bytes(attrs['target'])
+        if attrs['size'] > limit:
+            raise serializers.ValidationError({'size': f"The file may not be larger than {limit // (1024 * 1024)} MB."})
+        return attrs
@@ -0,0 +1,9 @@
+from django.urls import path
+from .views import UploadSessionCreateView, UploadSessionView, UploadCompleteView
+
+
+urlpatterns = [
+    path('uploads/', UploadSessionCreateView.as_view(), name='upload-session-create'),
+    path('uploads/<uuid:pk>/', UploadSessionView.as_view(), name='upload-session'),
+    path('uploads/<uuid:pk>/complete/', UploadCompleteView.as_view(), name='upload-complete'),
+]
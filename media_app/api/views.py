@@ -0,0 +1,127 @@
+from django.db import transaction
+from django.contrib.auth.models import User
+from django.core.files.storage import default_storage
+
+from rest_framework import generics, status
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.exceptions import NotFound, PermissionDenied
+from rest_framework.permissions import IsAuthenticated
+
+from media_app.uploads import (
+    upload_settings, open_sessions, parse_content_range, write_chunk, is_valid_image, attach_upload,
+    remove_partial_file
+)
+from .serializers import UploadSessionSerializer
+
+
+def get_session(request, pk, lock=False):
+    """Open session of the current user, expired sessions are gone"""
+
+    sessions = open_sessions(request.user)
+    if lock:
+        sessions = sessions.select_for_update()
+    session = sessions.filter(pk=pk).first()
+    if session is None:
+        raise NotFound("Upload session not found.")
+    return session
+
+
+class UploadSessionCreateView(generics.CreateAPIView):
+    """
+    View to start a resumable upload of an offer image or profile picture.
+
+    A user may hold at most MEDIA_UPLOADS['MAX_OPEN_SESSIONS'] open sessions; the user row is
+    locked while counting so concurrent requests cannot both take the last one.
+    """
+
+    serializer_class = UploadSessionSerializer
+    permission_classes = [IsAuthenticated]
+
+    def perform_create(self, serializer):
+        with transaction.atomic():
+            User.objects.select_for_update().get(pk=self.request.user.pk)
+            if open_sessions(self.request.user).count() >= upload_settings()['MAX_OPEN_SESSIONS']:
+                raise PermissionDenied("You have too many open uploads. Complete or abort one first.")
+            serializer.save(owner=self.request.user)
+
+
+class UploadSessionView(APIView):
+    """
+    View to resume an upload: GET reports the received bytes, PUT appends one chunk and DELETE aborts.
+
+    A chunk is the raw request body with a 'Content-Range: bytes start-end/size' header and must
+    start at the received offset; it is written straight to the session's temporary file.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, pk):
+        return Response(UploadSessionSerializer(get_session(request, pk)).data)
+
+    def put(self, request, pk):
+        try:
+            start, end, total = parse_content_range(request.headers.get('Content-Range', ''))
+        except ValueError:
+            return Response({'detail': "A 'Content-Range: bytes start-end/size' header is required."}, status=status.HTTP_400_BAD_REQUEST)
+
+        length = end - start + 1
+        if length > upload_settings()['MAX_CHUNK_BYTES']:
+            return Response({'detail': "The chunk is too large."}, status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+
+        with transaction.atomic():
+            session = get_session(request, pk, lock=True)
+            if total != session.size:
+                return Response({'detail': "The size does not match the upload session."}, status=status.HTTP_400_BAD_REQUEST)
+            if start != session.received:
+                return Response(
+                    {'detail': "The chunk does not start at the received offset.", 'received': session.received},
+                    status=status.HTTP_409_CONFLICT
+                )
+
+            written = write_chunk(default_storage.path(session.temp_name), request.stream, start, length)
+            if written != length:
+                return Response(
+                    {'detail': "The chunk is incomplete.", 'received': session.received},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            session.received += written
+            session.save(update_fields=['received', 'updated_at'])
+
+        return Response(UploadSessionSerializer(session).data)
+
+    def delete(self, request, pk):
+        session = get_session(request, pk)
+        remove_partial_file(session)
+        session.delete()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class UploadCompleteView(APIView):
+    """View to finish an upload by attaching the assembled file to the offer image or profile picture."""
+
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, pk):
+        with transaction.atomic():
+            session = get_session(request, pk, lock=True)
+            if session.received != session.size:
+                return Response(
+                    {'detail': "The upload is not complete.", 'received': session.received},
+                    status=status.HTTP_409_CONFLICT
+                )
+            if not is_valid_image(default_storage.path(session.temp_name)):
+                remove_partial_file(session)
+                session.delete()
+                return Response({'detail': "Upload a valid image."}, status=status.HTTP_400_BAD_REQUEST)
+
+            instance = attach_upload(session)
+            session.delete()
+        remove_partial_file(session)
+
+        field_file = instance.image if session.target == 'offer_image' else instance.file
+        return Response({
+            'target': session.target,
+            'object_id': session.object_id,
+            'file': request.build_absolute_uri(field_file.url),
+        })
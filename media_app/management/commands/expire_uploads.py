@@ -0,0 +1,40 @@
+from django.db import transaction
+from django.core.management.base import BaseCommand, CommandError
+
+from media_app.models import UploadSession
+from media_app.uploads import expiry_cutoff, remove_partial_file
+
+
+class Command(BaseCommand):
+    """Delete upload sessions that have expired together with their partial files"""
+
+    help = (
+        "Delete upload sessions without a chunk for MEDIA_UPLOADS['EXPIRE_HOURS'] and the partial files "
+        "they allocated."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help="Number of sessions deleted per transaction.")
+        parser.add_argument('--dry-run', action='store_true', help="Only report what would be deleted.")
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError("--batch-size must be at least 1.")
+
+        expired = UploadSession.objects.filter(updated_at__lt=expiry_cutoff()).order_by('id')
+        if options['dry_run']:
+            self.stdout.write(self.style.SUCCESS(f"Would delete {expired.count()} expired upload sessions."))
+            return
+
+        deleted = 0
+        while True:
+            with transaction.atomic():
+                sessions = list(expired.select_for_update()[:options['batch_size']])
+                if not sessions:
+                    break
+                UploadSession.objects.filter(id__in=[session.id for session in sessions]).delete()
+            for session in sessions:
+                remove_partial_file(session)
+            deleted += len(sessions)
+
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} expired upload sessions."))
@@ -0,0 +1,97 @@
+import os
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils import timezone
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand, CommandError
+
+from media_app.models import StoredBlob, UploadSession
+from media_app.references import count_references
+from media_app.storage import ContentAddressedStorage
+from media_app.uploads import expiry_cutoff
+
+
+class Command(BaseCommand):
+    """Recount blob references from the database and delete blobs nobody references any more"""
+
+    help = (
+        "Recount the references of every stored blob from the file fields that use the content-addressed "
+        "storage and delete unreferenced blobs that have not been touched for --grace-hours."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--grace-hours', type=int, default=24, help="Keep unreferenced blobs touched more recently.")
+        parser.add_argument('--batch-size', type=int, default=500, help="Number of blobs deleted per transaction.")
+        parser.add_argument('--dry-run', action='store_true', help="Only report what would be deleted.")
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1 or options['grace_hours'] < 0:
+            raise CommandError("--batch-size must be at least 1 and --grace-hours must not be negative.")
+        if not isinstance(default_storage, ContentAddressedStorage):
+            raise CommandError("The default storage is not the content-addressed storage.")
+
+        started_at = timezone.now()
+        cutoff = started_at - timedelta(hours=options['grace_hours'])
+        references = count_references()
+
+        corrected = self.recount(references, started_at, options['dry_run'])
+        pruned = self.prune(cutoff, options['batch_size'], options['dry_run'])
+        stale_temp_files = self.remove_stale_temp_files(cutoff, options['dry_run'])
+
+        verb = "Would delete" if options['dry_run'] else "Deleted"
+        self.stdout.write(self.style.SUCCESS(
+            f"Corrected {corrected} reference counts. {verb} {pruned} blobs and {stale_temp_files} stale temporary files."
+        ))
+
+    def recount(self, references, started_at, dry_run):
+        """Store the recounted references, skipping blobs touched by uploads during the scan"""
+
+        corrected = 0
+        blobs = StoredBlob.objects.filter(updated_at__lt=started_at).values_list('name', 'ref_count')
+        for name, ref_count in blobs.iterator(chunk_size=2000):
+            if references[name] != ref_count:
+                corrected += 1
+                if not dry_run:
+                    StoredBlob.objects.filter(name=name, updated_at__lt=started_at).update(ref_count=references[name])
+        return corrected
+
+    def prune(self, cutoff, batch_size, dry_run):
+        candidates = StoredBlob.objects.filter(ref_count=0, updated_at__lt=cutoff).order_by('name')
+        if dry_run:
+            return candidates.count()
+
+        pruned = 0
+        while True:
+            with transaction.atomic():
+                names = list(candidates.select_for_update().values_list('name', flat=True)[:batch_size])
+                if not names:
+                    break
+                # Re-check under the lock: a blob acquired since it was selected keeps its file.
+                unreferenced = list(candidates.filter(name__in=names).values_list('name', flat=True))
+                StoredBlob.objects.filter(name__in=unreferenced, ref_count=0).delete()
+                for name in unreferenced:
+                    default_storage.delete_blob(name)
+            pruned += len(unreferenced)
+        return pruned
+
+    def remove_stale_temp_files(self, cutoff, dry_run):
+        """Temporary files of interrupted uploads, partial files of open upload sessions are kept"""
+
+        session_cutoff = expiry_cutoff()
+        open_sessions = UploadSession.objects.filter(updated_at__gte=session_cutoff).only('id')
+        kept = {os.path.basename(session.temp_name) for session in open_sessions}
+        if not dry_run:
+            UploadSession.objects.filter(updated_at__lt=session_cutoff).delete()
+
+        temp_dir = default_storage.path('tmp')
+        if not os.path.isdir(temp_dir):
+            return 0
+
+        removed = 0
+        for entry in os.scandir(temp_dir):
+            if entry.is_file() and entry.name not in kept and entry.stat().st_mtime < cutoff.timestamp():
+                removed += 1
+                if not dry_run:
+                    os.unlink(entry.path)
+        return removed
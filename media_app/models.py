@@ -0,0 +1,67 @@
+import uuid
+
+from django.db import models, IntegrityError, transaction
+from django.contrib.auth.models import User
+from django.db.models import F
+from django.utils import timezone
+
+
+class StoredBlob(models.Model):
+    """Model for one unique file of the content-addressed storage and the number of references to it."""
+
+    name = models.CharField(max_length=255, primary_key=True)
+    digest = models.CharField(max_length=64, db_index=True)
+    size = models.BigIntegerField()
+    ref_count = models.IntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.name} ({self.ref_count} references)"
+
+    @classmethod
+    def acquire(cls, name, digest, size):
+        """Count one more reference, registering the blob on its first upload; locks the row until commit"""
+
+        blob = cls.objects.filter(name=name)
+        if blob.update(ref_count=F('ref_count') + 1, updated_at=timezone.now()):
+            return
+        try:
+            with transaction.atomic():
+                cls.objects.create(name=name, digest=digest, size=size, ref_count=1)
+        except IntegrityError:
+            blob.update(ref_count=F('ref_count') + 1, updated_at=timezone.now())
+
+    @classmethod
+    def release(cls, name):
+        """Count one reference less, the file itself is only removed by prune_blobs"""
+
+        cls.objects.filter(name=name, ref_count__gt=0).update(ref_count=F('ref_count') - 1, updated_at=timezone.now())
+
+
+class UploadSession(models.Model):
+    """Model for a resumable upload whose chunks are appended to a temporary file until it is completed."""
+
+    TARGET_CHOICES = [
+        ('offer_image', 'Offer image'),
+        ('profile_file', 'Profile picture'),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    owner = models.ForeignKey(User, on_delete=models.CASCADE, related_name='upload_sessions')
+    target = models.CharField(max_length=20, choices=TARGET_CHOICES)
+    object_id = models.PositiveIntegerField()
+    filename = models.CharField(max_length=255)
+    size = models.BigIntegerField()
+    received = models.BigIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.filename} ({self.received}/{self.size} bytes)"
+
+    @property
+    def temp_name(self):
+        """Storage name of the partial file, kept with the storage's other temporary files"""
+
+        return f'tmp/upload-{self.id}.part'
@@ -0,0 +1,59 @@
+from collections import Counter
+
+from django.apps import apps
+from django.db import models
+from django.core.cache import cache
+
+from media_app.models import StoredBlob
+from media_app.storage import ContentAddressedStorage, is_blob_name
+
+
+def file_fields():
+    """(model, field) of every file field stored in the content-addressed storage"""
+
+    for model in apps.get_models():
+        for field in model._meta.concrete_fields:
+            if isinstance(field, models.FileField) and isinstance(field.storage, ContentAddressedStorage):
+                yield model, field
+
+
+REFERENCE_CACHE_TIMEOUT = 300
+
+
+def is_referenced(name):
+    """
+    Whether a record currently refers to the file.
+
+    Blobs are referenced while their StoredBlob counts a reference (which includes generated
+    variants), a primary key lookup. Other files were stored before the content-addressed
+    storage and are referenced while a file field holds their name; that needs a scan of the
+    unindexed file columns, so the answer is cached for REFERENCE_CACHE_TIMEOUT seconds.
+    New uploads are always blobs, so these files can only lose references.
+    """
+
+    if is_blob_name(name):
+        return StoredBlob.objects.filter(name=name, ref_count__gt=0).exists()
+    key = f'media:referenced:{name}'
+    referenced = cache.get(key)
+    if referenced is None:
+        referenced = any(model._base_manager.filter(**{field.attname: name}).exists() for model, field in file_fields())
+        cache.set(key, referenced, REFERENCE_CACHE_TIMEOUT)
+    return referenced
+
+
+def count_references():
+    """
+    Count how often every blob is referenced by the file fields stored in the content-addressed storage.
+
+    Models can report further storage names (e.g. generated variants kept in a JSON field)
+    through a ``referenced_files()`` classmethod.
+    """
+
+    references = Counter()
+    for model, field in file_fields():
+        names = model._base_manager.exclude(**{field.attname: ''}).exclude(**{f'{field.attname}__isnull': True})
+        references.update(names.values_list(field.attname, flat=True).iterator(chunk_size=2000))
+    for model in apps.get_models():
+        if hasattr(model, 'referenced_files'):
+            references.update(model.referenced_files())
+    return Counter({name: count for name, count in references.items() if is_blob_name(name)})
@@ -0,0 +1,110 @@
+import os
+import hashlib
+import posixpath
+import tempfile
+
+from django.db import transaction
+from django.core.files import File
+from django.core.files.move import file_move_safe
+from django.core.files.storage import FileSystemStorage
+
+from media_app.models import StoredBlob
+
+
+BLOB_DIR = 'blobs'
+
+
+def blob_name(digest, extension):
+    """Immutable storage name of a blob: blobs/ab/cd/abcd...<extension>"""
+
+    return posixpath.join(BLOB_DIR, digest[:2], digest[2:4], f'{digest}{extension}')
+
+
+def is_blob_name(name):
+    return name.startswith(f'{BLOB_DIR}/')
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    File system storage that keeps each distinct file once, named after its SHA-256 digest.
+
+    The requested name only contributes its extension. Uploads are hashed while they are
+    streamed into a temporary file next to the blobs and then moved into place (files that
+    are already on disk, like large uploads, are hashed and moved directly), so no file is
+    held in memory and identical uploads share one blob. Every save counts a reference
+    on the blob's StoredBlob row and delete() releases one; unreferenced blobs are removed
+    by the prune_blobs command.
+    """
+
+    def get_available_name(self, name, max_length=None):
+        """Blob names are derived from the content, so there is nothing to make unique"""
+
+        return name
+
+    def _save(self, name, content):
+        extension = posixpath.splitext(name)[1].lower()
+        if hasattr(content, 'temporary_file_path'):
+            temp_path, owned = content.temporary_file_path(), False
+            digest, size = self.hash_file(temp_path)
+        else:
+            temp_path, digest, size = self.spool(content)
+            owned = True
+
+        name = blob_name(digest, extension)
+        path = self.path(name)
+        with transaction.atomic():
+            # Count the reference first: it locks the row, so prune_blobs cannot delete the file
+            # between the existence check below and the commit.
+            StoredBlob.acquire(name, digest, size)
+            if os.path.exists(path):
+                if owned:
+                    os.unlink(temp_path)
+            else:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                file_move_safe(temp_path, path, allow_overwrite=True)
+                if self.file_permissions_mode is not None:
+                    os.chmod(path, self.file_permissions_mode)
+        return name
+
+    def spool(self, content):
+        """Stream content into a temporary file while hashing it, returns (path, digest, size)"""
+
+        temp_dir = self.path('tmp')
+        os.makedirs(temp_dir, exist_ok=True)
+
+        hasher = hashlib.sha256()
+        size = 0
+        with tempfile.NamedTemporaryFile(dir=temp_dir, delete=False) as temp_file:
+            try:
+                if hasattr(content, 'seek'):
+                    content.seek(0)
+                for chunk in content.chunks():
+                    hasher.update(chunk)
+                    temp_file.write(chunk)
+                    size += len(chunk)
+            except BaseException:
+                os.unlink(temp_file.name)
+                raise
+        return temp_file.name, hasher.hexdigest(), size
+
+    def hash_file(self, path):
+        """Digest and size of a file that is already on disk, which is then moved instead of copied"""
+
+        hasher = hashlib.sha256()
+        size = 0
+        with open(path, 'rb') as file:
+            for chunk in iter(lambda: file.read(File.DEFAULT_CHUNK_SIZE), b''):
+                hasher.update(chunk)
+                size += len(chunk)
+        return hasher.hexdigest(), size
+
+    def delete(self, name):
+        """Release one reference of a blob, other files are deleted right away"""
+
+        if is_blob_name(name):
+            StoredBlob.release(name)
+        else:
+            super().delete(name)
+
+    def delete_blob(self, name):
+        super().delete(name)
@@ -0,0 +1,158 @@
+import os
+import shutil
+import tempfile
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.core.files.base import ContentFile
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+from django.contrib.auth.models import User
+
+from offers_app.models import Offer
+from profiles_app.models import Profile
+
+
+MEDIA_ROOT = tempfile.mkdtemp()
+MEDIA_SERVING = {'ACCEL_HEADER': None, 'ACCEL_PREFIX': '/protected-media/', 'MAX_AGE': 3600}
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, MEDIA_SERVING=MEDIA_SERVING)
+class MediaServingTests(TestCase):
+    """Tests for GET /media/{path}"""
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def setUp(self):
+        """Create test data"""
+
+        cache.clear()
+        self.name = default_storage.save('offer_images/banner.png', ContentFile(b'0123456789'))
+        self.url = f'/media/{self.name}'
+
+    def read(self, response):
+        return b''.join(response.streaming_content)
+
+    def test_blob_is_served_immutable(self):
+        """Test: Hashed blobs are served with their digest as ETag and an immutable cache policy"""
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.read(response), b'0123456789')
+        self.assertEqual(response['Content-Type'], 'image/png')
+        self.assertEqual(response['Cache-Control'], 'public, max-age=31536000, immutable')
+        self.assertEqual(response['ETag'], '"%s"' % os.path.basename(self.name)[:-4])
+        self.assertEqual(response['Accept-Ranges'], 'bytes')
+
+    def test_matching_etag_returns_not_modified(self):
+        """Test: A cached copy is revalidated without a body"""
+
+        etag = self.client.get(self.url)['ETag']
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+
+    def test_byte_ranges(self):
+        """Test: Single ranges return 206, ranges past the end return 416"""
+
+        response = self.client.get(self.url, HTTP_RANGE='bytes=2-5')
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(self.read(response), b'2345')
+        self.assertEqual(response['Content-Range'], 'bytes 2-5/10')
+        self.assertEqual(response['Content-Length'], '4')
+
+        response = self.client.get(self.url, HTTP_RANGE='bytes=-3')
+        self.assertEqual(self.read(response), b'789')
+
+        response = self.client.get(self.url, HTTP_RANGE='bytes=20-')
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response['Content-Range'], 'bytes */10')
+
+    def test_stale_if_range_sends_whole_file(self):
+        """Test: A range for another version of the file is ignored"""
+
+        response = self.client.get(self.url, HTTP_RANGE='bytes=2-5', HTTP_IF_RANGE='"outdated"')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.read(response), b'0123456789')
+
+    def test_files_outside_media_are_not_served(self):
+        """Test: Traversal, temporary uploads and missing files return 404"""
+
+        os.makedirs(os.path.join(MEDIA_ROOT, 'tmp'), exist_ok=True)
+        with open(os.path.join(MEDIA_ROOT, 'tmp', 'upload'), 'wb') as file:
+            file.write(b'partial')
+
+        for path in ['../settings.py', 'blobs/../../settings.py', 'tmp/upload', 'blobs/missing.png']:
+            self.assertEqual(self.client.get(f'/media/{path}').status_code, 404, path)
+
+    def test_unreferenced_files_are_not_served(self):
+        """Test: Released blobs and files no record refers to are forbidden, even with X-Accel-Redirect"""
+
+        os.makedirs(os.path.join(MEDIA_ROOT, 'offer_images'), exist_ok=True)
+        with open(os.path.join(MEDIA_ROOT, 'offer_images', 'stray.png'), 'wb') as file:
+            file.write(b'stray')
+        self.assertEqual(self.client.get('/media/offer_images/stray.png').status_code, 404)
+
+        default_storage.delete(self.name)
+        self.assertTrue(default_storage.exists(self.name))
+        self.assertEqual(self.client.get(self.url).status_code, 404)
+        with self.settings(MEDIA_SERVING={**MEDIA_SERVING, 'ACCEL_HEADER': 'X-Accel-Redirect'}):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 404)
+        self.assertNotIn('X-Accel-Redirect', response)
+
+    def test_referenced_legacy_file_is_served(self):
+        """Test: Files stored before the blob storage are served while a record refers to them"""
+
+        owner = User.objects.create_user(username="business", password="password123")
+        profile = Profile.objects.create(user=owner, type='business')
+        os.makedirs(os.path.join(MEDIA_ROOT, 'offer_images'), exist_ok=True)
+        with open(os.path.join(MEDIA_ROOT, 'offer_images', 'legacy.png'), 'wb') as file:
+            file.write(b'legacy')
+        Offer.objects.create(creator=profile, title="Offer", image='offer_images/legacy.png')
+
+        response = self.client.get('/media/offer_images/legacy.png')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.read(response), b'legacy')
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get('/media/offer_images/legacy.png').status_code, 200)
+
+    async def test_asgi_streams_file_in_chunks(self):
+        """Test: Under ASGI whole files and ranges are read piece by piece through an async iterator"""
+
+        with mock.patch('media_app.views.CHUNK_SIZE', 4):
+            response = await self.async_client.get(self.url)
+            self.assertTrue(response.is_async)
+            self.assertEqual(response['Content-Length'], '10')
+            chunks = [chunk async for chunk in response.streaming_content]
+            self.assertEqual(chunks, [b'0123', b'4567', b'89'])
+
+            response = await self.async_client.get(self.url, headers={'Range': 'bytes=2-7'})
+            self.assertEqual(response.status_code, 206)
+            chunks = [chunk async for chunk in response.streaming_content]
+            self.assertEqual(chunks, [b'2345', b'67'])
+
+    @override_settings(MEDIA_SERVING={**MEDIA_SERVING, 'ACCEL_HEADER': 'X-Accel-Redirect'})
+    def test_accel_redirect_hands_transfer_to_proxy(self):
+        """Test: With X-Accel-Redirect the response only names the internal location"""
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response['X-Accel-Redirect'], f'/protected-media/{self.name}')
+        self.assertEqual(response.content, b'')
+        self.assertIn('immutable', response['Cache-Control'])
+
+    @override_settings(MEDIA_SERVING={**MEDIA_SERVING, 'ACCEL_HEADER': 'X-Sendfile'})
+    def test_sendfile_uses_absolute_path(self):
+        """Test: With X-Sendfile the response carries the file system path"""
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response['X-Sendfile'], default_storage.path(self.name))
@@ -0,0 +1,129 @@
+import os
+import shutil
+import tempfile
+from io import StringIO
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from django.core.management import call_command
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.contrib.auth.models import User
+
+from media_app.models import StoredBlob
+from media_app.references import count_references
+from offers_app.models import Offer
+from profiles_app.models import Profile
+
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class ContentAddressedStorageTests(TestCase):
+    """Tests for the content-addressed default storage and the prune_blobs command"""
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def setUp(self):
+        """Create test data"""
+
+        user = User.objects.create_user(username="business1", email="business1@example.com", password="password123")
+        self.profile = Profile.objects.create(user=user, type='business')
+
+    def create_offer(self, content, name="banner.PNG"):
+        offer = Offer.objects.create(creator=self.profile, title="Website Design", description="Design")
+        offer.image.save(name, ContentFile(content))
+        return offer
+
+    def test_identical_uploads_share_one_blob(self):
+        """Test: The same content is stored once under its digest and counted twice"""
+
+        first = self.create_offer(b'same banner')
+        second = self.create_offer(b'same banner', name="copy.png")
+        other = self.create_offer(b'other banner')
+
+        self.assertEqual(first.image.name, second.image.name)
+        self.assertNotEqual(first.image.name, other.image.name)
+        self.assertRegex(first.image.name, r'^blobs/[0-9a-f]{2}/[0-9a-f]{2}/[0-9a-f]{64}\.png$')
+        self.assertEqual(first.image.url, f'/media/{first.image.name}')
+        self.assertEqual(StoredBlob.objects.get(name=first.image.name).ref_count, 2)
+        self.assertEqual(os.listdir(default_storage.path('tmp')), [])
+
+    def test_delete_releases_reference_but_keeps_file(self):
+        """Test: Deleting through the storage only lowers the reference count"""
+
+        offer = self.create_offer(b'banner')
+        default_storage.delete(offer.image.name)
+
+        self.assertEqual(StoredBlob.objects.get(name=offer.image.name).ref_count, 0)
+        self.assertTrue(default_storage.exists(offer.image.name))
+
+    def test_prune_recounts_and_deletes_unreferenced_blobs(self):
+        """Test: Blobs of deleted offers are removed once they are older than the grace period"""
+
+        kept = self.create_offer(b'kept banner')
+        dropped = self.create_offer(b'dropped banner')
+        dropped_name = dropped.image.name
+        dropped.delete()
+        StoredBlob.objects.update(updated_at=timezone.now() - timedelta(days=2))
+
+        call_command('prune_blobs', stdout=StringIO())
+
+        self.assertFalse(default_storage.exists(dropped_name))
+        self.assertFalse(StoredBlob.objects.filter(name=dropped_name).exists())
+        self.assertTrue(default_storage.exists(kept.image.name))
+        self.assertEqual(StoredBlob.objects.get(name=kept.image.name).ref_count, 1)
+
+    def test_prune_keeps_recent_and_variant_blobs(self):
+        """Test: The grace period and file_variants references protect blobs"""
+
+        recent = self.create_offer(b'recent banner')
+        recent_name = recent.image.name
+        recent.delete()
+
+        variant = default_storage.save('profile_pictures/variants/1/avatar_64.webp', ContentFile(b'variant'))
+        Profile.objects.filter(id=self.profile.id).update(file_variants={'webp': {'64': variant}})
+        StoredBlob.objects.filter(name=variant).update(updated_at=timezone.now() - timedelta(days=2))
+
+        call_command('prune_blobs', stdout=StringIO())
+
+        self.assertTrue(default_storage.exists(recent_name))
+        self.assertTrue(default_storage.exists(variant))
+
+    def test_acquire_refreshes_updated_at(self):
+        """Test: Acquiring and releasing a blob restarts its grace period"""
+
+        offer = self.create_offer(b'banner')
+        StoredBlob.objects.update(updated_at=timezone.now() - timedelta(days=2))
+
+        StoredBlob.acquire(offer.image.name, 'digest', 6)
+        self.assertGreater(StoredBlob.objects.get(name=offer.image.name).updated_at, timezone.now() - timedelta(minutes=1))
+
+        StoredBlob.objects.update(updated_at=timezone.now() - timedelta(days=2))
+        StoredBlob.release(offer.image.name)
+        self.assertGreater(StoredBlob.objects.get(name=offer.image.name).updated_at, timezone.now() - timedelta(minutes=1))
+
+    def test_upload_during_prune_keeps_blob(self):
+        """Test: A blob acquired while prune_blobs scans references is neither reset nor deleted"""
+
+        offer = self.create_offer(b'reused banner')
+        name = offer.image.name
+        offer.delete()
+        StoredBlob.objects.update(updated_at=timezone.now() - timedelta(days=2))
+
+        def scan_with_concurrent_upload():
+            references = count_references()
+            default_storage.save('offer_images/again.png', ContentFile(b'reused banner'))
+            return references
+
+        with mock.patch('media_app.management.commands.prune_blobs.count_references', scan_with_concurrent_upload):
+            call_command('prune_blobs', stdout=StringIO())
+
+        self.assertTrue(default_storage.exists(name))
+        self.assertEqual(StoredBlob.objects.get(name=name).ref_count, 2)
@@ -0,0 +1,211 @@
+import os
+import shutil
+import tempfile
+from io import BytesIO, StringIO
+from datetime import timedelta
+
+from PIL import Image
+from django.urls import reverse
+from django.utils import timezone
+from django.test import override_settings
+from django.core.management import call_command
+from django.core.files.storage import default_storage
+from django.contrib.auth.models import User
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework.authtoken.models import Token
+
+from media_app.models import UploadSession, StoredBlob
+from offers_app.models import Offer
+from profiles_app.models import Profile
+
+
+MEDIA_ROOT = tempfile.mkdtemp()
+AVATARS = {
+    'SIZES': [64], 'LIST_SIZE': 64, 'FORMAT': 'WEBP', 'FALLBACK_FORMAT': 'JPEG',
+    'MAX_UPLOAD_BYTES': 200 * 1024, 'WORKERS': 1, 'ASYNC': False,
+}
+UPLOADS = {'MAX_BYTES': 200 * 1024, 'MAX_CHUNK_BYTES': 1024, 'EXPIRE_HOURS': 24, 'MAX_OPEN_SESSIONS': 2}
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, PROFILE_AVATARS=AVATARS, MEDIA_UPLOADS=UPLOADS)
+class ResumableUploadTests(APITestCase):
+    """Tests for /api/uploads/"""
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def setUp(self):
+        """Create test data"""
+
+        self.business_user = User.objects.create_user(
+            username="business1",
+            email="business1@example.com",
+            password="password123"
+        )
+        self.business_profile = Profile.objects.create(user=self.business_user, type='business')
+        self.business_token = Token.objects.create(user=self.business_user)
+
+        self.other_user = User.objects.create_user(
+            username="business2",
+            email="business2@example.com",
+            password="password123"
+        )
+        self.other_profile = Profile.objects.create(user=self.other_user, type='business')
+        self.other_token = Token.objects.create(user=self.other_user)
+
+        self.offer = Offer.objects.create(
+            creator=self.business_profile,
+            title="Website Design",
+            description="Professional website design"
+        )
+        buffer = BytesIO()
+        Image.effect_noise((120, 80), 64).save(buffer, 'PNG')
+        self.image = buffer.getvalue()
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.business_token.key)
+
+    def start(self, target='offer_image', **data):
+        data = {'target': target, 'object_id': self.offer.id, 'filename': 'banner.png', 'size': len(self.image), **data}
+        return self.client.post(reverse('upload-session-create'), data, format='json')
+
+    def put_chunk(self, session_id, start, end):
+        return self.client.put(
+            reverse('upload-session', kwargs={'pk': session_id}), self.image[start:end + 1],
+            content_type='application/octet-stream',
+            HTTP_CONTENT_RANGE=f'bytes {start}-{end}/{len(self.image)}'
+        )
+
+    def upload_all(self, session_id):
+        for start in range(0, len(self.image), 1024):
+            response = self.put_chunk(session_id, start, min(start + 1023, len(self.image) - 1))
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def complete(self, session_id):
+        return self.client.post(reverse('upload-complete', kwargs={'pk': session_id}))
+
+    def test_chunked_upload_attaches_offer_image(self):
+        """Test: Chunks are appended in order and completing sets Offer.image"""
+
+        session_id = self.start().data['id']
+        self.upload_all(session_id)
+        response = self.complete(session_id)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.offer.refresh_from_db()
+        self.assertTrue(self.offer.image.name.startswith('blobs/'))
+        self.assertTrue(response.data['file'].endswith(self.offer.image.name))
+        with default_storage.open(self.offer.image.name) as file:
+            self.assertEqual(file.read(), self.image)
+        self.assertEqual(StoredBlob.objects.get(name=self.offer.image.name).ref_count, 1)
+        self.assertFalse(UploadSession.objects.exists())
+        self.assertEqual(os.listdir(default_storage.path('tmp')), [])
+
+    def test_resume_after_interruption(self):
+        """Test: A chunk at the wrong offset returns 409 with the offset to resume from"""
+
+        session_id = self.start().data['id']
+        self.put_chunk(session_id, 0, 1023)
+
+        response = self.put_chunk(session_id, 2048, 3071)
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(response.data['received'], 1024)
+
+        status_response = self.client.get(reverse('upload-session', kwargs={'pk': session_id}))
+        self.assertEqual(status_response.data['received'], 1024)
+
+        response = self.complete(session_id)
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+
+    def test_profile_picture_is_processed(self):
+        """Test: Completing a profile upload sets Profile.file and builds its variants"""
+
+        response = self.start(target='profile_file', object_id=None)
+        self.assertEqual(response.data['object_id'], self.business_profile.id)
+
+        self.upload_all(response.data['id'])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.complete(response.data['id'])
+
+        self.business_profile.refresh_from_db()
+        self.assertTrue(self.business_profile.file.name.startswith('blobs/'))
+        self.assertIn('64', self.business_profile.file_variants['webp'])
+
+    def test_invalid_sessions_are_rejected(self):
+        """Test: Foreign offers, oversized files and non-images cannot be uploaded"""
+
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.other_token.key)
+        self.assertEqual(self.start().status_code, status.HTTP_400_BAD_REQUEST)
+
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.business_token.key)
+        self.assertEqual(self.start(size=300 * 1024).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.start(filename='notes.txt').status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_chunk_limits(self):
+        """Test: Oversized chunks return 413 and missing ranges 400"""
+
+        session_id = self.start().data['id']
+
+        response = self.put_chunk(session_id, 0, 2047)
+        self.assertEqual(response.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+
+        response = self.client.put(reverse('upload-session', kwargs={'pk': session_id}), b'data', content_type='application/octet-stream')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_sessions_are_private(self):
+        """Test: Other users cannot see or write to a session"""
+
+        session_id = self.start().data['id']
+
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.other_token.key)
+        self.assertEqual(self.put_chunk(session_id, 0, 1023).status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(self.complete(session_id).status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_corrupt_image_is_discarded(self):
+        """Test: Completing bytes Pillow cannot read returns 400 and drops the session"""
+
+        self.image = b'x' * 100
+        session_id = self.start().data['id']
+        self.put_chunk(session_id, 0, 99)
+
+        response = self.complete(session_id)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(UploadSession.objects.exists())
+        self.offer.refresh_from_db()
+        self.assertFalse(self.offer.image)
+
+    def test_open_sessions_are_capped(self):
+        """Test: A user cannot start more than MAX_OPEN_SESSIONS uploads until one expires"""
+
+        first_id = self.start().data['id']
+        self.assertEqual(self.start().status_code, status.HTTP_201_CREATED)
+
+        response = self.start()
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(UploadSession.objects.filter(owner=self.business_user).count(), 2)
+
+        UploadSession.objects.filter(id=first_id).update(updated_at=timezone.now() - timedelta(hours=25))
+        self.assertEqual(self.start().status_code, status.HTTP_201_CREATED)
+
+    def test_expire_uploads_deletes_stale_sessions(self):
+        """Test: expire_uploads deletes expired sessions with their partial files and keeps open ones"""
+
+        stale_id = self.start().data['id']
+        self.put_chunk(stale_id, 0, 1023)
+        open_id = self.start().data['id']
+        self.put_chunk(open_id, 0, 1023)
+        stale = UploadSession.objects.get(id=stale_id)
+        UploadSession.objects.filter(id=stale_id).update(updated_at=timezone.now() - timedelta(hours=25))
+
+        call_command('expire_uploads', '--dry-run', stdout=StringIO())
+        self.assertTrue(UploadSession.objects.filter(id=stale_id).exists())
+
+        call_command('expire_uploads', stdout=StringIO())
+
+        self.assertEqual([str(pk) for pk in UploadSession.objects.values_list('id', flat=True)], [open_id])
+        self.assertFalse(os.path.exists(default_storage.path(stale.temp_name)))
+        open_session = UploadSession.objects.get(id=open_id)
+        self.assertTrue(os.path.exists(default_storage.path(open_session.temp_name)))
@@ -0,0 +1,111 @@
+import os
+import re
+from datetime import timedelta
+
+from PIL import Image, UnidentifiedImageError
+from django.conf import settings
+from django.utils import timezone
+from django.shortcuts import get_object_or_404
+from django.core.files import File
+from django.core.files.storage import default_storage
+
+from media_app.models import UploadSession
+from offers_app.models import Offer
+from profiles_app.models import Profile
+from profiles_app.avatars import avatar_settings, schedule_avatar_processing, discard_avatar_variants
+
+
+CONTENT_RANGE_PATTERN = re.compile(r'^bytes (\d+)-(\d+)/(\d+)$')
+
+
+def upload_settings():
+    return settings.MEDIA_UPLOADS
+
+
+def max_upload_bytes(target):
+    """Profile pictures keep the avatar limit, offer images use MEDIA_UPLOADS['MAX_BYTES']"""
+
+    if target == 'profile_file':
+        return avatar_settings()['MAX_UPLOAD_BYTES']
+    return upload_settings()['MAX_BYTES']
+
+
+def expiry_cutoff():
+    """Sessions without a chunk since this moment are expired"""
+
+    return timezone.now() - timedelta(hours=upload_settings()['EXPIRE_HOURS'])
+
+
+def open_sessions(user):
+    """Upload sessions of the user that have not expired"""
+
+    return UploadSession.objects.filter(owner=user, updated_at__gte=expiry_cutoff())
+
+
+def parse_content_range(header):
+    """(start, end, total) of a 'bytes start-end/total' header, raises ValueError when malformed"""
+
+    match = CONTENT_RANGE_PATTERN.match(header.strip())
+    if not match:
+        raise ValueError
+    start, end, total = (int(value) for value in match.groups())
+    if start > end or end >= total:
+        raise ValueError
+    return start, end, total
+
+
+def write_chunk(path, stream, offset, length):
+    """Write up to length bytes of the request stream at offset, returns the number of bytes written"""
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    remaining = length
+    with open(path, 'r+b' if os.path.exists(path) else 'wb') as file:
+        file.seek(offset)
+        while remaining and stream is not None:
+            chunk = stream.read(min(File.DEFAULT_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            file.write(chunk)
+            remaining -= len(chunk)
+        file.truncate()
+    return length - remaining
+
+
+def is_valid_image(path):
+    try:
+        with Image.open(path) as image:
+            image.verify()
+    except (UnidentifiedImageError, OSError, SyntaxError, Image.DecompressionBombError):
+        return False
+    return True
+
+
+class PartialUpload(File):
+    """The assembled temporary file, which the content-addressed storage moves into place instead of copying"""
+
+    def temporary_file_path(self):
+        return self.file.name
+
+
+def attach_upload(session):
+    """Save the assembled file into the target field, returns the updated instance"""
+
+    path = default_storage.path(session.temp_name)
+    with PartialUpload(open(path, 'rb'), name=session.filename) as upload:
+        if session.target == 'offer_image':
+            offer = get_object_or_404(Offer, id=session.object_id, creator__user_id=session.owner_id)
+            offer.image.save(session.filename, upload)
+            return offer
+
+        profile = get_object_or_404(Profile, id=session.object_id, user_id=session.owner_id)
+        if profile.file_variants:
+            discard_avatar_variants(profile)
+        profile.file.save(session.filename, upload)
+        schedule_avatar_processing(profile)
+        return profile
+
+
+def remove_partial_file(session):
+    path = default_storage.path(session.temp_name)
+    if os.path.exists(path):
+        os.unlink(path)
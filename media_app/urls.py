@@ -0,0 +1,6 @@
+from django.urls import path, include
+
+
+urlpatterns = [
+    path('', include('media_app.api.urls')),
+]
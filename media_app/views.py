@@ -0,0 +1,166 @@
+import os
+import re
+import mimetypes
+import posixpath
+from urllib.parse import quote
+
+from django.conf import settings
+from django.http import FileResponse, Http404, HttpResponse, StreamingHttpResponse
+from django.views import View
+from django.utils.http import http_date, parse_etags
+from django.utils.cache import get_conditional_response
+from django.core.files.storage import default_storage
+from django.core.exceptions import SuspiciousFileOperation
+
+from core.streaming import is_asgi, streaming_content
+from media_app.storage import is_blob_name
+from media_app.references import is_referenced
+
+
+RANGE_PATTERN = re.compile(r'^bytes=(\d*)-(\d*)$')
+CHUNK_SIZE = 64 * 1024
+
+
+def resolve_media_path(name):
+    """Absolute path of a servable media file, raising Http404 for anything else"""
+
+    name = posixpath.normpath(name).lstrip('/')
+    if name.startswith('..') or name == 'tmp' or name.startswith('tmp/'):
+        raise Http404
+    if not is_referenced(name):
+        raise Http404
+    try:
+        path = default_storage.path(name)
+    except (SuspiciousFileOperation, NotImplementedError):
+        raise Http404
+    if not os.path.isfile(path):
+        raise Http404
+    return name, path
+
+
+def media_etag(name, stat):
+    """Blob names carry their digest, other files are identified by mtime and size"""
+
+    if is_blob_name(name):
+        return '"%s"' % posixpath.splitext(posixpath.basename(name))[0]
+    return '"%x-%x"' % (stat.st_mtime_ns, stat.st_size)
+
+
+def parse_range(header, size):
+    """(start, end) of a single byte range, None to send the whole file, raises ValueError if unsatisfiable"""
+
+    match = RANGE_PATTERN.match(header.strip())
+    if not match or match.groups() == ('', ''):
+        return None
+    first, last = match.groups()
+    if not first:
+        length = int(last)
+        if length == 0:
+            raise ValueError
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        raise ValueError
+    return start, end
+
+
+def read_range(path, start, end):
+    with open(path, 'rb') as file:
+        file.seek(start)
+        remaining = end - start + 1
+        while remaining:
+            chunk = file.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+class MediaFileView(View):
+    """
+    Serves uploaded media.
+
+    Media is public by reference: profile pictures, their variants and offer images are
+    shown to every reader of the API and are loaded by <img> tags that send no token, so
+    a file is served exactly while a record refers to it. Replaced or deleted pictures
+    awaiting prune_blobs, stray files and temporary uploads return 404.
+    The file is resolved in Python; the transfer is handed to the front proxy via
+    MEDIA_SERVING['ACCEL_HEADER'] (X-Accel-Redirect or X-Sendfile) when configured, and
+    otherwise streamed with ETag, conditional GET and single byte range support, under
+    ASGI through an async iterator so no file is held in memory.
+    Content-addressed blobs never change and are cached as immutable.
+    """
+
+    def get(self, request, path):
+        name, file_path = resolve_media_path(path)
+        stat = os.stat(file_path)
+        options = settings.MEDIA_SERVING
+
+        headers = {
+            'ETag': media_etag(name, stat),
+            'Last-Modified': http_date(stat.st_mtime),
+            'Cache-Control': (
+                'public, max-age=31536000, immutable' if is_blob_name(name)
+                else 'public, max-age=%d' % options['MAX_AGE']
+            ),
+            'Accept-Ranges': 'bytes',
+        }
+
+        not_modified = get_conditional_response(request, etag=headers['ETag'], last_modified=int(stat.st_mtime))
+        if not_modified is not None:
+            return self.with_headers(not_modified, headers)
+
+        content_type = mimetypes.guess_type(name)[0] or 'application/octet-stream'
+        accel_header = options['ACCEL_HEADER']
+        if accel_header:
+            response = HttpResponse(content_type=content_type)
+            if accel_header == 'X-Sendfile':
+                response[accel_header] = file_path
+            else:
+                response[accel_header] = options['ACCEL_PREFIX'] + quote(name)
+            return self.with_headers(response, headers)
+
+        try:
+            byte_range = self.requested_range(request, headers['ETag'], stat.st_size)
+        except ValueError:
+            response = HttpResponse(status=416)
+            response['Content-Range'] = 'bytes */%d' % stat.st_size
+            return self.with_headers(response, headers)
+        if byte_range:
+            start, end = byte_range
+            response = StreamingHttpResponse(self.file_content(request, file_path, start, end), status=206, content_type=content_type)
+            response['Content-Range'] = 'bytes %d-%d/%d' % (start, end, stat.st_size)
+            response['Content-Length'] = str(end - start + 1)
+            return self.with_headers(response, headers)
+
+        if is_asgi(request):
+            response = StreamingHttpResponse(self.file_content(request, file_path, 0, stat.st_size - 1), content_type=content_type)
+            response['Content-Length'] = str(stat.st_size)
+            return self.with_headers(response, headers)
+        response = FileResponse(open(file_path, 'rb'), content_type=content_type)
+        return self.with_headers(response, headers)
+
+    def file_content(self, request, file_path, start, end):
+        """
+        Byte range of the file in CHUNK_SIZE pieces.
+
+        Under ASGI Django would read a synchronous iterator (or FileResponse) completely into
+        memory, so there each piece is read in a worker thread as the client consumes it.
+        """
+
+        return streaming_content(request, read_range(file_path, start, end), 1, thread_sensitive=False)
+
+    def requested_range(self, request, etag, size):
+        header = request.headers.get('Range')
+        if not header:
+            return None
+        if_range = request.headers.get('If-Range')
+        if if_range and etag not in parse_etags(if_range):
+            return None
+        return parse_range(header, size)
+
+    def with_headers(self, response, headers):
+        for header, value in headers.items():
+            response[header] = value
+        return response
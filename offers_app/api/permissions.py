@@ -28,4 +28,5 @@ class IsOfferOwnerOrReadOnly(permissions.BasePermission):
         if request.method in permissions.SAFE_METHODS:
             return True
         
-        return obj.creator.user == request.user
+        profile = getattr(request.user, 'profile', None)
+        return profile is not None and obj.creator_id == profile.id
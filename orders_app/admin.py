@@ -1,15 +1,35 @@
+from django import forms
+from django.db import transaction
 from django.contrib import admin
-from .models import Orders
+from .models import Orders, ArchivedOrders, OrderTombstone
+from .events import publish_order_event
+from .stats import record_order_created, record_status_change, record_order_deleted
+
+
+class OrdersAdminForm(forms.ModelForm):
+    """Edits the features list, which the model stores as a shared FeatureSnapshot"""
+    
+    features = forms.JSONField(initial=list, required=False)
+    
+    class Meta:
+        model = Orders
+        fields = '__all__'
+    
+    def save(self, commit=True):
+        if 'features' in self.cleaned_data:
+            self.instance.features = self.cleaned_data['features'] or []
+        return super().save(commit)
 
 
 @admin.register(Orders)
 class OrdersAdmin(admin.ModelAdmin):
     """Admin configuration for Orders model"""
     
+    form = OrdersAdminForm
     list_display = ['id', 'title', 'customer', 'business', 'status', 'price', 'created_at']
     list_filter = ['status', 'offer_type', 'created_at']
     search_fields = ['title', 'customer__user__username', 'business__user__username']
-    readonly_fields = ['created_at', 'updated_at', 'offer_detail']
+    readonly_fields = ['created_at', 'updated_at']
     list_select_related = ['customer__user', 'business__user', 'offer_detail']
     
     fieldsets = (
@@ -29,5 +49,51 @@ class OrdersAdmin(admin.ModelAdmin):
         """Make snapshot fields readonly after creation"""
         
         if obj:
-            return self.readonly_fields + ('title', 'offer_type', 'price', 'delivery_time_in_days', 'revisions', 'features', 'customer', 'business')
+            return self.readonly_fields + ['offer_detail', 'title', 'offer_type', 'price', 'delivery_time_in_days', 'revisions', 'features', 'customer', 'business']
         return self.readonly_fields
+    
+    def save_model(self, request, obj, form, change):
+        """Keep the daily stats and the event stream in step, like the API's create and update"""
+        
+        with transaction.atomic():
+            if not change:
+                super().save_model(request, obj, form, change)
+                record_order_created(obj)
+                previous_status = None
+            else:
+                previous_status = Orders.objects.select_for_update().values_list('status', flat=True).get(pk=obj.pk)
+                super().save_model(request, obj, form, change)
+                record_status_change(obj, previous_status)
+        if not change:
+            publish_order_event(obj, 'order.created')
+        elif obj.status != previous_status:
+            publish_order_event(obj, 'order.status_changed')
+    
+    def delete_model(self, request, obj):
+        """Delete like the API: leave a tombstone for the change feed and take the order out of the stats"""
+        
+        with transaction.atomic():
+            OrderTombstone.objects.create(order_id=obj.id, customer_id=obj.customer_id, business_id=obj.business_id)
+            record_order_deleted(obj)
+            obj.delete()
+    
+    def delete_queryset(self, request, queryset):
+        with transaction.atomic():
+            for order in queryset:
+                self.delete_model(request, order)
+
+
+@admin.register(ArchivedOrders)
+class ArchivedOrdersAdmin(admin.ModelAdmin):
+    """Read-only admin for archived orders"""
+    
+    list_display = ['id', 'title', 'customer', 'business', 'status', 'price', 'created_at', 'archived_at']
+    list_filter = ['status', 'offer_type', 'archived_at']
+    search_fields = ['title', 'customer__user__username', 'business__user__username']
+    list_select_related = ['customer__user', 'business__user']
+    
+    def has_add_permission(self, request):
+        return False
+    
+    def has_change_permission(self, request, obj=None):
+        return False
@@ -0,0 +1,39 @@
+import json
+import base64
+import binascii
+
+from django.utils.dateparse import parse_datetime
+
+from rest_framework.exceptions import ValidationError
+
+
+class ChangeFeedCursor:
+    """Opaque position in the order change feed: last seen (updated_at, id) and last tombstone id"""
+
+    def __init__(self, updated_at=None, order_id=0, tombstone_id=0):
+        self.updated_at = updated_at
+        self.order_id = order_id
+        self.tombstone_id = tombstone_id
+
+    def encode(self):
+        """Serialize the cursor into a URL-safe token"""
+
+        payload = {
+            'u': self.updated_at.isoformat() if self.updated_at else None,
+            'i': self.order_id,
+            't': self.tombstone_id,
+        }
+        raw = json.dumps(payload, separators=(',', ':')).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+    @classmethod
+    def decode(cls, token):
+        """Parse a token produced by encode(), raising a 400 on malformed input"""
+
+        try:
+            padded = token + '=' * (-len(token) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            updated_at = parse_datetime(payload['u']) if payload['u'] else None
+            return cls(updated_at, int(payload['i']), int(payload['t']))
+        except (ValueError, TypeError, KeyError, binascii.Error):
+            raise ValidationError({"cursor": "Invalid cursor."})
@@ -10,6 +10,13 @@ class IsCustomerUser(permissions.BasePermission):
         return True
 
 
+class IsBusinessUser(permissions.BasePermission):
+    """Permission: Only users with type 'business' can access their work queue"""
+    
+    def has_permission(self, request, view):
+        return hasattr(request.user, 'profile') and request.user.profile.type == 'business'
+
+
 class IsOrderParticipant(permissions.BasePermission):
     """Permission: Only customer or business of the order can access it"""
     
@@ -23,6 +30,13 @@ class IsOrderParticipant(permissions.BasePermission):
         user_profile = request.user.profile
         
         if request.method in ['PUT', 'PATCH']:
-            return obj.business == user_profile
+            return obj.business_id == user_profile.id
         
-        return obj.customer == user_profile or obj.business == user_profile
+        return user_profile.id in (obj.customer_id, obj.business_id)
+
+
+class HasProfile(permissions.BasePermission):
+    """Permission: Only users with a profile have orders"""
+    
+    def has_permission(self, request, view):
+        return hasattr(request.user, 'profile')
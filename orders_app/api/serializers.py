@@ -1,7 +1,11 @@
+from datetime import timedelta
+
+from django.utils import timezone
+
 from rest_framework import serializers
 from rest_framework.exceptions import NotFound
 
-from orders_app.models import Orders
+from orders_app.models import Orders, FeatureSnapshot, OrderTombstone
 from offers_app.models import OfferDetail
 
 
@@ -29,6 +33,18 @@ class OrderListSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'customer_user', 'business_user', 'created_at', 'updated_at']
 
 
+class OrderQueueSerializer(OrderListSerializer):
+    """Serializer for a business's work queue with due date and overdue flag"""
+    
+    is_overdue = serializers.SerializerMethodField()
+    
+    class Meta(OrderListSerializer.Meta):
+        fields = OrderListSerializer.Meta.fields + ['due_at', 'is_overdue']
+    
+    def get_is_overdue(self, obj):
+        return obj.status == 'in_progress' and obj.due_at < self.context.get('now', timezone.now())
+
+
 class OrderCreateSerializer(serializers.ModelSerializer):
     """Serializer for creating orders with snapshot from OfferDetail"""
     
@@ -62,7 +78,8 @@ class OrderCreateSerializer(serializers.ModelSerializer):
             delivery_time_in_days=offer_detail.delivery_time_in_days,
             price=offer_detail.price,
             features=offer_detail.features,
-            offer_type=offer_detail.offer_type
+            offer_type=offer_detail.offer_type,
+            due_at=timezone.now() + timedelta(days=offer_detail.delivery_time_in_days)
         )
         return order
     
@@ -75,6 +92,52 @@ class OrderCreateSerializer(serializers.ModelSerializer):
         return data
     
 
+class OrderCheckoutSerializer(serializers.Serializer):
+    """Serializer for creating one snapshot order per offer detail id in a single request"""
+    
+    offer_detail_ids = serializers.ListField(child=serializers.IntegerField(), allow_empty=False, max_length=50, write_only=True)
+    
+    def validate_offer_detail_ids(self, value):
+        """Fetch all offer details with their creators in one query and fail if any is missing"""
+        
+        self.offer_details = OfferDetail.objects.select_related('offer__creator__user').in_bulk(set(value))
+        if len(self.offer_details) != len(set(value)):
+            raise NotFound("The specified offer details could not be found.")
+        return value
+    
+    def create(self, validated_data):
+        """Create all orders with one bulk insert; the caller wraps this in a transaction"""
+        
+        offer_details = [self.offer_details[offer_detail_id] for offer_detail_id in validated_data['offer_detail_ids']]
+        snapshots = FeatureSnapshot.intern_many([offer_detail.features for offer_detail in offer_details])
+        customer = self.context['request'].user.profile
+        now = timezone.now()
+        
+        return Orders.objects.bulk_create([
+            Orders(
+                offer_detail=offer_detail,
+                customer=customer,
+                business=offer_detail.offer.creator,
+                title=offer_detail.title,
+                revisions=offer_detail.revisions,
+                delivery_time_in_days=offer_detail.delivery_time_in_days,
+                price=offer_detail.price,
+                features_snapshot=snapshot,
+                offer_type=offer_detail.offer_type,
+                due_at=now + timedelta(days=offer_detail.delivery_time_in_days)
+            )
+            for offer_detail, snapshot in zip(offer_details, snapshots)
+        ])
+    
+    def to_representation(self, instance):
+        """Return the created orders like a single order creation, without updated_at"""
+        
+        data = OrderListSerializer(instance, many=True).data
+        for order in data:
+            order.pop('updated_at', None)
+        return data
+
+
 class OrderUpdateSerializer(serializers.ModelSerializer):
     """Serializer for updating order status"""
     
@@ -86,4 +149,23 @@ class OrderUpdateSerializer(serializers.ModelSerializer):
         """Return full order data after update"""
         
         return OrderListSerializer(instance).data
-    
\ No newline at end of file
+
+
+class OrderTombstoneSerializer(serializers.ModelSerializer):
+    """Serializer for deleted orders in the change feed"""
+    
+    id = serializers.IntegerField(source='order_id', read_only=True)
+    
+    class Meta:
+        model = OrderTombstone
+        fields = ['id', 'deleted_at']
+
+
+class OrderStatsBucketSerializer(serializers.Serializer):
+    """Serializer for one period of a business's order time series"""
+    
+    period = serializers.DateField(read_only=True)
+    status = serializers.CharField(read_only=True)
+    offer_type = serializers.CharField(read_only=True)
+    order_count = serializers.IntegerField(read_only=True)
+    revenue = serializers.DecimalField(max_digits=14, decimal_places=2, read_only=True)
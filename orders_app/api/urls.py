@@ -1,10 +1,18 @@
 from django.urls import path
-from .views import OrdersListCreateView, OrderDetailView, OrderCountView, CompletedOrderCountView
+from .views import OrdersListCreateView, OrderDetailView, OrderCountView, CompletedOrderCountView, OrderChangesView, OrderEventStreamView, OrderEventTicketView, OrderExportView, OrderStatsView, OrderQueueView, OrderCheckoutView
 
 
 urlpatterns = [
     path('orders/', OrdersListCreateView.as_view(), name='orders-list-create'),
+    path('orders/checkout/', OrderCheckoutView.as_view(), name='orders-checkout'),
+    path('orders/changes/', OrderChangesView.as_view(), name='orders-changes'),
+    path('orders/events/', OrderEventStreamView.as_view(), name='orders-events'),
+    path('orders/events/ticket/', OrderEventTicketView.as_view(), name='orders-events-ticket'),
+    path('orders/export/', OrderExportView.as_view(), name='orders-export'),
+    path('orders/upcoming/', OrderQueueView.as_view(overdue=False), name='orders-upcoming'),
+    path('orders/overdue/', OrderQueueView.as_view(overdue=True), name='orders-overdue'),
     path('orders/<int:pk>/', OrderDetailView.as_view(), name='order-detail'),
     path('order-count/<int:business_user_id>/', OrderCountView.as_view(), name='order-count'),
     path('completed-order-count/<int:business_user_id>/', CompletedOrderCountView.as_view(), name='completed-order-count'),
+    path('order-stats/<int:business_user_id>/', OrderStatsView.as_view(), name='order-stats'),
 ]
@@ -1,15 +1,44 @@
-from django.db.models import Q
+import csv
+import json
+from itertools import islice
+from datetime import datetime, time, timedelta
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q, Sum
+from django.db.models.functions import TruncMonth, TruncWeek
+from django.views import View
 from django.contrib.auth.models import User
+from django.http import Http404, JsonResponse, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from django.core.serializers.json import DjangoJSONEncoder
 
 from rest_framework.views import APIView
 from rest_framework import status, generics
 from rest_framework.response import Response
-from rest_framework.exceptions import NotFound
+from rest_framework.exceptions import NotFound, ValidationError, AuthenticationFailed, PermissionDenied
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.pagination import PageNumberPagination
+
+from core.streaming import streaming_content
+from auth_app.authentication import CachedTokenAuthentication
+from orders_app.models import Orders, ArchivedOrders, FeatureSnapshot, OrderDailyStats, OrderTombstone
+from orders_app.events import (
+    event_settings, get_event_backend, issue_stream_ticket, publish_order_event, redeem_stream_ticket, user_channel
+)
+from orders_app.stats import record_order_created, record_orders_created, record_status_change, record_order_deleted
+from .cursors import ChangeFeedCursor
+from .permissions import IsOrderParticipant, IsCustomerUser, IsBusinessUser, HasProfile
+from .serializers import OrderListSerializer, OrderQueueSerializer, OrderCreateSerializer, OrderCheckoutSerializer, OrderUpdateSerializer, OrderTombstoneSerializer, OrderStatsBucketSerializer
 
-from orders_app.models import Orders
-from .permissions import IsOrderParticipant, IsCustomerUser
-from .serializers import OrderListSerializer, OrderCreateSerializer, OrderUpdateSerializer
+
+def include_archived(request):
+    """Whether the client asked to also read archived orders via ?include_archived=true"""
+    
+    return request.query_params.get('include_archived', '').lower() in ['true', '1']
 
 
 class OrdersListCreateView(generics.ListCreateAPIView):
@@ -24,18 +53,56 @@ class OrdersListCreateView(generics.ListCreateAPIView):
         user_profile = self.request.user.profile
         return Orders.objects.filter(
             Q(customer=user_profile) | Q(business=user_profile)
-        ).select_related('customer__user', 'business__user')
+        ).select_related('customer__user', 'business__user').prefetch_related('features_snapshot')
+    
+    def list(self, request, *args, **kwargs):
+        """List hot orders, appending archived ones only when requested"""
+        
+        orders = list(self.filter_queryset(self.get_queryset()))
+        if include_archived(request):
+            user_profile = request.user.profile
+            orders += ArchivedOrders.objects.filter(
+                Q(customer=user_profile) | Q(business=user_profile)
+            ).select_related('customer__user', 'business__user').prefetch_related('features_snapshot')
+        
+        serializer = self.get_serializer(orders, many=True)
+        return Response(serializer.data)
     
     def get_serializer_class(self):
         if self.request.method == 'POST':
             return OrderCreateSerializer
         return OrderListSerializer
+    
+    def perform_create(self, serializer):
+        with transaction.atomic():
+            order = serializer.save()
+            record_order_created(order)
+        publish_order_event(order, 'order.created')
+
+
+class OrderCheckoutView(generics.GenericAPIView):
+    """API view for creating orders for several offer details in one request"""
+    
+    serializer_class = OrderCheckoutSerializer
+    permission_classes = [IsAuthenticated, IsCustomerUser]
+    
+    def post(self, request):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        
+        with transaction.atomic():
+            orders = serializer.save()
+            record_orders_created(orders)
+        for order in orders:
+            publish_order_event(order, 'order.created')
+        
+        return Response(serializer.to_representation(orders), status=status.HTTP_201_CREATED)
 
 
 class OrderDetailView(generics.RetrieveUpdateDestroyAPIView):
     """API view for retrieving, updating, or deleting a single order"""
     
-    queryset = Orders.objects.all().select_related('customer__user', 'business__user')
+    queryset = Orders.objects.all().select_related('customer__user', 'business__user', 'features_snapshot')
     serializer_class = OrderListSerializer
     permission_classes = [IsAuthenticated, IsOrderParticipant]
     
@@ -43,6 +110,311 @@ class OrderDetailView(generics.RetrieveUpdateDestroyAPIView):
         if self.request.method in ['PATCH', 'PUT']:
             return OrderUpdateSerializer
         return OrderListSerializer
+    
+    def get_object(self):
+        """Fall back to the archive for reads with ?include_archived=true; archived orders are read-only"""
+        
+        try:
+            return super().get_object()
+        except Http404:
+            if self.request.method != 'GET' or not include_archived(self.request):
+                raise
+        
+        archived_order = get_object_or_404(
+            ArchivedOrders.objects.select_related('customer__user', 'business__user', 'features_snapshot'), pk=self.kwargs['pk']
+        )
+        self.check_object_permissions(self.request, archived_order)
+        return archived_order
+    
+    def perform_update(self, serializer):
+        previous_status = serializer.instance.status
+        with transaction.atomic():
+            order = serializer.save()
+            record_status_change(order, previous_status)
+        if order.status != previous_status:
+            publish_order_event(order, 'order.status_changed')
+    
+    def perform_destroy(self, instance):
+        """Delete the order and leave a tombstone for the change feed"""
+        
+        with transaction.atomic():
+            OrderTombstone.objects.create(
+                order_id=instance.id,
+                customer_id=instance.customer_id,
+                business_id=instance.business_id
+            )
+            record_order_deleted(instance)
+            instance.delete()
+
+
+class OrderQueuePagination(PageNumberPagination):
+    """Pagination for business work queues"""
+    
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+
+class OrderQueueView(generics.ListAPIView):
+    """API view for a business's in-progress orders sorted by due date, either upcoming or overdue"""
+    
+    serializer_class = OrderQueueSerializer
+    permission_classes = [IsAuthenticated, IsBusinessUser]
+    pagination_class = OrderQueuePagination
+    overdue = False
+    
+    def get_queryset(self):
+        """Range scan on the (business, status, due_at) index"""
+        
+        now = timezone.now()
+        due_filter = Q(due_at__lt=now) if self.overdue else Q(due_at__gte=now)
+        return Orders.objects.filter(
+            due_filter, business=self.request.user.profile, status='in_progress'
+        ).select_related('customer__user', 'business__user').prefetch_related('features_snapshot').order_by('due_at', 'id')
+    
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['now'] = timezone.now()
+        return context
+
+
+class OrderChangesView(APIView):
+    """
+    API view for incrementally syncing orders created, updated or deleted after a cursor.
+    
+    updated_at is taken from the app server's clock at save time, so a transaction can commit
+    after a reader has already moved past its timestamp. Rows only enter the feed once they are
+    ORDER_CHANGES['SAFETY_LAG_SECONDS'] old, by which time such writes have committed.
+    """
+    
+    permission_classes = [IsAuthenticated, HasProfile]
+    default_limit = 100
+    max_limit = 500
+    
+    def get(self, request):
+        """Return the next batch of changes for orders the user participates in"""
+        
+        user_profile = request.user.profile
+        limit = self.get_limit(request)
+        cursor, updated_since = self.get_cursor(request)
+        participant = Q(customer=user_profile) | Q(business=user_profile)
+        
+        settled_before = timezone.now() - timedelta(seconds=settings.ORDER_CHANGES['SAFETY_LAG_SECONDS'])
+        orders = Orders.objects.filter(participant, updated_at__lt=settled_before)
+        if cursor.updated_at:
+            orders = orders.filter(
+                Q(updated_at__gt=cursor.updated_at) | Q(updated_at=cursor.updated_at, id__gt=cursor.order_id)
+            )
+        orders = list(
+            orders.select_related('customer__user', 'business__user').prefetch_related('features_snapshot')
+            .order_by('updated_at', 'id')[:limit + 1]
+        )
+        
+        tombstones = OrderTombstone.objects.filter(participant, id__gt=cursor.tombstone_id, deleted_at__lt=settled_before)
+        if updated_since:
+            tombstones = tombstones.filter(deleted_at__gte=updated_since)
+        tombstones = list(tombstones.order_by('id')[:limit + 1])
+        
+        has_more = len(orders) > limit or len(tombstones) > limit
+        orders, tombstones = orders[:limit], tombstones[:limit]
+        
+        if orders:
+            cursor.updated_at, cursor.order_id = orders[-1].updated_at, orders[-1].id
+        if tombstones:
+            cursor.tombstone_id = tombstones[-1].id
+        
+        return Response({
+            'orders': OrderListSerializer(orders, many=True).data,
+            'deleted': OrderTombstoneSerializer(tombstones, many=True).data,
+            'next_cursor': cursor.encode(),
+            'has_more': has_more,
+        }, status=status.HTTP_200_OK)
+    
+    def get_limit(self, request):
+        """Read the page size from ?limit=, capped at max_limit"""
+        
+        try:
+            limit = int(request.query_params.get('limit', self.default_limit))
+        except ValueError:
+            raise ValidationError({"limit": "A valid integer is required."})
+        if limit < 1:
+            raise ValidationError({"limit": "Ensure this value is greater than or equal to 1."})
+        return min(limit, self.max_limit)
+    
+    def get_cursor(self, request):
+        """Start from ?cursor= if given, otherwise from ?updated_since= or the beginning"""
+        
+        token = request.query_params.get('cursor')
+        if token:
+            return ChangeFeedCursor.decode(token), None
+        
+        since = request.query_params.get('updated_since')
+        if since:
+            try:
+                updated_since = parse_datetime(since)
+            except ValueError:
+                updated_since = None
+            if updated_since is None:
+                raise ValidationError({"updated_since": "Datetime has wrong format. Use ISO 8601."})
+            return ChangeFeedCursor(updated_at=updated_since), updated_since
+        
+        return ChangeFeedCursor(), None
+
+
+class OrderEventTicketView(APIView):
+    """API view issuing a short-lived, single-use ticket for opening the order event stream"""
+    
+    permission_classes = [IsAuthenticated]
+    
+    def post(self, request):
+        ticket = issue_stream_ticket(request.user.id)
+        return Response(
+            {"ticket": ticket, "expires_in": event_settings().get('TICKET_SECONDS', 30)},
+            status=status.HTTP_201_CREATED
+        )
+
+
+class OrderEventStreamView(View):
+    """
+    Server-Sent Events stream of create/status events for the user's orders.
+    Async view: under ASGI each idle connection is a suspended coroutine, not a blocked thread.
+    """
+    
+    async def get(self, request):
+        try:
+            user_id = await self.authenticate(request)
+        except AuthenticationFailed as exc:
+            return JsonResponse({'detail': str(exc.detail)}, status=status.HTTP_401_UNAUTHORIZED)
+        
+        response = StreamingHttpResponse(self.stream(user_id), content_type='text/event-stream')
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'
+        return response
+    
+    async def authenticate(self, request):
+        """User id from the Authorization header or a ?ticket= from OrderEventTicketView (EventSource cannot set headers)"""
+        
+        keyword, _, key = request.headers.get('Authorization', '').partition(' ')
+        if keyword == CachedTokenAuthentication.keyword and key:
+            user, _ = await sync_to_async(CachedTokenAuthentication().authenticate_credentials)(key)
+            return user.id
+        
+        ticket = request.GET.get('ticket')
+        if not ticket:
+            raise AuthenticationFailed('Authentication credentials were not provided.')
+        user_id = await redeem_stream_ticket(ticket)
+        if user_id is None:
+            raise AuthenticationFailed('Invalid or expired ticket.')
+        return user_id
+    
+    async def stream(self, user_id):
+        keepalive_seconds = event_settings().get('KEEPALIVE_SECONDS', 15)
+        subscription = get_event_backend().subscribe([user_channel(user_id)])
+        try:
+            yield f"retry: {keepalive_seconds * 1000}\n\n"
+            while True:
+                event = await subscription.get(timeout=keepalive_seconds)
+                if event is None:
+                    yield ": keepalive\n\n"
+                else:
+                    yield f"event: {event['type']}\ndata: {json.dumps(event['order'])}\n\n"
+        finally:
+            subscription.close()
+
+
+class Echo:
+    """Pseudo-buffer for csv.writer that returns each written line instead of storing it"""
+    
+    def write(self, value):
+        return value
+
+
+class OrderExportView(APIView):
+    """API view streaming all orders of the user as NDJSON or CSV with constant memory"""
+    
+    permission_classes = [IsAuthenticated]
+    chunk_size = 2000
+    columns = [
+        'id', 'customer_user', 'business_user', 'title', 'revisions', 'delivery_time_in_days',
+        'price', 'features', 'offer_type', 'status', 'created_at', 'updated_at'
+    ]
+    
+    def get(self, request):
+        """Stream orders filtered by ?created_after= / ?created_before= in ?export_format=ndjson|csv"""
+        
+        export_format = request.query_params.get('export_format', 'ndjson')
+        if export_format not in ['ndjson', 'csv']:
+            raise ValidationError({"export_format": "Must be 'ndjson' or 'csv'."})
+        
+        user_profile = request.user.profile
+        filters = Q(customer=user_profile) | Q(business=user_profile)
+        created_after = self.parse_bound(request, 'created_after')
+        created_before = self.parse_bound(request, 'created_before', end_of_day=True)
+        if created_after:
+            filters &= Q(created_at__gte=created_after)
+        if created_before:
+            filters &= Q(created_at__lt=created_before)
+        
+        models = [Orders, ArchivedOrders] if include_archived(request) else [Orders]
+        rows = (row for model in models for row in self.iter_rows(model, filters))
+        
+        # Under ASGI the lines are rendered chunk_size at a time in a worker thread instead of all at once.
+        if export_format == 'csv':
+            content = streaming_content(request, self.render_csv(rows), self.chunk_size)
+            response = StreamingHttpResponse(content, content_type='text/csv')
+        else:
+            content = streaming_content(request, self.render_ndjson(rows), self.chunk_size)
+            response = StreamingHttpResponse(content, content_type='application/x-ndjson')
+        response['Content-Disposition'] = f'attachment; filename="orders.{export_format}"'
+        return response
+    
+    def iter_rows(self, model, filters):
+        """Read plain value rows in chunks, resolving each chunk's feature snapshots with one lookup"""
+        
+        fields = [column for column in self.columns if column not in ['customer_user', 'business_user', 'features']]
+        queryset = model.objects.filter(filters).order_by('id').values(
+            *fields, 'features_snapshot_id', customer_user=F('customer__user_id'), business_user=F('business__user_id')
+        )
+        rows = queryset.iterator(chunk_size=self.chunk_size)
+        while chunk := list(islice(rows, self.chunk_size)):
+            ids = {row['features_snapshot_id'] for row in chunk}
+            features = dict(FeatureSnapshot.objects.filter(id__in=ids).values_list('id', 'features'))
+            for row in chunk:
+                row['features'] = features[row['features_snapshot_id']]
+                yield {column: row[column] for column in self.columns}
+    
+    def render_ndjson(self, rows):
+        for row in rows:
+            yield json.dumps(row, cls=DjangoJSONEncoder) + '\n'
+    
+    def render_csv(self, rows):
+        writer = csv.writer(Echo())
+        yield writer.writerow(self.columns)
+        for row in rows:
+            row['features'] = json.dumps(row['features'])
+            yield writer.writerow(row.values())
+    
+    def parse_bound(self, request, name, end_of_day=False):
+        """Parse an ISO date or datetime; a plain date as upper bound includes that whole day"""
+        
+        value = request.query_params.get(name)
+        if not value:
+            return None
+        
+        try:
+            day = parse_date(value)
+            if day is not None:
+                parsed = datetime.combine(day + timedelta(days=1) if end_of_day else day, time.min)
+            else:
+                parsed = parse_datetime(value)
+        except ValueError:
+            parsed = None
+        if parsed is None:
+            raise ValidationError({name: "Date has wrong format. Use ISO 8601."})
+        
+        if timezone.is_naive(parsed):
+            parsed = timezone.make_aware(parsed)
+        return parsed
 
 
 class OrderCountView(APIView):
@@ -77,6 +449,61 @@ class CompletedOrderCountView(APIView):
             raise NotFound("No business user matching the specified ID was found.")
         
         order_count = Orders.objects.filter(business__user__id=business_user_id, status='completed').count()
+        order_count += ArchivedOrders.objects.filter(business__user__id=business_user_id, status='completed').count()
         
         return Response({'completed_order_count': order_count}, status=status.HTTP_200_OK)
-    
\ No newline at end of file
+
+
+class OrderStatsView(APIView):
+    """API view for a business's orders and revenue per day, week or month, summed from daily rollups"""
+    
+    permission_classes = [IsAuthenticated]
+    periods = {
+        'day': F('day'),
+        'week': TruncWeek('day'),
+        'month': TruncMonth('day'),
+    }
+    default_days = 30
+    
+    def get(self, request, business_user_id):
+        """Get order counts and revenue grouped by period, status and offer type"""
+        
+        if not User.objects.filter(id=business_user_id).exists():
+            raise NotFound("No business user matching the specified ID was found.")
+        if request.user.id != business_user_id and not request.user.is_staff:
+            raise PermissionDenied("You can only view statistics of your own business.")
+        
+        interval = request.query_params.get('interval', 'day')
+        if interval not in self.periods:
+            raise ValidationError({"interval": "Must be one of 'day', 'week' or 'month'."})
+        end = self.parse_day(request, 'end') or timezone.localdate()
+        start = self.parse_day(request, 'start') or end - timedelta(days=self.default_days - 1)
+        
+        buckets = OrderDailyStats.objects.filter(business__user_id=business_user_id, day__range=(start, end))
+        for name in ['status', 'offer_type']:
+            if request.query_params.get(name):
+                buckets = buckets.filter(**{name: request.query_params[name]})
+        
+        rows = buckets.annotate(period=self.periods[interval]).values('period', 'status', 'offer_type').annotate(
+            order_count=Sum('order_count'), revenue=Sum('revenue')
+        ).order_by('period', 'status', 'offer_type')
+        
+        return Response({
+            'business_user': business_user_id,
+            'interval': interval,
+            'start': start,
+            'end': end,
+            'buckets': OrderStatsBucketSerializer(rows, many=True).data,
+        }, status=status.HTTP_200_OK)
+    
+    def parse_day(self, request, name):
+        value = request.query_params.get(name)
+        if not value:
+            return None
+        try:
+            day = parse_date(value)
+        except ValueError:
+            day = None
+        if day is None:
+            raise ValidationError({name: "Date has wrong format. Use YYYY-MM-DD."})
+        return day
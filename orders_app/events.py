@@ -0,0 +1,214 @@
+import json
+import time
+import asyncio
+import logging
+import secrets
+import threading
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import transaction
+from django.core.cache import cache
+from django.utils.module_loading import import_string
+
+
+logger = logging.getLogger(__name__)
+
+
+def event_settings():
+    return getattr(settings, 'ORDER_EVENTS', {})
+
+
+class Subscription:
+    """Queue of events for one stream connection, fed from any thread and consumed on its event loop"""
+
+    def __init__(self, backend, channels, loop, max_queue_size):
+        self.backend = backend
+        self.channels = channels
+        self.loop = loop
+        self.queue = asyncio.Queue(maxsize=max_queue_size)
+
+    def deliver(self, event):
+        """Hand an event over to the subscriber's event loop (thread-safe)"""
+
+        try:
+            self.loop.call_soon_threadsafe(self._put, event)
+        except RuntimeError:
+            pass
+
+    def _put(self, event):
+        """Enqueue the event, dropping the oldest one if a slow client fell behind"""
+
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(event)
+
+    async def get(self, timeout=None):
+        """Wait for the next event, returning None when the timeout passes first"""
+
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self):
+        self.backend.unsubscribe(self)
+
+
+class InMemoryEventBackend:
+    """Process-local pub/sub: events reach only subscribers connected to the same worker"""
+
+    def __init__(self, max_queue_size=100):
+        self.max_queue_size = max_queue_size
+        self._subscriptions = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def publish(self, channel, event):
+        """Fan an event out to every local subscriber of the channel"""
+
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(channel, ()))
+        for subscription in subscriptions:
+            subscription.deliver(event)
+
+    def subscribe(self, channels):
+        """Register a subscription for the given channels on the running event loop"""
+
+        subscription = Subscription(self, channels, asyncio.get_running_loop(), self.max_queue_size)
+        with self._lock:
+            for channel in channels:
+                self._subscriptions[channel].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            for channel in subscription.channels:
+                subscribers = self._subscriptions.get(channel)
+                if subscribers is not None:
+                    subscribers.discard(subscription)
+                    if not subscribers:
+                        del self._subscriptions[channel]
+
+
+class RedisEventBackend(InMemoryEventBackend):
+    """
+    Pub/sub shared between workers through Redis (requires the ``redis`` package).
+    Each worker keeps a single Redis subscription and fans events out to its local connections.
+    When Redis fails the listener resubscribes, waiting reconnect_delay seconds and doubling
+    the wait up to max_reconnect_delay while it keeps failing.
+    """
+
+    def __init__(self, url='redis://localhost:6379/0', prefix='coderr:orders:', max_queue_size=100,
+                 reconnect_delay=0.5, max_reconnect_delay=30):
+        super().__init__(max_queue_size=max_queue_size)
+        import redis
+
+        self.prefix = prefix
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self._errors = (redis.RedisError, OSError)
+        self._client = redis.Redis.from_url(url)
+        self._listener = None
+        self._listener_lock = threading.Lock()
+
+    def publish(self, channel, event):
+        self._client.publish(self.prefix + channel, json.dumps(event))
+
+    def subscribe(self, channels):
+        self._ensure_listener()
+        return super().subscribe(channels)
+
+    def _ensure_listener(self):
+        """Start the background thread relaying Redis messages to local subscribers"""
+
+        with self._listener_lock:
+            if self._listener is None or not self._listener.is_alive():
+                self._listener = threading.Thread(target=self._listen, name='order-events-redis', daemon=True)
+                self._listener.start()
+
+    def _listen(self):
+        delay = self.reconnect_delay
+        while True:
+            pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+            try:
+                pubsub.psubscribe(self.prefix + '*')
+                delay = self.reconnect_delay
+                for message in pubsub.listen():
+                    channel = message['channel'].decode()[len(self.prefix):]
+                    super().publish(channel, json.loads(message['data']))
+            except self._errors:
+                logger.warning("Order event subscription lost, resubscribing in %s seconds", delay, exc_info=True)
+            finally:
+                pubsub.close()
+            time.sleep(delay)
+            delay = min(delay * 2, self.max_reconnect_delay)
+
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_event_backend():
+    """Return the process-wide event backend configured in settings.ORDER_EVENTS"""
+
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            config = event_settings()
+            backend_class = import_string(config.get('BACKEND', 'orders_app.events.InMemoryEventBackend'))
+            _backend = backend_class(**config.get('OPTIONS', {}))
+        return _backend
+
+
+def user_channel(user_id):
+    return f"user:{user_id}"
+
+
+def stream_ticket_key(ticket):
+    return f'orders:events:ticket:{ticket}'
+
+
+def issue_stream_ticket(user_id):
+    """
+    Random single-use ticket that opens the user's event stream for TICKET_SECONDS.
+
+    EventSource cannot send an Authorization header, so the stream URL carries this ticket
+    instead of the long-lived API token, which would end up in proxy and access logs.
+    """
+
+    ticket = secrets.token_urlsafe(32)
+    cache.set(stream_ticket_key(ticket), user_id, event_settings().get('TICKET_SECONDS', 30))
+    return ticket
+
+
+async def redeem_stream_ticket(ticket):
+    """User id of a valid ticket, which is deleted so it cannot be used again; None otherwise"""
+
+    key = stream_ticket_key(ticket)
+    user_id = await cache.aget(key)
+    if user_id is None or not await cache.adelete(key):
+        return None
+    return user_id
+
+
+def publish_order_event(order, event_type):
+    """Notify the order's customer and business once the current transaction commits"""
+
+    event = {
+        'type': event_type,
+        'order': {
+            'id': order.id,
+            'customer_user': order.customer.user_id,
+            'business_user': order.business.user_id,
+            'status': order.status,
+            'updated_at': order.updated_at.isoformat(),
+        },
+    }
+    channels = {user_channel(order.customer.user_id), user_channel(order.business.user_id)}
+
+    def send():
+        backend = get_event_backend()
+        for channel in channels:
+            backend.publish(channel, event)
+
+    transaction.on_commit(send, robust=True)
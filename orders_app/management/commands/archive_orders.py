@@ -0,0 +1,43 @@
+from datetime import timedelta
+
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from django.core.management.base import BaseCommand, CommandError
+
+from orders_app.models import Orders, ArchivedOrders
+
+
+class Command(BaseCommand):
+    """Move completed and cancelled orders untouched for a while from Orders into ArchivedOrders in batches"""
+
+    help = "Archive completed and cancelled orders older than --older-than-days in batches of --batch-size."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--older-than-days', type=int, default=90, help="Only archive orders not updated for this many days.")
+        parser.add_argument('--batch-size', type=int, default=1000, help="Number of orders moved per transaction.")
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError("--batch-size must be at least 1.")
+
+        cutoff = timezone.now() - timedelta(days=options['older_than_days'])
+        candidates = Orders.objects.filter(status__in=Orders.TERMINAL_STATUSES, updated_at__lt=cutoff).order_by('id')
+        fields = [field.attname for field in ArchivedOrders._meta.concrete_fields if field.name != 'archived_at']
+
+        archived = 0
+        while True:
+            try:
+                with transaction.atomic():
+                    rows = list(candidates.select_for_update().values(*fields)[:options['batch_size']])
+                    if not rows:
+                        break
+                    # No ignore_conflicts: a row that cannot be archived must keep its hot-table row.
+                    ArchivedOrders.objects.bulk_create([ArchivedOrders(**row) for row in rows])
+                    Orders.objects.filter(id__in=[row['id'] for row in rows]).delete()
+            except IntegrityError as exc:
+                ids = ', '.join(str(row['id']) for row in rows)
+                raise CommandError(f"Could not archive orders {ids}, the batch was rolled back: {exc}")
+            archived += len(rows)
+            self.stdout.write(f"Archived {archived} orders...")
+
+        self.stdout.write(self.style.SUCCESS(f"Archived {archived} orders in total."))
@@ -0,0 +1,78 @@
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import connections, transaction
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDate
+from django.core.management.base import BaseCommand, CommandError
+
+from orders_app.models import Orders, ArchivedOrders, OrderDailyStats
+
+
+class Command(BaseCommand):
+    """Rebuild the daily order rollups from Orders and ArchivedOrders, one chunk of businesses per task"""
+
+    help = (
+        "Rebuild OrderDailyStats from scratch. Businesses are processed in chunks of --chunk-size "
+        "on --workers threads; run it while order writes are paused."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=100, help="Number of businesses per chunk.")
+        parser.add_argument('--workers', type=int, default=4, help="Number of chunks processed in parallel.")
+
+    def handle(self, *args, **options):
+        if options['chunk_size'] < 1 or options['workers'] < 1:
+            raise CommandError("--chunk-size and --workers must be at least 1.")
+
+        business_ids = sorted(
+            set(Orders.objects.values_list('business_id', flat=True).distinct())
+            | set(ArchivedOrders.objects.values_list('business_id', flat=True).distinct())
+        )
+        chunk_size = options['chunk_size']
+        chunks = [business_ids[i:i + chunk_size] for i in range(0, len(business_ids), chunk_size)]
+
+        with transaction.atomic():
+            OrderDailyStats.objects.exclude(business_id__in=business_ids).delete()
+
+        if options['workers'] == 1:
+            buckets = sum(self.rebuild_chunk(chunk) for chunk in chunks)
+        else:
+            with ThreadPoolExecutor(max_workers=options['workers']) as executor:
+                buckets = sum(executor.map(self.rebuild_chunk_in_thread, chunks))
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {buckets} buckets for {len(business_ids)} businesses."))
+
+    def rebuild_chunk_in_thread(self, business_ids):
+        try:
+            return self.rebuild_chunk(business_ids)
+        finally:
+            connections.close_all()
+
+    def rebuild_chunk(self, business_ids):
+        """Aggregate the chunk's orders per day and replace its buckets in one transaction"""
+
+        totals = defaultdict(lambda: [0, 0])
+        for model in [Orders, ArchivedOrders]:
+            rows = model.objects.filter(business_id__in=business_ids).annotate(
+                day=TruncDate('created_at')
+            ).values('business_id', 'day', 'status', 'offer_type').annotate(
+                order_count=Count('id'), revenue=Sum('price')
+            ).order_by()
+            for row in rows:
+                key = (row['business_id'], row['day'], row['status'], row['offer_type'])
+                totals[key][0] += row['order_count']
+                totals[key][1] += row['revenue']
+
+        with transaction.atomic():
+            OrderDailyStats.objects.filter(business_id__in=business_ids).delete()
+            OrderDailyStats.objects.bulk_create([
+                OrderDailyStats(
+                    business_id=business_id, day=day, status=status, offer_type=offer_type,
+                    order_count=order_count, revenue=revenue
+                )
+                for (business_id, day, status, offer_type), (order_count, revenue) in totals.items()
+            ])
+
+        self.stdout.write(f"Rebuilt {len(totals)} buckets for {len(business_ids)} businesses.")
+        return len(totals)
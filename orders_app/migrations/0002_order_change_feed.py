@@ -0,0 +1,50 @@
+# Generated by Django 6.0.1 on 2026-10-19 10:44
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers_app', '0003_remove_offer_max_delivery_time_and_more'),
+        ('orders_app', '0001_initial'),
+        ('profiles_app', '0004_remove_profile_email_remove_profile_first_name_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OrderTombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('order_id', models.BigIntegerField()),
+                ('deleted_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='orders',
+            index=models.Index(fields=['customer', 'updated_at', 'id'], name='orders_customer_feed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='orders',
+            index=models.Index(fields=['business', 'updated_at', 'id'], name='orders_business_feed_idx'),
+        ),
+        migrations.AddField(
+            model_name='ordertombstone',
+            name='business',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='profiles_app.profile'),
+        ),
+        migrations.AddField(
+            model_name='ordertombstone',
+            name='customer',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='profiles_app.profile'),
+        ),
+        migrations.AddIndex(
+            model_name='ordertombstone',
+            index=models.Index(fields=['customer', 'id'], name='tombstone_customer_feed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ordertombstone',
+            index=models.Index(fields=['business', 'id'], name='tombstone_business_feed_idx'),
+        ),
+    ]
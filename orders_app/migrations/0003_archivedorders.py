@@ -0,0 +1,38 @@
+# Generated by Django 6.0.1 on 2026-10-19 10:47
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers_app', '0003_remove_offer_max_delivery_time_and_more'),
+        ('orders_app', '0002_order_change_feed'),
+        ('profiles_app', '0004_remove_profile_email_remove_profile_first_name_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedOrders',
+            fields=[
+                ('status', models.CharField(choices=[('in_progress', 'In Progress'), ('completed', 'Completed'), ('cancelled', 'Cancelled')], default='in_progress', max_length=20)),
+                ('title', models.CharField(max_length=255)),
+                ('revisions', models.IntegerField(default=0)),
+                ('delivery_time_in_days', models.PositiveIntegerField()),
+                ('price', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('features', models.JSONField(default=list)),
+                ('offer_type', models.CharField(choices=[('basic', 'Basic'), ('standard', 'Standard'), ('premium', 'Premium')], default='standard', max_length=20)),
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+                ('business', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_business_orders', to='profiles_app.profile')),
+                ('customer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_customer_orders', to='profiles_app.profile')),
+                ('offer_detail', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='archived_orders', to='offers_app.offerdetail')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+    ]
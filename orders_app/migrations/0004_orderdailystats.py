@@ -0,0 +1,30 @@
+# Generated by Django 6.0.1 on 2026-10-19 10:50
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders_app', '0003_archivedorders'),
+        ('profiles_app', '0004_remove_profile_email_remove_profile_first_name_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OrderDailyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('status', models.CharField(max_length=20)),
+                ('offer_type', models.CharField(max_length=20)),
+                ('order_count', models.IntegerField(default=0)),
+                ('revenue', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('business', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='order_daily_stats', to='profiles_app.profile')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('business', 'day', 'status', 'offer_type'), name='unique_order_daily_bucket')],
+            },
+        ),
+    ]
@@ -0,0 +1,100 @@
+# Generated by Django 6.0.1 on 2026-10-19 11:05
+
+import json
+import hashlib
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def digest_for(features):
+    canonical = json.dumps(features, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def intern_features(apps, schema_editor):
+    """Point every order at a shared snapshot of its features list"""
+
+    FeatureSnapshot = apps.get_model('orders_app', 'FeatureSnapshot')
+    snapshot_ids = {}
+
+    for model_name in ['Orders', 'ArchivedOrders']:
+        model = apps.get_model('orders_app', model_name)
+        batch = []
+        for order in model.objects.only('id', 'features').iterator(chunk_size=2000):
+            digest = digest_for(order.features)
+            if digest not in snapshot_ids:
+                snapshot_ids[digest] = FeatureSnapshot.objects.get_or_create(
+                    digest=digest, defaults={'features': order.features}
+                )[0].id
+            order.features_snapshot_id = snapshot_ids[digest]
+            batch.append(order)
+            if len(batch) == 2000:
+                model.objects.bulk_update(batch, ['features_snapshot'])
+                batch = []
+        model.objects.bulk_update(batch, ['features_snapshot'])
+
+
+def restore_features(apps, schema_editor):
+    """Copy the snapshot contents back into each order row"""
+
+    FeatureSnapshot = apps.get_model('orders_app', 'FeatureSnapshot')
+    features = dict(FeatureSnapshot.objects.values_list('id', 'features'))
+
+    for model_name in ['Orders', 'ArchivedOrders']:
+        model = apps.get_model('orders_app', model_name)
+        batch = []
+        for order in model.objects.only('id', 'features_snapshot').iterator(chunk_size=2000):
+            order.features = features.get(order.features_snapshot_id, [])
+            batch.append(order)
+            if len(batch) == 2000:
+                model.objects.bulk_update(batch, ['features'])
+                batch = []
+        model.objects.bulk_update(batch, ['features'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders_app', '0004_orderdailystats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FeatureSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('digest', models.CharField(max_length=64, unique=True)),
+                ('features', models.JSONField(default=list)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='archivedorders',
+            name='features_snapshot',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='orders_app.featuresnapshot'),
+        ),
+        migrations.AddField(
+            model_name='orders',
+            name='features_snapshot',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='orders_app.featuresnapshot'),
+        ),
+        migrations.RunPython(intern_features, restore_features),
+        migrations.RemoveField(
+            model_name='archivedorders',
+            name='features',
+        ),
+        migrations.RemoveField(
+            model_name='orders',
+            name='features',
+        ),
+        migrations.AlterField(
+            model_name='archivedorders',
+            name='features_snapshot',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='+', to='orders_app.featuresnapshot'),
+        ),
+        migrations.AlterField(
+            model_name='orders',
+            name='features_snapshot',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='+', to='orders_app.featuresnapshot'),
+        ),
+    ]
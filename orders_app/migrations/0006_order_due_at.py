@@ -0,0 +1,57 @@
+# Generated by Django 6.0.1 on 2026-10-19 11:20
+
+from datetime import timedelta
+
+from django.db import migrations, models
+
+
+def derive_due_at(apps, schema_editor):
+    """Set due_at = created_at + delivery_time_in_days for existing orders"""
+
+    for model_name in ['Orders', 'ArchivedOrders']:
+        model = apps.get_model('orders_app', model_name)
+        batch = []
+        for order in model.objects.only('id', 'created_at', 'delivery_time_in_days').iterator(chunk_size=2000):
+            order.due_at = order.created_at + timedelta(days=order.delivery_time_in_days)
+            batch.append(order)
+            if len(batch) == 2000:
+                model.objects.bulk_update(batch, ['due_at'])
+                batch = []
+        model.objects.bulk_update(batch, ['due_at'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers_app', '0003_remove_offer_max_delivery_time_and_more'),
+        ('orders_app', '0005_featuresnapshot'),
+        ('profiles_app', '0004_remove_profile_email_remove_profile_first_name_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='archivedorders',
+            name='due_at',
+            field=models.DateTimeField(null=True),
+        ),
+        migrations.AddField(
+            model_name='orders',
+            name='due_at',
+            field=models.DateTimeField(null=True),
+        ),
+        migrations.RunPython(derive_due_at, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='archivedorders',
+            name='due_at',
+            field=models.DateTimeField(),
+        ),
+        migrations.AlterField(
+            model_name='orders',
+            name='due_at',
+            field=models.DateTimeField(),
+        ),
+        migrations.AddIndex(
+            model_name='orders',
+            index=models.Index(fields=['business', 'status', 'due_at'], name='orders_business_due_idx'),
+        ),
+    ]
@@ -1,24 +1,165 @@
+import json
+import hashlib
+from datetime import timedelta
+
 from django.db import models
+from django.utils import timezone
 
 
-class Orders(models.Model):
-    """Model representing an order placed by a customer for a specific offer detail."""
+class FeatureSnapshot(models.Model):
+    """Model storing each distinct features list copied into orders once, keyed by its content hash."""
     
-    offer_detail = models.ForeignKey('offers_app.OfferDetail', on_delete=models.PROTECT, related_name='orders')
-    customer = models.ForeignKey('profiles_app.Profile', on_delete=models.CASCADE, related_name='customer_orders')
-    business = models.ForeignKey('profiles_app.Profile', on_delete=models.CASCADE, related_name='business_orders')
+    digest = models.CharField(max_length=64, unique=True)
+    features = models.JSONField(default=list)
+    
+    @staticmethod
+    def digest_for(features):
+        """SHA-256 of the canonical JSON encoding, so equal lists always share a digest"""
+        
+        canonical = json.dumps(features, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+        return hashlib.sha256(canonical.encode()).hexdigest()
+    
+    @classmethod
+    def intern(cls, features):
+        """Return the snapshot for these features, creating it only if it was never stored"""
+        
+        return cls.intern_many([features])[0]
+    
+    @classmethod
+    def intern_many(cls, feature_lists):
+        """Intern several lists with one lookup and at most one insert, returned in input order"""
+        
+        by_digest = {cls.digest_for(features): features for features in feature_lists}
+        snapshots = {snapshot.digest: snapshot for snapshot in cls.objects.filter(digest__in=by_digest)}
+        missing = [cls(digest=digest, features=features) for digest, features in by_digest.items() if digest not in snapshots]
+        if missing:
+            cls.objects.bulk_create(missing, ignore_conflicts=True)
+            snapshots.update(
+                (snapshot.digest, snapshot)
+                for snapshot in cls.objects.filter(digest__in=[snapshot.digest for snapshot in missing])
+            )
+        return [snapshots[cls.digest_for(features)] for features in feature_lists]
+    
+    def __str__(self):
+        return f"Features {self.digest[:12]}"
+
+
+class OrderSnapshot(models.Model):
+    """Abstract base with the order status and the offer detail data copied at purchase time."""
     
-    created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
     status = models.CharField(max_length=20, choices=[('in_progress', 'In Progress'), ('completed', 'Completed'), ('cancelled', 'Cancelled')], default='in_progress')
 
     title = models.CharField(max_length=255)
     revisions = models.IntegerField(default=0)
     delivery_time_in_days = models.PositiveIntegerField()
     price = models.DecimalField(max_digits=10, decimal_places=2)
-    features = models.JSONField(default=list)
+    features_snapshot = models.ForeignKey(FeatureSnapshot, on_delete=models.PROTECT, related_name='+')
     offer_type = models.CharField(max_length=20, choices=[('basic', 'Basic'), ('standard', 'Standard'), ('premium', 'Premium')], default='standard')
+    due_at = models.DateTimeField()
+    
+    _pending_features = None
+    
+    class Meta:
+        abstract = True
+    
+    @property
+    def features(self):
+        """Features list of the order, stored once per distinct content in FeatureSnapshot"""
+        
+        if self._pending_features is not None:
+            return self._pending_features
+        if self.features_snapshot_id is None:
+            return []
+        return self.features_snapshot.features
+    
+    @features.setter
+    def features(self, value):
+        self._pending_features = list(value)
+    
+    def save(self, *args, **kwargs):
+        """Intern features assigned since the last save and derive due_at if missing before writing the row"""
+        
+        if self.due_at is None:
+            self.due_at = (self.created_at or timezone.now()) + timedelta(days=self.delivery_time_in_days)
+        if self._pending_features is not None or self.features_snapshot_id is None:
+            self.features_snapshot = FeatureSnapshot.intern(self.features)
+            self._pending_features = None
+        super().save(*args, **kwargs)
+
+
+class Orders(OrderSnapshot):
+    """Model representing an order placed by a customer for a specific offer detail."""
+    
+    TERMINAL_STATUSES = ['completed', 'cancelled']
+    
+    offer_detail = models.ForeignKey('offers_app.OfferDetail', on_delete=models.PROTECT, related_name='orders')
+    customer = models.ForeignKey('profiles_app.Profile', on_delete=models.CASCADE, related_name='customer_orders')
+    business = models.ForeignKey('profiles_app.Profile', on_delete=models.CASCADE, related_name='business_orders')
+    
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        """Indexes serve the change feed (participant, updated_at, id) and the business work queues (business, status, due_at)."""
+        
+        indexes = [
+            models.Index(fields=['customer', 'updated_at', 'id'], name='orders_customer_feed_idx'),
+            models.Index(fields=['business', 'updated_at', 'id'], name='orders_business_feed_idx'),
+            models.Index(fields=['business', 'status', 'due_at'], name='orders_business_due_idx'),
+        ]
     
     def __str__(self):
         return f"Order {self.id} for {self.title} by {self.customer.user.username}"
-    
\ No newline at end of file
+
+
+class ArchivedOrders(OrderSnapshot):
+    """Model holding completed and cancelled orders moved out of Orders by the archive_orders command."""
+    
+    id = models.BigIntegerField(primary_key=True)
+    offer_detail = models.ForeignKey('offers_app.OfferDetail', on_delete=models.PROTECT, related_name='archived_orders')
+    customer = models.ForeignKey('profiles_app.Profile', on_delete=models.CASCADE, related_name='archived_customer_orders')
+    business = models.ForeignKey('profiles_app.Profile', on_delete=models.CASCADE, related_name='archived_business_orders')
+    
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+    
+    def __str__(self):
+        return f"Archived order {self.id} for {self.title}"
+
+
+class OrderDailyStats(models.Model):
+    """Model holding a business's order count and revenue per day, status and offer type."""
+    
+    business = models.ForeignKey('profiles_app.Profile', on_delete=models.CASCADE, related_name='order_daily_stats')
+    day = models.DateField()
+    status = models.CharField(max_length=20)
+    offer_type = models.CharField(max_length=20)
+    order_count = models.IntegerField(default=0)
+    revenue = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['business', 'day', 'status', 'offer_type'], name='unique_order_daily_bucket'),
+        ]
+    
+    def __str__(self):
+        return f"{self.order_count} {self.status} {self.offer_type} orders on {self.day}"
+
+
+class OrderTombstone(models.Model):
+    """Model recording a deleted order so change feed clients can drop it locally."""
+    
+    order_id = models.BigIntegerField()
+    customer = models.ForeignKey('profiles_app.Profile', on_delete=models.CASCADE, related_name='+')
+    business = models.ForeignKey('profiles_app.Profile', on_delete=models.CASCADE, related_name='+')
+    deleted_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        indexes = [
+            models.Index(fields=['customer', 'id'], name='tombstone_customer_feed_idx'),
+            models.Index(fields=['business', 'id'], name='tombstone_business_feed_idx'),
+        ]
+    
+    def __str__(self):
+        return f"Tombstone for order {self.order_id}"
@@ -0,0 +1,59 @@
+from collections import defaultdict
+
+from django.utils import timezone
+from django.db import IntegrityError, transaction
+from django.db.models import F
+
+from orders_app.models import OrderDailyStats
+
+
+def adjust_bucket(business_id, day, status, offer_type, count, revenue):
+    """Add count and revenue to a daily bucket, creating it on first use"""
+
+    bucket = OrderDailyStats.objects.filter(business_id=business_id, day=day, status=status, offer_type=offer_type)
+    if bucket.update(order_count=F('order_count') + count, revenue=F('revenue') + revenue):
+        return
+
+    try:
+        with transaction.atomic():
+            OrderDailyStats.objects.create(
+                business_id=business_id, day=day, status=status, offer_type=offer_type,
+                order_count=count, revenue=revenue
+            )
+    except IntegrityError:
+        bucket.update(order_count=F('order_count') + count, revenue=F('revenue') + revenue)
+
+
+def adjust_order(order, status, sign):
+    adjust_bucket(
+        order.business_id, timezone.localdate(order.created_at), status, order.offer_type,
+        sign, sign * order.price
+    )
+
+
+def record_order_created(order):
+    adjust_order(order, order.status, 1)
+
+
+def record_orders_created(orders):
+    """Add many new orders, touching each affected bucket once"""
+
+    buckets = defaultdict(lambda: [0, 0])
+    for order in orders:
+        bucket = buckets[(order.business_id, timezone.localdate(order.created_at), order.status, order.offer_type)]
+        bucket[0] += 1
+        bucket[1] += order.price
+    for (business_id, day, status, offer_type), (count, revenue) in buckets.items():
+        adjust_bucket(business_id, day, status, offer_type, count, revenue)
+
+
+def record_status_change(order, previous_status):
+    """Move the order from its previous status bucket into the current one"""
+
+    if order.status != previous_status:
+        adjust_order(order, previous_status, -1)
+        adjust_order(order, order.status, 1)
+
+
+def record_order_deleted(order):
+    adjust_order(order, order.status, -1)
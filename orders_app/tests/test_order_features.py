@@ -0,0 +1,141 @@
+from django.db import connection
+from django.urls import reverse
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth.models import User
+
+from rest_framework.test import APITestCase
+from rest_framework.authtoken.models import Token
+
+from orders_app.models import Orders, FeatureSnapshot
+from profiles_app.models import Profile
+from offers_app.models import Offer, OfferDetail
+
+
+class OrderFeatureSnapshotTests(APITestCase):
+    """Tests for content-addressed storage of order features"""
+
+    def setUp(self):
+        """Create test data"""
+
+        self.customer_user = User.objects.create_user(
+            username="customer1",
+            email="customer@example.com",
+            password="password123"
+        )
+        self.customer_profile = Profile.objects.create(user=self.customer_user, type='customer')
+        self.customer_token = Token.objects.create(user=self.customer_user)
+
+        self.business_user = User.objects.create_user(
+            username="business1",
+            email="business1@example.com",
+            password="password123"
+        )
+        self.business_profile = Profile.objects.create(user=self.business_user, type='business')
+
+        self.offer = Offer.objects.create(
+            creator=self.business_profile,
+            title="Website Design",
+            description="Professional website design"
+        )
+        self.offer_detail = OfferDetail.objects.create(
+            offer=self.offer,
+            title="Basic Package",
+            revisions=3,
+            delivery_time_in_days=5,
+            price=150.00,
+            features=["Logo Design", "Visitenkarten"],
+            offer_type="basic"
+        )
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.customer_token.key)
+
+    def create_order(self):
+        response = self.client.post(reverse('orders-list-create'), {'offer_detail_id': self.offer_detail.id}, format='json')
+        return Orders.objects.get(id=response.data['id'])
+
+    def test_identical_features_are_stored_once(self):
+        """Test: Orders of the same tier share one snapshot row"""
+
+        first = self.create_order()
+        second = self.create_order()
+
+        self.assertEqual(FeatureSnapshot.objects.count(), 1)
+        self.assertEqual(first.features_snapshot_id, second.features_snapshot_id)
+        self.assertEqual(second.features, ["Logo Design", "Visitenkarten"])
+
+    def test_admin_edits_features_only_when_adding(self):
+        """Test: The add form takes a features list, the change form shows it read-only"""
+
+        admin_user = User.objects.create_superuser(username="admin", email="admin@example.com", password="password123")
+        self.client.force_login(admin_user)
+
+        response = self.client.post(reverse('admin:orders_app_orders_add'), {
+            'offer_detail': self.offer_detail.id, 'customer': self.customer_profile.id, 'business': self.business_profile.id,
+            'status': 'in_progress', 'title': "Basic Package", 'offer_type': 'basic', 'price': '150.00',
+            'delivery_time_in_days': 5, 'revisions': 3, 'features': '["SEO"]',
+        })
+        order = Orders.objects.get()
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(order.features, ["SEO"])
+
+        response = self.client.get(reverse('admin:orders_app_orders_change', args=[order.id]))
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('features', response.context['adminform'].form.fields)
+
+        response = self.client.post(reverse('admin:orders_app_orders_change', args=[order.id]), {'status': 'completed'})
+        order.refresh_from_db()
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual((order.status, order.features), ('completed', ["SEO"]))
+
+    def test_admin_adds_order_without_features(self):
+        """Test: An empty features list is accepted on the add form"""
+
+        admin_user = User.objects.create_superuser(username="admin", email="admin@example.com", password="password123")
+        self.client.force_login(admin_user)
+
+        for features in ['[]', '']:
+            response = self.client.post(reverse('admin:orders_app_orders_add'), {
+                'offer_detail': self.offer_detail.id, 'customer': self.customer_profile.id, 'business': self.business_profile.id,
+                'status': 'in_progress', 'title': "Basic Package", 'offer_type': 'basic', 'price': '150.00',
+                'delivery_time_in_days': 5, 'revisions': 3, 'features': features,
+            })
+            self.assertEqual(response.status_code, 302)
+
+        self.assertEqual([order.features for order in Orders.objects.all()], [[], []])
+
+    def test_digest_ignores_key_order_but_not_content(self):
+        """Test: The digest is computed from canonical JSON"""
+
+        self.assertEqual(FeatureSnapshot.digest_for([{'a': 1, 'b': 2}]), FeatureSnapshot.digest_for([{'b': 2, 'a': 1}]))
+        self.assertNotEqual(FeatureSnapshot.digest_for(["SEO"]), FeatureSnapshot.digest_for(["SEO", "Hosting"]))
+
+    def test_changed_features_get_new_snapshot(self):
+        """Test: Assigning other features interns a new snapshot without touching the shared one"""
+
+        first = self.create_order()
+        second = self.create_order()
+
+        second.features = ["Full Website"]
+        second.save()
+        first.refresh_from_db()
+
+        self.assertEqual(FeatureSnapshot.objects.count(), 2)
+        self.assertEqual(first.features, ["Logo Design", "Visitenkarten"])
+        self.assertEqual(Orders.objects.get(id=second.id).features, ["Full Website"])
+
+    def test_list_resolves_snapshots_in_one_query(self):
+        """Test: Listing more orders does not add snapshot queries"""
+
+        self.create_order()
+        url = reverse('orders-list-create')
+        with CaptureQueriesContext(connection) as few:
+            self.client.get(url)
+
+        for _ in range(3):
+            self.create_order()
+        with CaptureQueriesContext(connection) as many:
+            response = self.client.get(url)
+
+        self.assertEqual(len(many), len(few))
+        self.assertEqual(len(response.data), 4)
+        self.assertEqual(response.data[0]['features'], ["Logo Design", "Visitenkarten"])
@@ -0,0 +1,159 @@
+from io import StringIO
+from datetime import datetime, timezone
+
+from django.urls import reverse
+from django.core.management import call_command
+from django.contrib.auth.models import User
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework.authtoken.models import Token
+
+from orders_app.models import Orders, OrderDailyStats, OrderTombstone
+from profiles_app.models import Profile
+from offers_app.models import Offer, OfferDetail
+
+
+class OrderStatsTests(APITestCase):
+    """Tests for the daily order rollups and GET /api/order-stats/{business_user_id}/"""
+
+    def setUp(self):
+        """Create test data"""
+
+        self.customer_user = User.objects.create_user(
+            username="customer1",
+            email="customer@example.com",
+            password="password123"
+        )
+        self.customer_profile = Profile.objects.create(user=self.customer_user, type='customer')
+        self.customer_token = Token.objects.create(user=self.customer_user)
+
+        self.business_user = User.objects.create_user(
+            username="business1",
+            email="business1@example.com",
+            password="password123"
+        )
+        self.business_profile = Profile.objects.create(user=self.business_user, type='business')
+        self.business_token = Token.objects.create(user=self.business_user)
+
+        self.offer = Offer.objects.create(
+            creator=self.business_profile,
+            title="Website Design",
+            description="Professional website design"
+        )
+        self.offer_detail = OfferDetail.objects.create(
+            offer=self.offer,
+            title="Basic Package",
+            revisions=3,
+            delivery_time_in_days=5,
+            price=150.00,
+            features=["Logo Design", "Visitenkarten"],
+            offer_type="basic"
+        )
+
+    def create_order_via_api(self):
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.customer_token.key)
+        response = self.client.post(reverse('orders-list-create'), {'offer_detail_id': self.offer_detail.id}, format='json')
+        return response.data['id']
+
+    def bucket_counts(self):
+        return {
+            (bucket.status, bucket.offer_type): (bucket.order_count, bucket.revenue)
+            for bucket in OrderDailyStats.objects.filter(business=self.business_profile)
+        }
+
+    def test_rollups_follow_order_writes(self):
+        """Test: Creating orders and changing status keep the daily buckets up to date"""
+
+        order_id = self.create_order_via_api()
+        self.create_order_via_api()
+        self.assertEqual(self.bucket_counts(), {('in_progress', 'basic'): (2, 300)})
+
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.business_token.key)
+        self.client.patch(reverse('order-detail', kwargs={'pk': order_id}), {'status': 'completed'}, format='json')
+
+        self.assertEqual(self.bucket_counts(), {('in_progress', 'basic'): (1, 150), ('completed', 'basic'): (1, 150)})
+
+    def test_rollups_follow_admin_writes(self):
+        """Test: Status changes and deletes through the admin keep the daily buckets up to date"""
+
+        first_id = self.create_order_via_api()
+        second_id = self.create_order_via_api()
+        third_id = self.create_order_via_api()
+        admin_user = User.objects.create_superuser(username="admin", email="admin@example.com", password="password123")
+        self.client.force_login(admin_user)
+
+        self.client.post(reverse('admin:orders_app_orders_change', args=[first_id]), {'status': 'completed'})
+        self.assertEqual(self.bucket_counts(), {('in_progress', 'basic'): (2, 300), ('completed', 'basic'): (1, 150)})
+
+        self.client.post(reverse('admin:orders_app_orders_delete', args=[second_id]), {'post': 'yes'})
+        self.client.post(reverse('admin:orders_app_orders_changelist'), {
+            'action': 'delete_selected', '_selected_action': [third_id], 'post': 'yes'
+        })
+
+        self.assertEqual(self.bucket_counts(), {('in_progress', 'basic'): (0, 0), ('completed', 'basic'): (1, 150)})
+        self.assertEqual(set(OrderTombstone.objects.values_list('order_id', flat=True)), {second_id, third_id})
+
+    def test_stats_endpoint_sums_buckets_per_period(self):
+        """Test: Weekly intervals sum the daily buckets inside each week"""
+
+        for day, count in [(1, 2), (3, 1), (10, 4)]:
+            OrderDailyStats.objects.create(
+                business=self.business_profile, day=datetime(2024, 1, day).date(),
+                status='completed', offer_type='basic', order_count=count, revenue=count * 100
+            )
+
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.business_token.key)
+        url = reverse('order-stats', kwargs={'business_user_id': self.business_user.id})
+        response = self.client.get(url, {'start': '2024-01-01', 'end': '2024-01-31', 'interval': 'week'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [(bucket['period'], bucket['order_count'], bucket['revenue']) for bucket in response.data['buckets']],
+            [('2024-01-01', 3, '300.00'), ('2024-01-08', 4, '400.00')]
+        )
+
+        response = self.client.get(url, {'start': '2024-01-01', 'end': '2024-01-31', 'interval': 'month'})
+        self.assertEqual(response.data['buckets'][0]['order_count'], 7)
+
+    def test_stats_only_visible_to_business(self):
+        """Test: Other users cannot read a business's revenue, unknown users return 404"""
+
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.customer_token.key)
+
+        response = self.client.get(reverse('order-stats', kwargs={'business_user_id': self.business_user.id}))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        response = self.client.get(reverse('order-stats', kwargs={'business_user_id': 99999}))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_stats_invalid_interval(self):
+        """Test: Unknown intervals return 400"""
+
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.business_token.key)
+        response = self.client.get(reverse('order-stats', kwargs={'business_user_id': self.business_user.id}), {'interval': 'year'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_backfill_rebuilds_rollups(self):
+        """Test: The backfill command rebuilds buckets from existing orders"""
+
+        for order_status in ['completed', 'completed', 'cancelled']:
+            order = Orders.objects.create(
+                offer_detail=self.offer_detail,
+                customer=self.customer_profile,
+                business=self.business_profile,
+                title="Basic Package",
+                revisions=3,
+                delivery_time_in_days=5,
+                price=150.00,
+                features=["Logo Design", "Visitenkarten"],
+                offer_type="basic",
+                status=order_status
+            )
+            Orders.objects.filter(id=order.id).update(created_at=datetime(2024, 1, 1, 12, tzinfo=timezone.utc))
+
+        call_command('backfill_order_stats', workers=1, chunk_size=1, stdout=StringIO())
+
+        self.assertEqual(self.bucket_counts(), {('completed', 'basic'): (2, 300), ('cancelled', 'basic'): (1, 150)})
+        self.assertEqual(OrderDailyStats.objects.get(status='completed').day, datetime(2024, 1, 1).date())
@@ -0,0 +1,148 @@
+from io import StringIO
+from datetime import timedelta
+
+from django.urls import reverse
+from django.utils import timezone
+from django.core.management import call_command, CommandError
+from django.contrib.auth.models import User
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework.authtoken.models import Token
+
+from orders_app.models import Orders, ArchivedOrders
+from profiles_app.models import Profile
+from offers_app.models import Offer, OfferDetail
+
+
+class ArchiveOrdersTests(APITestCase):
+    """Tests for the archive_orders command and reading archived orders"""
+
+    def setUp(self):
+        """Create test data"""
+
+        self.customer_user = User.objects.create_user(
+            username="customer1",
+            email="customer@example.com",
+            password="password123"
+        )
+        self.customer_profile = Profile.objects.create(user=self.customer_user, type='customer')
+        self.customer_token = Token.objects.create(user=self.customer_user)
+
+        self.business_user = User.objects.create_user(
+            username="business1",
+            email="business1@example.com",
+            password="password123"
+        )
+        self.business_profile = Profile.objects.create(user=self.business_user, type='business')
+        self.business_token = Token.objects.create(user=self.business_user)
+
+        self.offer = Offer.objects.create(
+            creator=self.business_profile,
+            title="Website Design",
+            description="Professional website design"
+        )
+        self.offer_detail = OfferDetail.objects.create(
+            offer=self.offer,
+            title="Basic Package",
+            revisions=3,
+            delivery_time_in_days=5,
+            price=150.00,
+            features=["Logo Design", "Visitenkarten"],
+            offer_type="basic"
+        )
+
+        old = timezone.now() - timedelta(days=365)
+        self.old_completed = self.create_order('completed', updated_at=old)
+        self.old_cancelled = self.create_order('cancelled', updated_at=old)
+        self.old_in_progress = self.create_order('in_progress', updated_at=old)
+        self.recent_completed = self.create_order('completed')
+
+    def create_order(self, order_status, updated_at=None):
+        order = Orders.objects.create(
+            offer_detail=self.offer_detail,
+            customer=self.customer_profile,
+            business=self.business_profile,
+            title="Basic Package",
+            revisions=3,
+            delivery_time_in_days=5,
+            price=150.00,
+            features=["Logo Design", "Visitenkarten"],
+            offer_type="basic",
+            status=order_status
+        )
+        if updated_at:
+            Orders.objects.filter(id=order.id).update(updated_at=updated_at)
+        return order
+
+    def archive(self):
+        call_command('archive_orders', older_than_days=30, batch_size=1, stdout=StringIO())
+
+    def test_command_moves_old_terminal_orders(self):
+        """Test: Only old completed/cancelled orders are moved, keeping their data"""
+
+        self.archive()
+
+        self.assertEqual(
+            set(ArchivedOrders.objects.values_list('id', flat=True)),
+            {self.old_completed.id, self.old_cancelled.id}
+        )
+        self.assertEqual(
+            set(Orders.objects.values_list('id', flat=True)),
+            {self.old_in_progress.id, self.recent_completed.id}
+        )
+        archived = ArchivedOrders.objects.get(id=self.old_completed.id)
+        self.assertEqual(archived.features, ["Logo Design", "Visitenkarten"])
+        self.assertEqual(archived.created_at, self.old_completed.created_at)
+
+    def test_conflicting_archive_row_keeps_order(self):
+        """Test: An order whose id already exists in the archive is not deleted from the hot table"""
+
+        ArchivedOrders.objects.bulk_create([ArchivedOrders(**{
+            field.attname: getattr(self.old_completed, field.attname)
+            for field in ArchivedOrders._meta.concrete_fields if field.name != 'archived_at'
+        })])
+
+        with self.assertRaises(CommandError):
+            self.archive()
+
+        self.assertTrue(Orders.objects.filter(id=self.old_completed.id).exists())
+
+    def test_list_excludes_archived_by_default(self):
+        """Test: The order list only reads the hot table unless asked"""
+
+        self.archive()
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.customer_token.key)
+        url = reverse('orders-list-create')
+
+        response = self.client.get(url)
+        self.assertEqual(len(response.data), 2)
+
+        response = self.client.get(url, {'include_archived': 'true'})
+        self.assertEqual(len(response.data), 4)
+
+    def test_detail_reads_archive_when_requested(self):
+        """Test: An archived order is only found with include_archived and cannot be updated"""
+
+        self.archive()
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.business_token.key)
+        url = reverse('order-detail', kwargs={'pk': self.old_completed.id})
+
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_404_NOT_FOUND)
+
+        response = self.client.get(url, {'include_archived': 'true'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['status'], 'completed')
+        self.assertEqual(response.data['customer_user'], self.customer_user.id)
+
+        response = self.client.patch(url + '?include_archived=true', {'status': 'in_progress'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_completed_count_includes_archive(self):
+        """Test: Archiving does not change the completed order count"""
+
+        self.archive()
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.customer_token.key)
+        response = self.client.get(reverse('completed-order-count', kwargs={'business_user_id': self.business_user.id}))
+
+        self.assertEqual(response.data['completed_order_count'], 2)
@@ -0,0 +1,189 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.urls import reverse
+from django.utils import timezone
+from django.test import override_settings
+from django.contrib.auth.models import User
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework.authtoken.models import Token
+
+from orders_app.models import Orders, OrderTombstone
+from profiles_app.models import Profile
+from offers_app.models import Offer, OfferDetail
+
+
+@override_settings(ORDER_CHANGES={'SAFETY_LAG_SECONDS': 0})
+class GetOrderChangesTests(APITestCase):
+    """Tests for GET /api/orders/changes/, without the safety lag unless a test sets it"""
+
+    def setUp(self):
+        """Create test data"""
+
+        self.customer_user = User.objects.create_user(
+            username="customer1",
+            email="customer@example.com",
+            password="password123"
+        )
+        self.customer_profile = Profile.objects.create(user=self.customer_user, type='customer')
+        self.customer_token = Token.objects.create(user=self.customer_user)
+
+        self.business_user = User.objects.create_user(
+            username="business1",
+            email="business1@example.com",
+            password="password123"
+        )
+        self.business_profile = Profile.objects.create(user=self.business_user, type='business')
+        self.business_token = Token.objects.create(user=self.business_user)
+
+        self.admin_user = User.objects.create_user(
+            username="admin",
+            email="admin@example.com",
+            password="password123",
+            is_staff=True
+        )
+        self.admin_token = Token.objects.create(user=self.admin_user)
+
+        self.offer = Offer.objects.create(
+            creator=self.business_profile,
+            title="Website Design",
+            description="Professional website design"
+        )
+        self.offer_detail = OfferDetail.objects.create(
+            offer=self.offer,
+            title="Basic Package",
+            revisions=3,
+            delivery_time_in_days=5,
+            price=150.00,
+            features=["Logo Design", "Visitenkarten"],
+            offer_type="basic"
+        )
+
+        self.order1 = self.create_order("Basic Package")
+        self.order2 = self.create_order("Premium Package")
+        self.url = reverse('orders-changes')
+
+    def create_order(self, title):
+        return Orders.objects.create(
+            offer_detail=self.offer_detail,
+            customer=self.customer_profile,
+            business=self.business_profile,
+            title=title,
+            revisions=3,
+            delivery_time_in_days=5,
+            price=150.00,
+            features=["Logo Design", "Visitenkarten"],
+            offer_type="basic",
+            status="in_progress"
+        )
+
+    def test_initial_sync_returns_all_orders(self):
+        """Test: Without a cursor the feed returns every order of the user"""
+
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.customer_token.key)
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([order['id'] for order in response.data['orders']], [self.order1.id, self.order2.id])
+        self.assertEqual(response.data['deleted'], [])
+        self.assertFalse(response.data['has_more'])
+        self.assertIn('next_cursor', response.data)
+
+    @override_settings(ORDER_CHANGES={'SAFETY_LAG_SECONDS': 5})
+    def test_recent_writes_wait_for_the_safety_lag(self):
+        """Test: Rows younger than the safety lag are left for a later poll, so late commits are not skipped"""
+
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.customer_token.key)
+        response = self.client.get(self.url)
+        self.assertEqual(response.data['orders'], [])
+
+        later = timezone.now() + timedelta(seconds=6)
+        with mock.patch('orders_app.api.views.timezone.now', return_value=later):
+            response = self.client.get(self.url, {'cursor': response.data['next_cursor']})
+        self.assertEqual([order['id'] for order in response.data['orders']], [self.order1.id, self.order2.id])
+
+    def test_user_without_profile_is_forbidden(self):
+        """Test: Users without a profile get 403 instead of a server error"""
+
+        user = User.objects.create_user(username="noprofile", password="password123")
+        self.client.force_authenticate(user)
+
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_cursor_returns_only_later_changes(self):
+        """Test: Polling with the returned cursor only yields orders changed since"""
+
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.business_token.key)
+        cursor = self.client.get(self.url).data['next_cursor']
+
+        response = self.client.get(self.url, {'cursor': cursor})
+        self.assertEqual(response.data['orders'], [])
+
+        self.client.patch(reverse('order-detail', kwargs={'pk': self.order1.id}), {'status': 'completed'}, format='json')
+
+        response = self.client.get(self.url, {'cursor': cursor})
+        self.assertEqual(len(response.data['orders']), 1)
+        self.assertEqual(response.data['orders'][0]['id'], self.order1.id)
+        self.assertEqual(response.data['orders'][0]['status'], 'completed')
+
+    def test_deleted_order_appears_as_tombstone(self):
+        """Test: Deleting an order records a tombstone visible to both participants"""
+
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.customer_token.key)
+        cursor = self.client.get(self.url).data['next_cursor']
+
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.admin_token.key)
+        response = self.client.delete(reverse('order-detail', kwargs={'pk': self.order2.id}))
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertTrue(OrderTombstone.objects.filter(order_id=self.order2.id).exists())
+
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.customer_token.key)
+        response = self.client.get(self.url, {'cursor': cursor})
+
+        self.assertEqual(response.data['orders'], [])
+        self.assertEqual([tombstone['id'] for tombstone in response.data['deleted']], [self.order2.id])
+
+        response = self.client.get(self.url, {'cursor': response.data['next_cursor']})
+        self.assertEqual(response.data['deleted'], [])
+
+    def test_limit_pages_through_changes(self):
+        """Test: A small limit pages through the feed with has_more"""
+
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.customer_token.key)
+        response = self.client.get(self.url, {'limit': 1})
+
+        self.assertTrue(response.data['has_more'])
+        self.assertEqual(response.data['orders'][0]['id'], self.order1.id)
+
+        response = self.client.get(self.url, {'limit': 1, 'cursor': response.data['next_cursor']})
+        self.assertFalse(response.data['has_more'])
+        self.assertEqual(response.data['orders'][0]['id'], self.order2.id)
+
+    def test_other_users_changes_not_visible(self):
+        """Test: Users only see changes of their own orders"""
+
+        other_user = User.objects.create_user(username="customer2", password="password123")
+        Profile.objects.create(user=other_user, type='customer')
+        token = Token.objects.create(user=other_user)
+
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + token.key)
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.data['orders'], [])
+
+    def test_invalid_cursor(self):
+        """Test: A malformed cursor returns 400"""
+
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.customer_token.key)
+        response = self.client.get(self.url, {'cursor': 'not-a-cursor'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_get_changes_unauthenticated(self):
+        """Test: Unauthenticated request returns 401"""
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
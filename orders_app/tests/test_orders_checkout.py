@@ -0,0 +1,111 @@
+from django.db import connection
+from django.urls import reverse
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth.models import User
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework.authtoken.models import Token
+
+from orders_app.models import Orders, OrderDailyStats
+from profiles_app.models import Profile
+from offers_app.models import Offer, OfferDetail
+
+
+class OrderCheckoutTests(APITestCase):
+    """Tests for POST /api/orders/checkout/"""
+
+    def setUp(self):
+        """Create test data"""
+
+        self.customer_user = User.objects.create_user(
+            username="customer1",
+            email="customer@example.com",
+            password="password123"
+        )
+        self.customer_profile = Profile.objects.create(user=self.customer_user, type='customer')
+        self.customer_token = Token.objects.create(user=self.customer_user)
+
+        self.business_user = User.objects.create_user(
+            username="business1",
+            email="business1@example.com",
+            password="password123"
+        )
+        self.business_profile = Profile.objects.create(user=self.business_user, type='business')
+        self.business_token = Token.objects.create(user=self.business_user)
+
+        self.offer = Offer.objects.create(
+            creator=self.business_profile,
+            title="Website Design",
+            description="Professional website design"
+        )
+        self.basic_detail = OfferDetail.objects.create(
+            offer=self.offer,
+            title="Basic Package",
+            revisions=3,
+            delivery_time_in_days=5,
+            price=150.00,
+            features=["Logo Design", "Visitenkarten"],
+            offer_type="basic"
+        )
+        self.premium_detail = OfferDetail.objects.create(
+            offer=self.offer,
+            title="Premium Package",
+            revisions=10,
+            delivery_time_in_days=10,
+            price=500.00,
+            features=["Full Website", "SEO"],
+            offer_type="premium"
+        )
+        self.url = reverse('orders-checkout')
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.customer_token.key)
+
+    def test_checkout_creates_one_order_per_item(self):
+        """Test: Each listed offer detail becomes a snapshot order, duplicates included"""
+
+        ids = [self.basic_detail.id, self.premium_detail.id, self.basic_detail.id]
+        response = self.client.post(self.url, {'offer_detail_ids': ids}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual([order['title'] for order in response.data], ['Basic Package', 'Premium Package', 'Basic Package'])
+        self.assertEqual(response.data[1]['features'], ["Full Website", "SEO"])
+        self.assertEqual(response.data[1]['business_user'], self.business_user.id)
+        self.assertEqual(response.data[1]['customer_user'], self.customer_user.id)
+        self.assertNotIn('updated_at', response.data[0])
+        self.assertEqual(Orders.objects.filter(customer=self.customer_profile).count(), 3)
+
+        basic = OrderDailyStats.objects.get(offer_type='basic')
+        self.assertEqual((basic.order_count, basic.revenue), (2, 300))
+
+    def test_checkout_query_count_does_not_grow_with_items(self):
+        """Test: Checkout cost is independent of the number of items"""
+
+        with CaptureQueriesContext(connection) as single:
+            self.client.post(self.url, {'offer_detail_ids': [self.basic_detail.id]}, format='json')
+        with CaptureQueriesContext(connection) as several:
+            self.client.post(self.url, {'offer_detail_ids': [self.basic_detail.id, self.premium_detail.id] * 3}, format='json')
+
+        self.assertLessEqual(len(several), len(single) + 2)
+
+    def test_checkout_unknown_offer_detail(self):
+        """Test: One missing offer detail aborts the whole checkout with 404"""
+
+        response = self.client.post(self.url, {'offer_detail_ids': [self.basic_detail.id, 99999]}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertFalse(Orders.objects.exists())
+
+    def test_checkout_empty_list(self):
+        """Test: An empty cart returns 400"""
+
+        response = self.client.post(self.url, {'offer_detail_ids': []}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_checkout_as_business_forbidden(self):
+        """Test: Business users cannot check out"""
+
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.business_token.key)
+        response = self.client.post(self.url, {'offer_detail_ids': [self.basic_detail.id]}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
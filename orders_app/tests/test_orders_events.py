@@ -0,0 +1,196 @@
+import json
+import importlib.util
+from unittest import mock, skipUnless
+
+from django.urls import reverse
+from django.test import SimpleTestCase, override_settings
+from django.contrib.auth.models import User
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework.authtoken.models import Token
+
+from orders_app.models import Orders
+from orders_app.events import InMemoryEventBackend, RedisEventBackend, get_event_backend, user_channel
+from profiles_app.models import Profile
+from offers_app.models import Offer, OfferDetail
+
+
+class InMemoryEventBackendTests(SimpleTestCase):
+    """Tests for the process-local order event pub/sub"""
+
+    async def test_publish_reaches_channel_subscribers_only(self):
+        """Test: Events are delivered to subscribers of the published channel"""
+
+        backend = InMemoryEventBackend()
+        subscription = backend.subscribe(['user:1'])
+        other = backend.subscribe(['user:2'])
+
+        backend.publish('user:1', {'type': 'order.created'})
+
+        self.assertEqual(await subscription.get(timeout=1), {'type': 'order.created'})
+        self.assertIsNone(await other.get(timeout=0.01))
+
+        subscription.close()
+        other.close()
+        self.assertEqual(backend._subscriptions, {})
+
+    async def test_slow_subscriber_keeps_latest_events(self):
+        """Test: A full queue drops the oldest event instead of blocking publishers"""
+
+        backend = InMemoryEventBackend(max_queue_size=2)
+        subscription = backend.subscribe(['user:1'])
+
+        for number in range(3):
+            backend.publish('user:1', {'number': number})
+
+        self.assertEqual((await subscription.get(timeout=1))['number'], 1)
+        self.assertEqual((await subscription.get(timeout=1))['number'], 2)
+        subscription.close()
+
+
+@skipUnless(importlib.util.find_spec('redis'), "requires the redis package")
+class RedisEventBackendTests(SimpleTestCase):
+    """Tests for the Redis listener thread"""
+
+    def test_listener_resubscribes_after_redis_errors(self):
+        """Test: A failing subscription is retried with growing delays and messages are relayed afterwards"""
+
+        import redis
+
+        failing = mock.Mock()
+        failing.psubscribe.side_effect = redis.ConnectionError
+        working = mock.Mock()
+        working.listen.return_value = [{'channel': b'coderr:orders:user:1', 'data': b'{"type": "order.created"}'}]
+
+        backend = RedisEventBackend()
+        backend._client = mock.Mock()
+        backend._client.pubsub.side_effect = [failing, failing, working, KeyboardInterrupt]
+        with mock.patch('orders_app.events.time.sleep') as sleep, \
+                mock.patch.object(InMemoryEventBackend, 'publish') as publish, self.assertRaises(KeyboardInterrupt):
+            backend._listen()
+
+        self.assertEqual([call.args[0] for call in sleep.call_args_list], [0.5, 1, 0.5])
+        publish.assert_called_once_with('user:1', {'type': 'order.created'})
+        failing.close.assert_called()
+
+
+class OrderEventStreamTests(APITestCase):
+    """Tests for GET /api/orders/events/"""
+
+    def setUp(self):
+        """Create test data"""
+
+        self.customer_user = User.objects.create_user(
+            username="customer1",
+            email="customer@example.com",
+            password="password123"
+        )
+        self.customer_profile = Profile.objects.create(user=self.customer_user, type='customer')
+        self.customer_token = Token.objects.create(user=self.customer_user)
+
+        self.business_user = User.objects.create_user(
+            username="business1",
+            email="business1@example.com",
+            password="password123"
+        )
+        self.business_profile = Profile.objects.create(user=self.business_user, type='business')
+        self.business_token = Token.objects.create(user=self.business_user)
+
+        self.offer = Offer.objects.create(
+            creator=self.business_profile,
+            title="Website Design",
+            description="Professional website design"
+        )
+        self.offer_detail = OfferDetail.objects.create(
+            offer=self.offer,
+            title="Basic Package",
+            revisions=3,
+            delivery_time_in_days=5,
+            price=150.00,
+            features=["Logo Design", "Visitenkarten"],
+            offer_type="basic"
+        )
+        self.url = reverse('orders-events')
+
+    async def test_stream_delivers_published_events(self):
+        """Test: The stream pushes events published on the user's channel"""
+
+        response = await self.async_client.get(self.url, headers={'Authorization': 'Token ' + self.customer_token.key})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+
+        chunks = aiter(response.streaming_content)
+        self.assertTrue((await anext(chunks)).startswith(b'retry:'))
+
+        get_event_backend().publish(user_channel(self.customer_user.id), {'type': 'order.created', 'order': {'id': 1}})
+
+        chunk = (await anext(chunks)).decode()
+        self.assertTrue(chunk.startswith('event: order.created\n'))
+        self.assertEqual(json.loads(chunk.split('data: ')[1]), {'id': 1})
+        await chunks.aclose()
+
+    async def test_stream_unauthenticated(self):
+        """Test: Missing or invalid credentials return 401, API tokens are not accepted in the URL"""
+
+        response = await self.async_client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        response = await self.async_client.get(self.url, headers={'Authorization': 'Token invalid'})
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        response = await self.async_client.get(self.url, {'token': self.customer_token.key})
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    async def test_stream_ticket_is_single_use(self):
+        """Test: A ticket opens the stream of the user it was issued to exactly once"""
+
+        response = await self.async_client.post(
+            reverse('orders-events-ticket'), headers={'Authorization': 'Token ' + self.customer_token.key}
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        ticket = response.json()['ticket']
+
+        response = await self.async_client.get(self.url, {'ticket': ticket})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        chunks = aiter(response.streaming_content)
+        await anext(chunks)
+        get_event_backend().publish(user_channel(self.customer_user.id), {'type': 'order.created', 'order': {'id': 1}})
+        self.assertTrue((await anext(chunks)).startswith(b'event: order.created'))
+        await chunks.aclose()
+
+        response = await self.async_client.get(self.url, {'ticket': ticket})
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    @override_settings(ORDER_EVENTS={'KEEPALIVE_SECONDS': 0.01})
+    async def test_keepalive_is_read_per_stream(self):
+        """Test: KEEPALIVE_SECONDS is taken from the settings when the stream starts"""
+
+        response = await self.async_client.get(self.url, headers={'Authorization': 'Token ' + self.customer_token.key})
+        chunks = aiter(response.streaming_content)
+
+        self.assertEqual(await anext(chunks), b'retry: 10.0\n\n')
+        self.assertEqual(await anext(chunks), b': keepalive\n\n')
+        await chunks.aclose()
+
+    def test_order_writes_publish_events(self):
+        """Test: Creating an order and changing its status publish events to both participants"""
+
+        with mock.patch('orders_app.events.InMemoryEventBackend.publish') as publish:
+            self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.customer_token.key)
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.post(reverse('orders-list-create'), {'offer_detail_id': self.offer_detail.id}, format='json')
+
+            channels = {call.args[0] for call in publish.call_args_list}
+            self.assertEqual(channels, {user_channel(self.customer_user.id), user_channel(self.business_user.id)})
+            self.assertEqual(publish.call_args.args[1]['type'], 'order.created')
+
+            publish.reset_mock()
+            self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.business_token.key)
+            with self.captureOnCommitCallbacks(execute=True):
+                self.client.patch(reverse('order-detail', kwargs={'pk': response.data['id']}), {'status': 'completed'}, format='json')
+
+            self.assertEqual(publish.call_count, 2)
+            self.assertEqual(publish.call_args.args[1]['type'], 'order.status_changed')
+            self.assertEqual(publish.call_args.args[1]['order']['status'], 'completed')
+            self.assertEqual(Orders.objects.get(id=response.data['id']).status, 'completed')
@@ -0,0 +1,140 @@
+import csv
+import json
+from datetime import datetime, timezone
+from unittest import mock
+
+from django.urls import reverse
+from django.contrib.auth.models import User
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework.authtoken.models import Token
+
+from orders_app.models import Orders
+from orders_app.api.views import OrderExportView
+from profiles_app.models import Profile
+from offers_app.models import Offer, OfferDetail
+
+
+class ExportOrdersTests(APITestCase):
+    """Tests for GET /api/orders/export/"""
+
+    def setUp(self):
+        """Create test data"""
+
+        self.customer_user = User.objects.create_user(
+            username="customer1",
+            email="customer@example.com",
+            password="password123"
+        )
+        self.customer_profile = Profile.objects.create(user=self.customer_user, type='customer')
+
+        self.business_user = User.objects.create_user(
+            username="business1",
+            email="business1@example.com",
+            password="password123"
+        )
+        self.business_profile = Profile.objects.create(user=self.business_user, type='business')
+        self.business_token = Token.objects.create(user=self.business_user)
+
+        self.offer = Offer.objects.create(
+            creator=self.business_profile,
+            title="Website Design",
+            description="Professional website design"
+        )
+        self.offer_detail = OfferDetail.objects.create(
+            offer=self.offer,
+            title="Basic Package",
+            revisions=3,
+            delivery_time_in_days=5,
+            price=150.00,
+            features=["Logo Design", "Visitenkarten"],
+            offer_type="basic"
+        )
+
+        self.january_order = self.create_order(datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc))
+        self.march_order = self.create_order(datetime(2024, 3, 1, 8, 0, tzinfo=timezone.utc))
+        self.url = reverse('orders-export')
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.business_token.key)
+
+    def create_order(self, created_at):
+        order = Orders.objects.create(
+            offer_detail=self.offer_detail,
+            customer=self.customer_profile,
+            business=self.business_profile,
+            title="Basic Package",
+            revisions=3,
+            delivery_time_in_days=5,
+            price=150.00,
+            features=["Logo Design", "Visitenkarten"],
+            offer_type="basic"
+        )
+        Orders.objects.filter(id=order.id).update(created_at=created_at)
+        return order
+
+    def read(self, response):
+        return b''.join(response.streaming_content).decode()
+
+    def test_export_ndjson(self):
+        """Test: Default export streams one JSON object per line"""
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        rows = [json.loads(line) for line in self.read(response).splitlines()]
+        self.assertEqual([row['id'] for row in rows], [self.january_order.id, self.march_order.id])
+        self.assertEqual(rows[0]['customer_user'], self.customer_user.id)
+        self.assertEqual(rows[0]['business_user'], self.business_user.id)
+        self.assertEqual(rows[0]['features'], ["Logo Design", "Visitenkarten"])
+        self.assertEqual(rows[0]['price'], '150.00')
+
+    async def test_export_streams_in_chunks_under_asgi(self):
+        """Test: Under ASGI the body is an async iterator producing the rows one chunk after another"""
+
+        with mock.patch.object(OrderExportView, 'chunk_size', 1):
+            response = await self.async_client.get(self.url, headers={'Authorization': 'Token ' + self.business_token.key})
+            self.assertTrue(response.is_async)
+
+            lines = []
+            async for chunk in response.streaming_content:
+                lines.append(json.loads(chunk))
+
+        self.assertEqual([line['id'] for line in lines], [self.january_order.id, self.march_order.id])
+
+    def test_export_csv(self):
+        """Test: CSV export has a header row and one row per order"""
+
+        response = self.client.get(self.url, {'export_format': 'csv'})
+
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        rows = list(csv.DictReader(self.read(response).splitlines()))
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[0]['title'], 'Basic Package')
+        self.assertEqual(json.loads(rows[0]['features']), ["Logo Design", "Visitenkarten"])
+
+    def test_export_created_range(self):
+        """Test: created_after/created_before restrict the export, date upper bounds are inclusive"""
+
+        response = self.client.get(self.url, {'created_after': '2024-02-01'})
+        rows = [json.loads(line) for line in self.read(response).splitlines()]
+        self.assertEqual([row['id'] for row in rows], [self.march_order.id])
+
+        response = self.client.get(self.url, {'created_before': '2024-01-15'})
+        rows = [json.loads(line) for line in self.read(response).splitlines()]
+        self.assertEqual([row['id'] for row in rows], [self.january_order.id])
+
+    def test_export_invalid_parameters(self):
+        """Test: Unknown formats and malformed dates return 400"""
+
+        self.assertEqual(self.client.get(self.url, {'export_format': 'xml'}).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get(self.url, {'created_after': 'yesterday'}).status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_export_unauthenticated(self):
+        """Test: Unauthenticated request returns 401"""
+
+        self.client.credentials()
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
@@ -0,0 +1,110 @@
+from datetime import timedelta
+
+from django.urls import reverse
+from django.utils import timezone
+from django.contrib.auth.models import User
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework.authtoken.models import Token
+
+from orders_app.models import Orders
+from profiles_app.models import Profile
+from offers_app.models import Offer, OfferDetail
+
+
+class OrderQueueTests(APITestCase):
+    """Tests for GET /api/orders/upcoming/ and /api/orders/overdue/"""
+
+    def setUp(self):
+        """Create test data"""
+
+        self.customer_user = User.objects.create_user(
+            username="customer1",
+            email="customer@example.com",
+            password="password123"
+        )
+        self.customer_profile = Profile.objects.create(user=self.customer_user, type='customer')
+        self.customer_token = Token.objects.create(user=self.customer_user)
+
+        self.business_user = User.objects.create_user(
+            username="business1",
+            email="business1@example.com",
+            password="password123"
+        )
+        self.business_profile = Profile.objects.create(user=self.business_user, type='business')
+        self.business_token = Token.objects.create(user=self.business_user)
+
+        self.offer = Offer.objects.create(
+            creator=self.business_profile,
+            title="Website Design",
+            description="Professional website design"
+        )
+        self.offer_detail = OfferDetail.objects.create(
+            offer=self.offer,
+            title="Basic Package",
+            revisions=3,
+            delivery_time_in_days=5,
+            price=150.00,
+            features=["Logo Design", "Visitenkarten"],
+            offer_type="basic"
+        )
+
+        now = timezone.now()
+        self.due_later = self.create_order(now + timedelta(days=6))
+        self.due_soon = self.create_order(now + timedelta(days=1))
+        self.overdue = self.create_order(now - timedelta(days=2))
+        self.completed_overdue = self.create_order(now - timedelta(days=3), order_status='completed')
+
+    def create_order(self, due_at, order_status='in_progress'):
+        return Orders.objects.create(
+            offer_detail=self.offer_detail,
+            customer=self.customer_profile,
+            business=self.business_profile,
+            title="Basic Package",
+            revisions=3,
+            delivery_time_in_days=5,
+            price=150.00,
+            features=["Logo Design", "Visitenkarten"],
+            offer_type="basic",
+            status=order_status,
+            due_at=due_at
+        )
+
+    def test_due_at_derived_on_creation(self):
+        """Test: New orders get due_at from the delivery time"""
+
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.customer_token.key)
+        response = self.client.post(reverse('orders-list-create'), {'offer_detail_id': self.offer_detail.id}, format='json')
+
+        order = Orders.objects.get(id=response.data['id'])
+        self.assertAlmostEqual(order.due_at, order.created_at + timedelta(days=5), delta=timedelta(seconds=5))
+
+    def test_upcoming_sorted_by_due_date(self):
+        """Test: Upcoming queue lists in-progress orders not yet due, soonest first"""
+
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.business_token.key)
+        response = self.client.get(reverse('orders-upcoming'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([order['id'] for order in response.data['results']], [self.due_soon.id, self.due_later.id])
+        self.assertFalse(response.data['results'][0]['is_overdue'])
+        self.assertIn('due_at', response.data['results'][0])
+
+    def test_overdue_lists_only_late_in_progress_orders(self):
+        """Test: Overdue queue skips completed orders and flags late ones"""
+
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.business_token.key)
+        response = self.client.get(reverse('orders-overdue'))
+
+        self.assertEqual(response.data['count'], 1)
+        self.assertEqual(response.data['results'][0]['id'], self.overdue.id)
+        self.assertTrue(response.data['results'][0]['is_overdue'])
+
+    def test_queue_forbidden_for_customers(self):
+        """Test: Customers have no work queue"""
+
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.customer_token.key)
+        response = self.client.get(reverse('orders-overdue'))
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
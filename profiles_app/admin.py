@@ -9,7 +9,7 @@ class ProfileAdmin(admin.ModelAdmin):
     list_display = ['id', 'user', 'type', 'location', 'tel', 'created_at']
     list_filter = ['type', 'created_at']
     search_fields = ['user__username', 'user__email', 'location', 'description']
-    readonly_fields = ['created_at']
+    readonly_fields = ['file_variants', 'created_at']
     list_select_related = ['user']
     
     fieldsets = (
@@ -17,7 +17,7 @@ class ProfileAdmin(admin.ModelAdmin):
             'fields': ('user', 'type')
         }),
         ('Profile Details', {
-            'fields': ('file', 'location', 'tel', 'description', 'working_hours')
+            'fields': ('file', 'file_variants', 'location', 'tel', 'description', 'working_hours')
         }),
         ('Timestamps', {
             'fields': ('created_at',),
@@ -0,0 +1,101 @@
+import string
+
+from django.contrib.auth.models import User
+from django.db.models.functions import Lower
+from django_filters import rest_framework as filters
+
+from profiles_app.models import Profile
+
+
+# Columns with a Lower() expression index: model, column and the field holding the user id
+INDEXED_COLUMNS = {
+    'username': (User, 'username', 'id'),
+    'first_name': (User, 'first_name', 'id'),
+    'last_name': (User, 'last_name', 'id'),
+    'location': (Profile, 'location', 'user_id'),
+}
+
+ASCII_LOWERCASE = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+
+def normalize(value):
+    """
+    Lower-cases ASCII letters only, as SQLite's LOWER() does.
+    
+    Both sides of the comparison fold case the same way, so matching is case-insensitive
+    for ASCII letters and case-sensitive for all others ('köln' finds 'Köln', 'KÖLN' does not).
+    """
+    
+    return value.strip().translate(ASCII_LOWERCASE)
+
+
+def matching_user_ids(columns, value):
+    """
+    Ids of the users whose column starts with the value.
+    
+    Each column is queried on its own table as a range over its lower-cased index and
+    the ids are combined with UNION; an OR across the auth_user join could use none of them.
+    """
+    
+    prefix = normalize(value)
+    upper_bound = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+    queries = []
+    for column in columns:
+        model, field, user_id = INDEXED_COLUMNS[column]
+        queries.append(
+            model.objects.alias(normalized=Lower(field))
+            .filter(normalized__gte=prefix, normalized__lt=upper_bound).values(user_id)
+        )
+    return queries[0].union(*queries[1:])
+
+
+def prefix_filter(queryset, columns, value):
+    """Profiles whose user matches the prefix in any of the columns"""
+    
+    if not value.strip():
+        return queryset
+    return queryset.filter(user_id__in=matching_user_ids(columns, value))
+
+
+class ProfileSearchFilter(filters.FilterSet):
+    """Filter class for the profile lists: prefix search on names and location"""
+    
+    search = filters.CharFilter(method='filter_search')
+    username = filters.CharFilter(method='filter_username')
+    name = filters.CharFilter(method='filter_name')
+    location = filters.CharFilter(method='filter_location')
+    
+    class Meta:
+        model = Profile
+        fields = ['search', 'username', 'name', 'location']
+    
+    def filter_search(self, queryset, name, value):
+        """Profiles whose username, first name, last name or location starts with the value"""
+        
+        return prefix_filter(queryset, ['username', 'first_name', 'last_name', 'location'], value)
+    
+    def filter_username(self, queryset, name, value):
+        return prefix_filter(queryset, ['username'], value)
+    
+    def filter_name(self, queryset, name, value):
+        """Profiles whose first or last name starts with the value"""
+        
+        return prefix_filter(queryset, ['first_name', 'last_name'], value)
+    
+    def filter_location(self, queryset, name, value):
+        return prefix_filter(queryset, ['location'], value)
+
+
+class BusinessProfileFilter(ProfileSearchFilter):
+    """Filter class for the business directory, applied to the annotated stats"""
+    
+    min_average_rating = filters.NumberFilter(field_name='average_rating', lookup_expr='gte')
+    min_review_count = filters.NumberFilter(field_name='review_count', lookup_expr='gte')
+    min_offer_count = filters.NumberFilter(field_name='offer_count', lookup_expr='gte')
+    min_completed_order_count = filters.NumberFilter(field_name='completed_order_count', lookup_expr='gte')
+    
+    class Meta:
+        model = Profile
+        fields = ProfileSearchFilter.Meta.fields + [
+            'min_average_rating', 'min_review_count', 'min_offer_count', 'min_completed_order_count'
+        ]
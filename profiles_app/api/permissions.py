@@ -11,4 +11,4 @@ class IsOwnerOrReadOnly(permissions.BasePermission):
         if request.method in permissions.SAFE_METHODS:
             return True
         
-        return obj.user == request.user
+        return obj.user_id == request.user.id
@@ -1,5 +1,20 @@
 from rest_framework import serializers
 from profiles_app.models import Profile
+from profiles_app.avatars import (
+    check_upload, schedule_avatar_processing, discard_avatar_variants, avatar_url, variant_urls
+)
+
+
+class AvatarField(serializers.Field):
+    """Read-only URL of the small profile picture variant, the original until it has been processed"""
+    
+    def __init__(self, **kwargs):
+        kwargs.setdefault('source', '*')
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+    
+    def to_representation(self, profile):
+        return avatar_url(profile, self.context.get('request'))
 
 
 class ProfileSerializer(serializers.ModelSerializer):
@@ -10,6 +25,7 @@ class ProfileSerializer(serializers.ModelSerializer):
     last_name = serializers.CharField(source='user.last_name', read_only=True)
     email = serializers.EmailField(source='user.email', read_only=True)
     user = serializers.IntegerField(source='user.id', read_only=True)
+    file_variants = serializers.SerializerMethodField()
     
     class Meta:
         model = Profile
@@ -19,6 +35,7 @@ class ProfileSerializer(serializers.ModelSerializer):
             'first_name',
             'last_name',
             'file',
+            'file_variants',
             'location',
             'tel',
             'description',
@@ -28,6 +45,9 @@ class ProfileSerializer(serializers.ModelSerializer):
             'created_at'
         ]
         read_only_fields = ['user', 'username', 'email', 'type', 'created_at']
+    
+    def get_file_variants(self, obj):
+        return variant_urls(obj, self.context.get('request'))
 
 
 class ProfileUpdateSerializer(serializers.ModelSerializer):
@@ -50,8 +70,17 @@ class ProfileUpdateSerializer(serializers.ModelSerializer):
             'email',
         ]
     
+    def validate_file(self, value):
+        """Enforce the upload size cap and make sure Pillow can read the picture"""
+        
+        if value:
+            error = check_upload(value)
+            if error:
+                raise serializers.ValidationError(error)
+        return value
+    
     def update(self, instance, validated_data):
-        """Update Profile instance with nested user information"""
+        """Update Profile instance with nested user information, new pictures are processed after commit"""
         
         first_name = validated_data.pop('first_name', None)
         last_name = validated_data.pop('last_name', None)
@@ -67,16 +96,27 @@ class ProfileUpdateSerializer(serializers.ModelSerializer):
         if first_name or last_name or email:
             instance.user.save()
         
-        return super().update(instance, validated_data)
+        if 'file' in validated_data and not validated_data['file'] and instance.file_variants:
+            discard_avatar_variants(instance)
+        
+        instance = super().update(instance, validated_data)
+        if validated_data.get('file'):
+            schedule_avatar_processing(instance)
+        return instance
     
 
 class BusinessProfileSerializer(serializers.ModelSerializer):
-    """Serializer for business Profile model with nested user information"""
+    """Serializer for business Profile model with nested user information and the stats annotated by BusinessView"""
     
     username = serializers.CharField(source='user.username', read_only=True)
     first_name = serializers.CharField(source='user.first_name', read_only=True)
     last_name = serializers.CharField(source='user.last_name', read_only=True)
     user = serializers.IntegerField(source='user.id', read_only=True)
+    file = AvatarField()
+    offer_count = serializers.IntegerField(read_only=True)
+    review_count = serializers.IntegerField(read_only=True)
+    average_rating = serializers.SerializerMethodField()
+    completed_order_count = serializers.IntegerField(read_only=True)
     
     class Meta:
         model = Profile
@@ -91,9 +131,16 @@ class BusinessProfileSerializer(serializers.ModelSerializer):
             'description',
             'working_hours',
             'type',
+            'offer_count',
+            'review_count',
+            'average_rating',
+            'completed_order_count',
         ]
         read_only_fields = ['user', 'username', 'type']
 
+    def get_average_rating(self, obj):
+        return round(obj.average_rating, 1)
+
 
 class CustomerProfileSerializer(serializers.ModelSerializer):
     """Serializer for customer Profile model with nested user information"""
@@ -102,6 +149,7 @@ class CustomerProfileSerializer(serializers.ModelSerializer):
     first_name = serializers.CharField(source='user.first_name', read_only=True)
     last_name = serializers.CharField(source='user.last_name', read_only=True)
     user = serializers.IntegerField(source='user.id', read_only=True)
+    file = AvatarField()
     
     class Meta:
         model = Profile
@@ -114,3 +162,23 @@ class CustomerProfileSerializer(serializers.ModelSerializer):
             'type'
         ]
         read_only_fields = ['user', 'username', 'type']
+
+
+class ProfileSummarySerializer(serializers.ModelSerializer):
+    """Compact profile for display next to offers, orders and reviews, limited to the requested fields"""
+    
+    user = serializers.IntegerField(source='user_id', read_only=True)
+    username = serializers.CharField(source='user.username', read_only=True)
+    first_name = serializers.CharField(source='user.first_name', read_only=True)
+    last_name = serializers.CharField(source='user.last_name', read_only=True)
+    avatar = AvatarField()
+    
+    class Meta:
+        model = Profile
+        fields = ['user', 'username', 'first_name', 'last_name', 'avatar', 'type']
+    
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields:
+            for field_name in set(self.fields) - set(fields) - {'user'}:
+                self.fields.pop(field_name)
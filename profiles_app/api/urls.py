@@ -1,5 +1,5 @@
 from django.urls import path
-from .views import ProfileDetailView, BusinessView, CustomerView
+from .views import ProfileDetailView, BusinessView, CustomerView, ProfileBatchView
 
 
 urlpatterns = [
@@ -7,4 +7,5 @@ urlpatterns = [
     path('upload/', ProfileDetailView.as_view(), name='profile-upload'),
     path('profiles/business/', BusinessView.as_view(), name='businessprofiles'),
     path('profiles/customer/', CustomerView.as_view(), name='customerprofiles'),
+    path('profiles/batch/', ProfileBatchView.as_view(), name='profiles-batch'),
 ]
@@ -1,25 +1,67 @@
+from django.db.models import OuterRef, Subquery, Count, F, FloatField, IntegerField, Value
+from django.db.models.functions import Cast, Coalesce, NullIf
+
+from rest_framework import generics, status
 from rest_framework.views import APIView
-from rest_framework import status, generics
 from rest_framework.response import Response
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import OrderingFilter
+from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import IsAuthenticated
+from django_filters.rest_framework import DjangoFilterBackend
 
+from offers_app.models import Offer
+from orders_app.models import Orders, ArchivedOrders
 from profiles_app.models import Profile
+from profiles_app.cache import get_cached_profile, cache_profile
+from .filters import ProfileSearchFilter, BusinessProfileFilter
 from .permissions import IsOwnerOrReadOnly
-from .serializers import ProfileSerializer, ProfileUpdateSerializer, BusinessProfileSerializer, CustomerProfileSerializer
+from .serializers import (
+    ProfileSerializer, ProfileUpdateSerializer, BusinessProfileSerializer, CustomerProfileSerializer,
+    ProfileSummarySerializer
+)
+    
+
+def with_absolute_urls(data, request):
+    """
+    Copy of a cached profile payload with its picture URLs built for this request.
     
+    The cache holds the payload serialized without a request, i.e. with relative URLs,
+    so one entry serves clients on every host.
+    """
+    
+    data = dict(data)
+    if data['file']:
+        data['file'] = request.build_absolute_uri(data['file'])
+    data['file_variants'] = {
+        extension: {size: request.build_absolute_uri(url) for size, url in by_size.items()}
+        for extension, by_size in data['file_variants'].items()
+    }
+    return data
+
 
 class ProfileDetailView(generics.RetrieveUpdateDestroyAPIView):
-    """API view for retrieving, updating, or deleting a single profile"""
+    """API view for retrieving, updating, or deleting a single profile, GETs are served from the profile cache"""
     
     permission_classes = [IsAuthenticated, IsOwnerOrReadOnly]
     serializer_class = ProfileSerializer
-    queryset = Profile.objects.all()
+    queryset = Profile.objects.select_related('user')
     
     def get_serializer_class(self):
         if self.request.method in ['PATCH', 'PUT']:
             return ProfileUpdateSerializer
         return ProfileSerializer
     
+    def retrieve(self, request, *args, **kwargs):
+        """Any authenticated user may read a profile, so a cached payload needs no object lookup"""
+        
+        data = get_cached_profile(kwargs['pk'])
+        if data is None:
+            instance = self.get_object()
+            data = ProfileSerializer(instance).data
+            cache_profile(instance.id, data)
+        return Response(with_absolute_urls(data, request))
+    
     def update(self, request, *args, **kwargs):
         partial = kwargs.pop('partial', False)
         instance = self.get_object()
@@ -27,28 +69,100 @@ class ProfileDetailView(generics.RetrieveUpdateDestroyAPIView):
         serializer.is_valid(raise_exception=True)
         self.perform_update(serializer)
         
-        response_serializer = ProfileSerializer(instance)
-        return Response(response_serializer.data) 
+        data = ProfileSerializer(instance).data
+        cache_profile(instance.id, data)
+        return Response(with_absolute_urls(data, request))
+
+
+class ProfileListPagination(PageNumberPagination):
+    """Pagination for the profile lists, only applied when page or page_size is requested"""
     
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.page_query_param not in request.query_params and self.page_size_query_param not in request.query_params:
+            return None
+        return super().paginate_queryset(queryset, request, view)
+
+
+def count_per_business(queryset, field_name):
+    """Correlated subquery counting the rows of queryset that belong to the outer business profile"""
     
-class BusinessView(APIView):
-    """API view for all Business Profiles"""
+    counts = queryset.filter(**{field_name: OuterRef('pk')}).order_by().values(field_name).annotate(
+        total=Count('pk')
+    ).values('total')
+    return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
+
+class BusinessView(generics.ListAPIView):
+    """API view for all Business Profiles with their offer, review and order stats"""
     
     permission_classes = [IsAuthenticated]
+    serializer_class = BusinessProfileSerializer
+    pagination_class = ProfileListPagination
+    filter_backends = [DjangoFilterBackend, OrderingFilter]
+    filterset_class = BusinessProfileFilter
+    ordering_fields = ['offer_count', 'review_count', 'average_rating', 'completed_order_count', 'created_at']
     
-    def get(self, request):
-        business_profiles = Profile.objects.filter(type='business')
-        serializer = BusinessProfileSerializer(business_profiles, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+    def get_queryset(self):
+        """Annotate every stat in the listing query, reviews come from the maintained rating stats"""
+        
+        return Profile.objects.filter(type='business').select_related('user').annotate(
+            offer_count=count_per_business(Offer.objects.all(), 'creator'),
+            completed_order_count=(
+                count_per_business(Orders.objects.filter(status='completed'), 'business')
+                + count_per_business(ArchivedOrders.objects.filter(status='completed'), 'business')
+            ),
+            review_count=Coalesce(F('rating_stats__review_count'), 0),
+            average_rating=Coalesce(
+                Cast(F('rating_stats__rating_sum'), FloatField()) / NullIf(F('rating_stats__review_count'), 0),
+                Value(0.0)
+            ),
+        ).order_by('id')
     
     
-class CustomerView(APIView):
+class CustomerView(generics.ListAPIView):
     """API view für alle Customer Profile"""
     
     permission_classes = [IsAuthenticated]
+    serializer_class = CustomerProfileSerializer
+    pagination_class = ProfileListPagination
+    filter_backends = [DjangoFilterBackend]
+    filterset_class = ProfileSearchFilter
+    queryset = Profile.objects.filter(type='customer').select_related('user').order_by('id')
+
+
+class ProfileBatchView(APIView):
+    """API view for compact profiles of up to MAX_USER_IDS users in one query"""
+    
+    permission_classes = [IsAuthenticated]
+    MAX_USER_IDS = 100
     
     def get(self, request):
-        customer_profiles = Profile.objects.filter(type='customer')
-        serializer = CustomerProfileSerializer(customer_profiles, many=True)
+        user_ids = self.parse_ids(request.query_params.getlist('user_ids'))
+        fields = [name for value in request.query_params.getlist('fields') for name in value.split(',') if name]
+        unknown = set(fields) - set(ProfileSummarySerializer.Meta.fields)
+        if unknown:
+            raise ValidationError({'fields': f"Unknown fields: {', '.join(sorted(unknown))}."})
+        
+        profiles = Profile.objects.select_related('user').in_bulk(user_ids, field_name='user_id')
+        serializer = ProfileSummarySerializer(
+            [profiles[user_id] for user_id in user_ids if user_id in profiles],
+            many=True, fields=fields, context={'request': request}
+        )
         return Response(serializer.data, status=status.HTTP_200_OK)
-    
\ No newline at end of file
+    
+    def parse_ids(self, values):
+        """Distinct ids from comma-separated and repeated user_ids parameters, in request order"""
+        
+        try:
+            user_ids = list(dict.fromkeys(int(part) for value in values for part in value.split(',') if part.strip()))
+        except ValueError:
+            raise ValidationError({'user_ids': "A comma-separated list of integers is required."})
+        if not user_ids:
+            raise ValidationError({'user_ids': "This parameter is required."})
+        if len(user_ids) > self.MAX_USER_IDS:
+            raise ValidationError({'user_ids': f"At most {self.MAX_USER_IDS} ids per request."})
+        return user_ids
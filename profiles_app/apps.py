@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class ProfilesAppConfig(AppConfig):
     name = 'profiles_app'
+
+    def ready(self):
+        from profiles_app import signals  # noqa: F401
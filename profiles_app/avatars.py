@@ -0,0 +1,168 @@
+import logging
+import posixpath
+from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image, ImageOps, UnidentifiedImageError, features
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.core.files.base import ContentFile
+
+from profiles_app.models import Profile
+from profiles_app.cache import invalidate_profile
+
+
+logger = logging.getLogger(__name__)
+
+VARIANT_DIR = 'profile_pictures/variants'
+EXTENSIONS = {'WEBP': 'webp', 'AVIF': 'avif', 'JPEG': 'jpg', 'PNG': 'png'}
+
+_executor = None
+
+
+def avatar_settings():
+    return settings.PROFILE_AVATARS
+
+
+def output_formats():
+    """The configured format if this Pillow build can write it, followed by the fallback format"""
+
+    formats = [avatar_settings()['FORMAT'], avatar_settings()['FALLBACK_FORMAT']]
+    return [
+        image_format for index, image_format in enumerate(formats)
+        if image_format not in formats[:index] and (image_format in ('JPEG', 'PNG') or features.check(image_format.lower()))
+    ]
+
+
+def check_upload(upload):
+    """Reject uploads above MAX_UPLOAD_BYTES and files Pillow cannot read, returns an error message or None"""
+
+    if upload.size > avatar_settings()['MAX_UPLOAD_BYTES']:
+        return f"The file may not be larger than {avatar_settings()['MAX_UPLOAD_BYTES'] // (1024 * 1024)} MB."
+    try:
+        with Image.open(upload) as image:
+            image.verify()
+    except (UnidentifiedImageError, OSError, SyntaxError, Image.DecompressionBombError):
+        return "Upload a valid image."
+    finally:
+        upload.seek(0)
+    return None
+
+
+def encode(image, image_format):
+    """Encode without EXIF, ICC or other metadata, JPEG gets transparency flattened onto white"""
+
+    if image_format == 'JPEG' and image.mode != 'RGB':
+        background = Image.new('RGB', image.size, 'white')
+        background.paste(image, mask=image.getchannel('A') if 'A' in image.getbands() else None)
+        image = background
+    buffer = BytesIO()
+    image.save(buffer, image_format, quality=82)
+    return ContentFile(buffer.getvalue())
+
+
+def render_variants(profile):
+    """Write every size in every output format and return {format: {size: storage name}}"""
+
+    storage = profile.file.storage
+    stem = posixpath.splitext(posixpath.basename(profile.file.name))[0]
+    with profile.file.open('rb') as source, Image.open(source) as original:
+        image = ImageOps.exif_transpose(original)
+        image = image.convert('RGBA' if 'A' in image.getbands() or 'transparency' in image.info else 'RGB')
+
+    variants = {}
+    for image_format in output_formats():
+        extension = EXTENSIONS.get(image_format, image_format.lower())
+        variants[extension] = {}
+        for size in avatar_settings()['SIZES']:
+            avatar = ImageOps.fit(image, (size, size), Image.Resampling.LANCZOS)
+            name = f'{VARIANT_DIR}/{profile.id}/{stem}_{size}.{extension}'
+            variants[extension][str(size)] = storage.save(name, encode(avatar, image_format))
+    return variants
+
+
+def variant_names(variants):
+    return {name for by_size in variants.values() for name in by_size.values()}
+
+
+def delete_variant_files(storage, names):
+    for name in names:
+        storage.delete(name)
+
+
+def process_avatar(profile_id, file_name):
+    """Build the variants of the profile picture, unless it was replaced or removed in the meantime"""
+
+    profile = Profile.objects.filter(id=profile_id, file=file_name).first()
+    if profile is None:
+        return
+
+    try:
+        variants = render_variants(profile)
+    except (UnidentifiedImageError, OSError, Image.DecompressionBombError):
+        logger.exception("Could not process profile picture %s of profile %s", file_name, profile_id)
+        return
+
+    storage = profile.file.storage
+    if Profile.objects.filter(id=profile_id, file=file_name).update(file_variants=variants):
+        delete_variant_files(storage, variant_names(profile.file_variants) - variant_names(variants))
+        invalidate_profile(profile_id)
+    else:
+        delete_variant_files(storage, variant_names(variants))
+
+
+def run_in_worker(profile_id, file_name):
+    try:
+        process_avatar(profile_id, file_name)
+    except Exception:
+        logger.exception("Profile picture processing failed for profile %s", profile_id)
+    finally:
+        connection.close()
+
+
+def get_executor():
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=avatar_settings()['WORKERS'], thread_name_prefix='avatars')
+    return _executor
+
+
+def schedule_avatar_processing(profile):
+    """Process the current picture once the upload has committed, on the worker pool unless ASYNC is off"""
+
+    profile_id, file_name = profile.id, profile.file.name
+    if avatar_settings()['ASYNC']:
+        transaction.on_commit(lambda: get_executor().submit(run_in_worker, profile_id, file_name))
+    else:
+        transaction.on_commit(lambda: process_avatar(profile_id, file_name))
+
+
+def discard_avatar_variants(profile):
+    """Forget the variants of a removed picture and delete their files after commit"""
+
+    storage, names = profile.file.storage, variant_names(profile.file_variants)
+    profile.file_variants = {}
+    transaction.on_commit(lambda: delete_variant_files(storage, names))
+
+
+def avatar_url(profile, request=None, size=None):
+    """URL of the size variant in the preferred format, or of the original picture while none exists"""
+
+    if not profile.file:
+        return None
+    size = str(size or avatar_settings()['LIST_SIZE'])
+    name = next((by_size[size] for by_size in profile.file_variants.values() if size in by_size), None)
+    url = profile.file.storage.url(name) if name else profile.file.url
+    return request.build_absolute_uri(url) if request else url
+
+
+def variant_urls(profile, request=None):
+    storage = profile.file.storage
+    return {
+        extension: {
+            size: request.build_absolute_uri(storage.url(name)) if request else storage.url(name)
+            for size, name in by_size.items()
+        }
+        for extension, by_size in profile.file_variants.items()
+    }
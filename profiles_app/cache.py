@@ -0,0 +1,27 @@
+from django.core.cache import cache
+
+from core import metrics
+
+
+PROFILE_CACHE_TIMEOUT = 600
+
+
+def profile_cache_key(profile_id):
+    return f'profiles:detail:{profile_id}'
+
+
+def get_cached_profile(profile_id):
+    """Serialized profile payload or None, counted as profile_cache.hit / profile_cache.miss"""
+
+    data = cache.get(profile_cache_key(profile_id))
+    metrics.increment('profile_cache.hit' if data is not None else 'profile_cache.miss')
+    return data
+
+
+def cache_profile(profile_id, data):
+    cache.set(profile_cache_key(profile_id), data, PROFILE_CACHE_TIMEOUT)
+
+
+def invalidate_profile(profile_id):
+    cache.delete(profile_cache_key(profile_id))
+    metrics.increment('profile_cache.invalidation')
@@ -0,0 +1,33 @@
+# Generated by Django 6.0.1 on 2026-10-19 11:19
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+# auth_user belongs to django.contrib.auth, so its expression indexes are created here.
+USER_NAME_INDEXES = {
+    'auth_user_username_lower_idx': 'username',
+    'auth_user_first_name_lower_idx': 'first_name',
+    'auth_user_last_name_lower_idx': 'last_name',
+}
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles_app', '0004_remove_profile_email_remove_profile_first_name_and_more'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='profile',
+            index=models.Index(django.db.models.functions.text.Lower('location'), name='profile_location_lower_idx'),
+        ),
+    ] + [
+        migrations.RunSQL(
+            f'CREATE INDEX {name} ON auth_user (LOWER({column}))',
+            f'DROP INDEX {name}',
+        )
+        for name, column in USER_NAME_INDEXES.items()
+    ]
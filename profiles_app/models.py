@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models.functions import Lower
 from django.contrib.auth.models import User
 
 
@@ -9,11 +10,27 @@ class Profile(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='profile')
     type = models.CharField(max_length=20, choices=TYPE_CHOICES, default="customer")
     file = models.FileField(upload_to='profile_pictures/', null=True, blank=True)
+    file_variants = models.JSONField(default=dict, blank=True)
     location = models.CharField(max_length=255, blank=True)
     tel = models.CharField(max_length=20, blank=True)
     description = models.TextField(blank=True)
     working_hours = models.CharField(max_length=100, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        """Lower-cased location for the indexed location and search filters."""
+
+        indexes = [
+            models.Index(Lower('location'), name='profile_location_lower_idx'),
+        ]
+
     def __str__(self):
         return f"{self.user.username} Profile"
+
+    @classmethod
+    def referenced_files(cls):
+        """Storage names of the generated picture variants, counted by prune_blobs"""
+
+        for variants in cls.objects.exclude(file_variants={}).values_list('file_variants', flat=True).iterator():
+            for by_size in variants.values():
+                yield from by_size.values()
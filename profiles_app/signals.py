@@ -0,0 +1,36 @@
+from functools import partial
+
+from django.db import transaction
+from django.dispatch import receiver
+from django.contrib.auth.models import User
+from django.db.models.signals import post_save, post_delete
+
+from profiles_app.models import Profile
+from profiles_app.cache import invalidate_profile
+
+
+def invalidate_profile_on_commit(profile_id):
+    """Invalidating earlier would let a concurrent reader cache the old row again before the commit"""
+
+    transaction.on_commit(partial(invalidate_profile, profile_id), robust=True)
+
+
+@receiver(post_save, sender=Profile)
+@receiver(post_delete, sender=Profile)
+def invalidate_cached_profile(sender, instance, **kwargs):
+    invalidate_profile_on_commit(instance.id)
+
+
+@receiver(post_save, sender=User)
+def invalidate_cached_profile_of_user(sender, instance, created, update_fields=None, **kwargs):
+    """Names and email are part of the profile payload, login timestamps are not"""
+
+    if created or update_fields == frozenset(['last_login']):
+        return
+    if User.profile.is_cached(instance):
+        profile = getattr(instance, 'profile', None)
+        profile_id = profile.id if profile else None
+    else:
+        profile_id = Profile.objects.filter(user_id=instance.id).values_list('id', flat=True).first()
+    if profile_id is not None:
+        invalidate_profile_on_commit(profile_id)
@@ -0,0 +1,109 @@
+import shutil
+import tempfile
+from io import BytesIO
+
+from PIL import Image
+
+from django.urls import reverse
+from django.test import override_settings
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.contrib.auth.models import User
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework.authtoken.models import Token
+
+from profiles_app.models import Profile
+from media_app.models import StoredBlob
+
+
+MEDIA_ROOT = tempfile.mkdtemp()
+AVATARS = {
+    'SIZES': [64, 128, 256],
+    'LIST_SIZE': 64,
+    'FORMAT': 'WEBP',
+    'FALLBACK_FORMAT': 'JPEG',
+    'MAX_UPLOAD_BYTES': 200 * 1024,
+    'WORKERS': 1,
+    'ASYNC': False,
+}
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, PROFILE_AVATARS=AVATARS)
+class ProfileAvatarTests(APITestCase):
+    """Tests for profile picture uploads through PATCH /api/profile/{id}/"""
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def setUp(self):
+        """Create test data"""
+
+        self.user = User.objects.create_user(username="business1", email="business1@example.com", password="password123")
+        self.profile = Profile.objects.create(user=self.user, type='business')
+        token = Token.objects.create(user=self.user)
+        self.url = reverse('profile-detail', args=[self.profile.id])
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + token.key)
+
+    def picture(self, name="avatar.png", color=(200, 30, 30, 255)):
+        exif = Image.Exif()
+        exif[0x010F] = "Camera Maker"
+        buffer = BytesIO()
+        Image.new('RGBA', (300, 200), color).save(buffer, 'PNG', exif=exif)
+        return SimpleUploadedFile(name, buffer.getvalue(), content_type='image/png')
+
+    def upload(self, upload):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.patch(self.url, {'file': upload}, format='multipart')
+
+    def test_upload_creates_square_variants_without_metadata(self):
+        """Test: Every size is written in WebP and the JPEG fallback, without EXIF data"""
+
+        response = self.upload(self.picture())
+        self.profile.refresh_from_db()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(sorted(self.profile.file_variants), ['jpg', 'webp'])
+        self.assertEqual(sorted(self.profile.file_variants['webp'], key=int), ['64', '128', '256'])
+        with default_storage.open(self.profile.file_variants['webp']['64']) as variant, Image.open(variant) as image:
+            self.assertEqual((image.format, image.size), ('WEBP', (64, 64)))
+            self.assertNotIn('exif', image.info)
+
+    def test_lists_return_small_variant(self):
+        """Test: Business list and profile detail point at the processed files"""
+
+        self.upload(self.picture())
+        self.profile.refresh_from_db()
+
+        listed = self.client.get(reverse('businessprofiles')).data[0]['file']
+        detail = self.client.get(self.url).data
+
+        self.assertTrue(listed.endswith(self.profile.file_variants['webp']['64']))
+        self.assertTrue(detail['file'].endswith(self.profile.file.name))
+        self.assertTrue(detail['file_variants']['jpg']['256'].endswith('.jpg'))
+
+    def test_new_upload_replaces_old_variants(self):
+        """Test: Variants of a replaced picture are released"""
+
+        self.upload(self.picture("first.png"))
+        self.profile.refresh_from_db()
+        old_variant = self.profile.file_variants['webp']['128']
+
+        self.upload(self.picture("second.png", color=(30, 30, 200, 255)))
+        self.profile.refresh_from_db()
+
+        self.assertNotEqual(self.profile.file_variants['webp']['128'], old_variant)
+        self.assertEqual(StoredBlob.objects.get(name=old_variant).ref_count, 0)
+
+    def test_upload_size_cap_and_invalid_images(self):
+        """Test: Oversized uploads and non-images return 400"""
+
+        response = self.upload(SimpleUploadedFile("big.png", b'0' * (201 * 1024), content_type='image/png'))
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.upload(SimpleUploadedFile("notes.png", b'not an image', content_type='image/png'))
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Profile.objects.get(id=self.profile.id).file)
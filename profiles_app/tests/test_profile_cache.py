@@ -0,0 +1,125 @@
+from django.db import connection
+from django.urls import reverse
+from django.core.cache import cache
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth.models import User
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework.authtoken.models import Token
+
+from core import metrics
+from profiles_app.models import Profile
+
+
+class ProfileCacheTests(APITestCase):
+    """Tests for the cached GET /api/profile/{id}/ payloads and GET /api/metrics/"""
+
+    def setUp(self):
+        """Create test data"""
+
+        cache.clear()
+        metrics.reset()
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="password123",
+            first_name="Test"
+        )
+        self.profile = Profile.objects.create(user=self.user, type='business', location="Berlin")
+        self.token = Token.objects.create(user=self.user)
+        self.url = reverse('profile-detail', args=[self.profile.id])
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.token.key)
+
+    def test_repeated_get_skips_profile_queries(self):
+        """Test: The second GET is served from the cache"""
+
+        first = self.client.get(self.url)
+        with CaptureQueriesContext(connection) as queries:
+            second = self.client.get(self.url)
+
+        self.assertEqual(second.data, first.data)
+        self.assertFalse(any('profiles_app_profile' in query['sql'] for query in queries))
+        self.assertEqual(metrics.snapshot()['hit_rates']['profile_cache'], 0.5)
+
+    def test_update_refreshes_cached_payload(self):
+        """Test: Changing user or profile fields through PATCH is visible on the next GET"""
+
+        self.client.get(self.url)
+        self.client.patch(self.url, {'first_name': "Changed", 'location': "Hamburg"}, format='json')
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.data['first_name'], "Changed")
+        self.assertEqual(response.data['location'], "Hamburg")
+
+    @override_settings(ALLOWED_HOSTS=['first.example.com', 'second.example.com'])
+    def test_cached_urls_follow_the_request_host(self):
+        """Test: A payload cached through one host is served with the URLs of the next request's host"""
+
+        Profile.objects.filter(id=self.profile.id).update(
+            file='avatars/avatar.png', file_variants={'webp': {'64': 'avatars/avatar-64.webp'}}
+        )
+
+        self.client.get(self.url, HTTP_HOST='first.example.com')
+        response = self.client.get(self.url, HTTP_HOST='second.example.com')
+
+        self.assertEqual(metrics.snapshot()['counters']['profile_cache.hit'], 1)
+        self.assertTrue(response.data['file'].startswith('http://second.example.com/'))
+        self.assertTrue(response.data['file_variants']['webp']['64'].startswith('http://second.example.com/'))
+
+    def test_update_caches_the_returned_payload(self):
+        """Test: The PATCH response and the next cached GET are the same payload"""
+
+        patched = self.client.patch(self.url, {'location': "Hamburg"}, format='json')
+        cached = self.client.get(self.url)
+
+        self.assertEqual(metrics.snapshot()['counters']['profile_cache.hit'], 1)
+        self.assertEqual(cached.data, patched.data)
+
+    def test_direct_user_save_invalidates(self):
+        """Test: Saving the user elsewhere (e.g. admin) drops the cached payload"""
+
+        self.client.get(self.url)
+        self.user.email = "new@example.com"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.save()
+
+        self.assertEqual(self.client.get(self.url).data['email'], "new@example.com")
+
+    def test_invalidation_waits_for_the_commit(self):
+        """Test: A payload cached by a reader before the commit is still dropped once the save commits"""
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.first_name = "Changed"
+            self.user.save()
+            self.client.get(self.url)
+            self.assertEqual(metrics.snapshot()['counters'].get('profile_cache.invalidation', 0), 0)
+
+        self.assertEqual(metrics.snapshot()['counters']['profile_cache.invalidation'], 1)
+        self.assertEqual(self.client.get(self.url).data['first_name'], "Changed")
+        self.assertEqual(metrics.snapshot()['counters']['profile_cache.miss'], 2)
+
+    def test_deleted_profile_is_not_served(self):
+        """Test: A deleted profile returns 404 even if it was cached"""
+
+        self.client.get(self.url)
+        other = User.objects.create_user(username="other", password="password123")
+        Profile.objects.create(user=other, type='customer')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.profile.delete()
+
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_metrics_staff_only(self):
+        """Test: Metrics are visible to staff users only"""
+
+        self.client.get(self.url)
+        self.assertEqual(self.client.get(reverse('metrics')).status_code, status.HTTP_403_FORBIDDEN)
+
+        self.user.is_staff = True
+        self.user.save()
+        response = self.client.get(reverse('metrics'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['counters']['profile_cache.miss'], 1)
@@ -1,4 +1,5 @@
 from django.urls import reverse
+from django.core.cache import cache
 from django.contrib.auth.models import User
 
 from rest_framework import status
@@ -14,6 +15,7 @@ class GetProfileDetailTests(APITestCase):
     def setUp(self):
         """Set up a test user and profile, and authenticate the client"""
         
+        cache.clear()
         self.test_user = User.objects.create_user(username="profileuser", email="profileuser@example.com", password="testpassword")
         self.profile = Profile.objects.create(user=self.test_user, type="customer")
         self.token = Token.objects.create(user=self.test_user)
@@ -0,0 +1,67 @@
+from django.db import connection
+from django.urls import reverse
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth.models import User
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework.authtoken.models import Token
+
+from profiles_app.models import Profile
+
+
+class ProfileBatchTests(APITestCase):
+    """Tests for GET /api/profiles/batch/"""
+
+    def setUp(self):
+        """Create test data"""
+
+        self.users = []
+        for index, profile_type in enumerate(['customer', 'business', 'business']):
+            user = User.objects.create_user(
+                username=f"user{index}", email=f"user{index}@example.com", password="password123",
+                first_name=f"First{index}", last_name=f"Last{index}"
+            )
+            Profile.objects.create(user=user, type=profile_type)
+            self.users.append(user)
+        token = Token.objects.create(user=self.users[0])
+        self.url = reverse('profiles-batch')
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + token.key)
+
+    def test_batch_returns_summaries_in_request_order(self):
+        """Test: Known ids come back in request order, unknown ids are skipped"""
+
+        ids = f"{self.users[2].id},99999,{self.users[0].id},{self.users[2].id}"
+        response = self.client.get(self.url, {'user_ids': ids})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([profile['user'] for profile in response.data], [self.users[2].id, self.users[0].id])
+        self.assertEqual(response.data[0], {
+            'user': self.users[2].id, 'username': "user2", 'first_name': "First2", 'last_name': "Last2",
+            'avatar': None, 'type': 'business'
+        })
+
+    def test_batch_uses_one_query(self):
+        """Test: Profiles and users are loaded in a single query"""
+
+        self.client.get(self.url, {'user_ids': self.users[0].id})
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(self.url, {'user_ids': ','.join(str(user.id) for user in self.users)})
+
+        self.assertEqual(len([query for query in queries if 'profiles_app_profile' in query['sql']]), 1)
+
+    def test_batch_sparse_fields(self):
+        """Test: fields limits the summary, the user id is always included"""
+
+        response = self.client.get(self.url, {'user_ids': self.users[1].id, 'fields': 'username,type'})
+        self.assertEqual(response.data, [{'user': self.users[1].id, 'username': "user1", 'type': 'business'}])
+
+        response = self.client.get(self.url, {'user_ids': self.users[1].id, 'fields': 'email'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_batch_validates_ids(self):
+        """Test: Missing, malformed or too many ids return 400"""
+
+        for params in [{}, {'user_ids': 'a,b'}, {'user_ids': ','.join(str(index) for index in range(1, 102))}]:
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
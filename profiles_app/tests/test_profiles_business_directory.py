@@ -0,0 +1,105 @@
+from django.db import connection
+from django.urls import reverse
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth.models import User
+
+from rest_framework.test import APITestCase
+from rest_framework.authtoken.models import Token
+
+from profiles_app.models import Profile
+from offers_app.models import Offer, OfferDetail
+from orders_app.models import Orders
+from reviews_app.models import Reviews
+
+
+class BusinessDirectoryTests(APITestCase):
+    """Tests for the stats, filters and ordering of GET /api/profiles/business/"""
+
+    def setUp(self):
+        """Create test data"""
+
+        self.customer_user = User.objects.create_user(
+            username="customer1",
+            email="customer@example.com",
+            password="password123"
+        )
+        self.customer_profile = Profile.objects.create(user=self.customer_user, type='customer')
+        self.customer_token = Token.objects.create(user=self.customer_user)
+
+        self.busy = self.create_business("busy")
+        self.quiet = self.create_business("quiet")
+
+        offer = Offer.objects.create(creator=self.busy, title="Website Design", description="Design")
+        Offer.objects.create(creator=self.busy, title="Logo Design", description="Logo")
+        offer_detail = OfferDetail.objects.create(
+            offer=offer,
+            title="Basic Package",
+            revisions=3,
+            delivery_time_in_days=5,
+            price=150.00,
+            features=["Logo Design"],
+            offer_type="basic"
+        )
+        for order_status in ['completed', 'completed', 'in_progress']:
+            Orders.objects.create(
+                offer_detail=offer_detail,
+                customer=self.customer_profile,
+                business=self.busy,
+                title="Basic Package",
+                revisions=3,
+                delivery_time_in_days=5,
+                price=150.00,
+                features=["Logo Design"],
+                offer_type="basic",
+                status=order_status
+            )
+        Reviews.objects.create(business=self.busy, reviewer=self.customer_profile, rating=4)
+        Reviews.objects.create(business=self.quiet, reviewer=self.customer_profile, rating=5)
+
+        self.url = reverse('businessprofiles')
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.customer_token.key)
+
+    def create_business(self, username):
+        user = User.objects.create_user(username=username, email=f"{username}@example.com", password="password123")
+        return Profile.objects.create(user=user, type='business')
+
+    def test_directory_includes_stats(self):
+        """Test: Each business carries offer, review, rating and completed order numbers"""
+
+        response = self.client.get(self.url)
+        busy, quiet = response.data
+
+        self.assertEqual(
+            (busy['offer_count'], busy['review_count'], busy['average_rating'], busy['completed_order_count']),
+            (2, 1, 4.0, 2)
+        )
+        self.assertEqual(
+            (quiet['offer_count'], quiet['review_count'], quiet['average_rating'], quiet['completed_order_count']),
+            (0, 1, 5.0, 0)
+        )
+
+    def test_directory_query_count_is_fixed(self):
+        """Test: More businesses do not add queries"""
+
+        self.client.get(self.url)
+        with CaptureQueriesContext(connection) as few:
+            self.client.get(self.url)
+        for index in range(3):
+            self.create_business(f"extra{index}")
+        with CaptureQueriesContext(connection) as many:
+            response = self.client.get(self.url)
+
+        self.assertEqual(len(response.data), 5)
+        self.assertEqual(len(many), len(few))
+
+    def test_directory_filters_and_orders_by_stats(self):
+        """Test: Stats can be used as filters and ordering fields"""
+
+        response = self.client.get(self.url, {'ordering': '-average_rating'})
+        self.assertEqual([business['username'] for business in response.data], ["quiet", "busy"])
+
+        response = self.client.get(self.url, {'min_completed_order_count': 1})
+        self.assertEqual([business['username'] for business in response.data], ["busy"])
+
+        response = self.client.get(self.url, {'min_average_rating': 4.5, 'min_offer_count': 1})
+        self.assertEqual(response.data, [])
@@ -0,0 +1,87 @@
+from django.db import connection
+from django.urls import reverse
+from django.contrib.auth.models import User
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework.authtoken.models import Token
+
+from profiles_app.models import Profile
+from profiles_app.api.filters import prefix_filter
+
+
+class ProfileSearchTests(APITestCase):
+    """Tests for the search, name, location filters and pagination of the profile lists"""
+
+    def setUp(self):
+        """Create test data"""
+
+        self.profiles = {}
+        for username, first_name, last_name, location, profile_type in [
+            ("webstudio", "Anna", "Berger", "Berlin", 'business'),
+            ("printshop", "Bernd", "Schmidt", "Hamburg", 'business'),
+            ("codecraft", "Clara", "Weber", "berlin-Mitte", 'business'),
+            ("max", "Max", "Mustermann", "Bern", 'customer'),
+            ("erika", "Erika", "Musterfrau", "Köln", 'customer'),
+        ]:
+            user = User.objects.create_user(
+                username=username, email=f"{username}@example.com", password="password123",
+                first_name=first_name, last_name=last_name
+            )
+            self.profiles[username] = Profile.objects.create(user=user, type=profile_type, location=location)
+
+        token = Token.objects.create(user=self.profiles["max"].user)
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + token.key)
+
+    def usernames(self, url_name, params):
+        response = self.client.get(reverse(url_name), params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [profile['username'] for profile in response.data]
+
+    def test_location_prefix_is_case_insensitive(self):
+        """Test: location matches the start of the location regardless of case"""
+
+        self.assertEqual(self.usernames('businessprofiles', {'location': 'BERLIN'}), ["webstudio", "codecraft"])
+        self.assertEqual(self.usernames('customerprofiles', {'location': 'ber'}), ["max"])
+
+    def test_search_matches_any_name_or_location(self):
+        """Test: search looks at username, first name, last name and location"""
+
+        self.assertEqual(self.usernames('businessprofiles', {'search': 'ber'}), ["webstudio", "printshop", "codecraft"])
+        self.assertEqual(self.usernames('customerprofiles', {'search': 'muster'}), ["max", "erika"])
+
+    def test_name_and_username_prefix(self):
+        """Test: name matches first or last name, username matches the username"""
+
+        self.assertEqual(self.usernames('businessprofiles', {'name': 'we'}), ["codecraft"])
+        self.assertEqual(self.usernames('businessprofiles', {'username': 'Print'}), ["printshop"])
+
+    def test_case_folding_is_ascii_only(self):
+        """Test: non-ASCII letters are compared as typed, matching SQLite's LOWER()"""
+
+        self.assertEqual(self.usernames('customerprofiles', {'location': 'KöLN'}), ["erika"])
+        self.assertEqual(self.usernames('customerprofiles', {'location': 'KÖLN'}), [])
+
+    def test_search_uses_expression_indexes(self):
+        """Test: every searched column is answered from its lower-cased index"""
+
+        queryset = prefix_filter(Profile.objects.all(), ['username', 'first_name', 'last_name', 'location'], 'ber')
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute('EXPLAIN QUERY PLAN ' + sql, params)
+            plan = '\n'.join(row[-1] for row in cursor.fetchall())
+
+        for index in ['auth_user_username_lower_idx', 'auth_user_first_name_lower_idx',
+                      'auth_user_last_name_lower_idx', 'profile_location_lower_idx']:
+            self.assertIn(f'USING INDEX {index}', plan)
+        self.assertNotIn('SCAN', plan)
+
+    def test_pagination_only_when_requested(self):
+        """Test: page_size switches to a paginated response that keeps the filters"""
+
+        response = self.client.get(reverse('businessprofiles'), {'search': 'ber', 'page_size': 2})
+
+        self.assertEqual(response.data['count'], 3)
+        self.assertEqual([profile['username'] for profile in response.data['results']], ["webstudio", "printshop"])
+        self.assertIn('search=ber', response.data['next'])
+        self.assertIsInstance(self.client.get(reverse('businessprofiles')).data, list)
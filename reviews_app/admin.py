@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Reviews
+from .models import Reviews, BusinessRatingStats, BusinessLeaderboardEntry
 
 
 @admin.register(Reviews)
@@ -21,3 +21,33 @@ class ReviewsAdmin(admin.ModelAdmin):
             'classes': ('collapse',)
         }),
     )
+
+
+@admin.register(BusinessRatingStats)
+class BusinessRatingStatsAdmin(admin.ModelAdmin):
+    """Read-only admin for the maintained rating stats, rebuilt with reconcile_rating_stats"""
+    
+    list_display = ['business', 'review_count', 'rating_sum', 'updated_at']
+    search_fields = ['business__user__username']
+    list_select_related = ['business__user']
+    
+    def has_add_permission(self, request):
+        return False
+    
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(BusinessLeaderboardEntry)
+class BusinessLeaderboardEntryAdmin(admin.ModelAdmin):
+    """Read-only admin for the stored leaderboard, rebuilt with rebuild_leaderboard"""
+    
+    list_display = ['rank', 'business', 'score', 'review_count', 'average_rating', 'computed_at']
+    search_fields = ['business__user__username']
+    list_select_related = ['business__user']
+    
+    def has_add_permission(self, request):
+        return False
+    
+    def has_change_permission(self, request, obj=None):
+        return False
@@ -1,5 +1,8 @@
 import django_filters
+from rest_framework.filters import OrderingFilter
+
 from reviews_app.models import Reviews
+from reviews_app.search import search_reviews
 
 
 class ReviewsFilter(django_filters.FilterSet):
@@ -7,7 +10,27 @@ class ReviewsFilter(django_filters.FilterSet):
     
     business_user_id = django_filters.NumberFilter(field_name='business__user__id')
     reviewer_id = django_filters.NumberFilter(field_name='reviewer__user__id')
+    search = django_filters.CharFilter(method='filter_search')
     
     class Meta:
         model = Reviews
-        fields = ['business_user_id', 'reviewer_id']
+        fields = ['business_user_id', 'reviewer_id', 'search']
+    
+    def filter_search(self, queryset, name, value):
+        """Full-text search in the description through the review search terms"""
+        
+        return search_reviews(queryset, value)
+
+
+class SearchRankOrderingFilter(OrderingFilter):
+    """Ordering filter that puts the best search matches first unless an explicit ordering is requested."""
+    
+    def get_default_ordering(self, view):
+        ordering = super().get_default_ordering(view)
+        if self.request_searches and ordering:
+            return ['-search_rank', *ordering]
+        return ordering
+    
+    def get_ordering(self, request, queryset, view):
+        self.request_searches = bool(request.query_params.get('search', '').strip())
+        return super().get_ordering(request, queryset, view)
@@ -22,4 +22,5 @@ class IsReviewerOrReadOnly(BasePermission):
         if request.method in ['GET', 'HEAD', 'OPTIONS']:
             return True
         
-        return obj.reviewer.user == request.user
+        profile = getattr(request.user, 'profile', None)
+        return profile is not None and obj.reviewer_id == profile.id
@@ -1,16 +1,17 @@
-from django.contrib.auth.models import User
+from django.db import IntegrityError, transaction
 
 from rest_framework import serializers
+from rest_framework.settings import api_settings
 
-from reviews_app.models import Reviews
+from reviews_app.models import Reviews, BusinessLeaderboardEntry
 from profiles_app.models import Profile
 
 
 class ReviewsListSerializer(serializers.ModelSerializer):
-    """Serializer for Reviews model with custom validation to prevent duplicate reviews."""
+    """Serializer for Reviews model, duplicate reviews are rejected by the unique constraint."""
     
     business_user = serializers.SerializerMethodField()
-    reviewer = serializers.IntegerField(source='reviewer.user.id', read_only=True)
+    reviewer = serializers.IntegerField(source='reviewer.user_id', read_only=True)
     rating = serializers.IntegerField(min_value=1, max_value=5)
     
     class Meta:
@@ -19,33 +20,59 @@ class ReviewsListSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'business_user', 'reviewer', 'created_at', 'updated_at']
     
     def get_business_user(self, obj):
-        return obj.business.user.id
+        return obj.business.user_id
     
     def to_internal_value(self, data):
-        self._business_profile_id = None
-        if 'business_user' in data:
-            business_user_id = data['business_user']
+        """Resolve business_user to the business profile with one lookup on user_id when creating"""
+
+        self._business_profile = None
+        if self.instance is None:
+            if 'business_user' not in data:
+                raise serializers.ValidationError({"business_user": "This field is required."})
             try:
-                user = User.objects.get(id=business_user_id)
-                profile = Profile.objects.get(user=user)
-                self._business_profile_id = profile.id
-            except (User.DoesNotExist, Profile.DoesNotExist):
+                self._business_profile = Profile.objects.get(user_id=data['business_user'], type='business')
+            except (Profile.DoesNotExist, ValueError, TypeError):
                 raise serializers.ValidationError({"business_user": "Business user not found."})
         
         data_copy = data.copy()
         data_copy.pop('business_user', None)
         return super().to_internal_value(data_copy)
     
-    def validate(self, data):
-        request = self.context.get('request')
-        if request and hasattr(self, '_business_profile_id'):
-            reviewer_profile = Profile.objects.get(user=request.user)
-            if Reviews.objects.filter(business_id=self._business_profile_id, reviewer=reviewer_profile).exists():
-                raise serializers.ValidationError("You have already submitted a review for this business user.")
-        return data
-    
     def create(self, validated_data):
-        if hasattr(self, '_business_profile_id') and self._business_profile_id:
-            validated_data['business_id'] = self._business_profile_id
-        return super().create(validated_data)
-        
\ No newline at end of file
+        if self._business_profile is not None:
+            validated_data['business'] = self._business_profile
+        try:
+            with transaction.atomic():
+                return super().create(validated_data)
+        except IntegrityError:
+            # Only the (business, reviewer) constraint is a duplicate review, any other violation is a real error.
+            if not Reviews.objects.filter(business=validated_data['business'], reviewer=validated_data['reviewer']).exists():
+                raise
+            raise serializers.ValidationError({
+                api_settings.NON_FIELD_ERRORS_KEY: ["You have already submitted a review for this business user."]
+            })
+    
+
+class ReviewSummarySerializer(serializers.Serializer):
+    """Serializer for the maintained rating stats of a business user"""
+
+    business_user = serializers.IntegerField()
+    review_count = serializers.IntegerField(source='stats.review_count')
+    average_rating = serializers.FloatField(source='stats.average_rating')
+
+
+class ReviewDistributionSerializer(ReviewSummarySerializer):
+    """Serializer for the rating histogram of a business user"""
+
+    histogram = serializers.DictField(source='stats.histogram', child=serializers.IntegerField())
+
+
+class BusinessLeaderboardSerializer(serializers.ModelSerializer):
+    """Serializer for a stored leaderboard rank"""
+
+    business_user = serializers.IntegerField(source='business.user_id', read_only=True)
+    username = serializers.CharField(source='business.user.username', read_only=True)
+
+    class Meta:
+        model = BusinessLeaderboardEntry
+        fields = ['rank', 'business_user', 'username', 'score', 'review_count', 'average_rating', 'computed_at']
@@ -1,8 +1,11 @@
 from django.urls import path
-from .views import ReviewsListCreateView, ReviewDetailView
+from .views import ReviewsListCreateView, ReviewDetailView, ReviewSummaryView, ReviewDistributionView, BusinessLeaderboardView
 
 
 urlpatterns = [
     path('reviews/', ReviewsListCreateView.as_view(), name='reviews-list-create'),
     path('reviews/<int:pk>/', ReviewDetailView.as_view(), name='review-detail'),
+    path('review-summary/<int:business_user_id>/', ReviewSummaryView.as_view(), name='review-summary'),
+    path('review-distribution/<int:business_user_id>/', ReviewDistributionView.as_view(), name='review-distribution'),
+    path('review-leaderboard/', BusinessLeaderboardView.as_view(), name='review-leaderboard'),
 ]
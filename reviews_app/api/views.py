@@ -1,21 +1,30 @@
-from rest_framework import generics
+from django.core.cache import cache
+
+from rest_framework import generics, status
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.utils.urls import replace_query_param, remove_query_param
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.filters import OrderingFilter
 from django_filters.rest_framework import DjangoFilterBackend
 
-from reviews_app.models import Reviews
+from reviews_app.models import Reviews, BusinessRatingStats, BusinessLeaderboardEntry
 from profiles_app.models import Profile
-from .serializers import ReviewsListSerializer
+from reviews_app.stats import DISTRIBUTION_CACHE_TIMEOUT, distribution_cache_key
+from .serializers import (
+    ReviewsListSerializer, ReviewSummarySerializer, ReviewDistributionSerializer, BusinessLeaderboardSerializer
+)
 from .permissions import IsCustomerUser, IsReviewerOrReadOnly
-from .filters import ReviewsFilter
+from .filters import ReviewsFilter, SearchRankOrderingFilter
 
 
 class ReviewsListCreateView(generics.ListCreateAPIView):
     """View to list all reviews and allow customer users to create new reviews."""
     
-    queryset = Reviews.objects.all().order_by('-rating', '-created_at')
+    queryset = Reviews.objects.select_related('business', 'reviewer').order_by('-rating', '-created_at')
     serializer_class = ReviewsListSerializer
-    filter_backends = [DjangoFilterBackend, OrderingFilter]
+    filter_backends = [DjangoFilterBackend, SearchRankOrderingFilter]
     filterset_class = ReviewsFilter
     ordering_fields = ['updated_at', 'rating']
     ordering = ['-rating', '-created_at']
@@ -28,16 +37,15 @@ class ReviewsListCreateView(generics.ListCreateAPIView):
         return [IsAuthenticated()]
     
     def perform_create(self, serializer):
-        """The logged-in user is automatically the reviewer"""
+        """The logged-in user is automatically the reviewer, its profile is loaded with the user at authentication"""
         
-        reviewer_profile = Profile.objects.get(user=self.request.user)
-        serializer.save(reviewer=reviewer_profile)
+        serializer.save(reviewer=self.request.user.profile)
     
 
 class ReviewDetailView(generics.RetrieveUpdateDestroyAPIView):
     """View to retrieve, update, or delete a specific review."""
     
-    queryset = Reviews.objects.all()
+    queryset = Reviews.objects.select_related('business', 'reviewer')
     serializer_class = ReviewsListSerializer
     permission_classes = [IsAuthenticated, IsReviewerOrReadOnly]
     
@@ -47,3 +55,103 @@ class ReviewDetailView(generics.RetrieveUpdateDestroyAPIView):
         if self.request.method in ['PUT', 'PATCH', 'DELETE']:
             return [IsAuthenticated(), IsReviewerOrReadOnly()]
         return [IsAuthenticated()]
+
+
+class ReviewSummaryView(APIView):
+    """API view for the review count and average rating of a business user"""
+
+    permission_classes = [IsAuthenticated]
+    serializer_class = ReviewSummarySerializer
+
+    def get(self, request, business_user_id):
+        serializer = self.serializer_class({'business_user': business_user_id, 'stats': self.get_stats(business_user_id)})
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+    def get_stats(self, business_user_id):
+        """Read the maintained stats row instead of aggregating the reviews"""
+
+        try:
+            business = Profile.objects.select_related('rating_stats').get(user_id=business_user_id, type='business')
+        except Profile.DoesNotExist:
+            raise NotFound("No business user matching the specified ID was found.")
+
+        try:
+            return business.rating_stats
+        except BusinessRatingStats.DoesNotExist:
+            return BusinessRatingStats(business=business)
+
+
+class ReviewDistributionView(ReviewSummaryView):
+    """API view for the rating histogram of a business user, cached until the next review write"""
+
+    serializer_class = ReviewDistributionSerializer
+
+    def get(self, request, business_user_id):
+        key = distribution_cache_key(business_user_id)
+        data = cache.get(key)
+        if data is None:
+            data = self.serializer_class({'business_user': business_user_id, 'stats': self.get_stats(business_user_id)}).data
+            cache.set(key, data, DISTRIBUTION_CACHE_TIMEOUT)
+        return Response(data, status=status.HTTP_200_OK)
+
+
+class LeaderboardPagination(PageNumberPagination):
+    """
+    Pagination that selects a page by rank range on the unique rank index instead of OFFSET.
+
+    rebuild_leaderboard stores ranks 1..n, but deleting a business profile leaves a gap until the
+    next rebuild; while the highest rank differs from the entry count the page is read with OFFSET.
+    """
+
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        page_size = self.get_page_size(request)
+        try:
+            self.number = int(request.query_params.get(self.page_query_param, 1))
+        except ValueError:
+            self.number = 0
+        
+        self.count = queryset.count()
+        first_rank = (self.number - 1) * page_size
+        if self.number < 1 or (self.number > 1 and first_rank >= self.count):
+            raise NotFound("Invalid page.")
+        
+        self.has_next = first_rank + page_size < self.count
+        last_rank = queryset.order_by('-rank').values_list('rank', flat=True).first() or 0
+        if last_rank == self.count:
+            return list(queryset.filter(rank__gt=first_rank, rank__lte=first_rank + page_size))
+        return list(queryset.order_by('rank')[first_rank:first_rank + page_size])
+
+    def get_paginated_response(self, data):
+        return Response({
+            'count': self.count,
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        return replace_query_param(self.request.build_absolute_uri(), self.page_query_param, self.number + 1)
+
+    def get_previous_link(self):
+        if self.number == 1:
+            return None
+        url = self.request.build_absolute_uri()
+        if self.number == 2:
+            return remove_query_param(url, self.page_query_param)
+        return replace_query_param(url, self.page_query_param, self.number - 1)
+
+
+class BusinessLeaderboardView(generics.ListAPIView):
+    """API view for the top rated businesses, read from the precomputed leaderboard"""
+
+    permission_classes = [IsAuthenticated]
+    serializer_class = BusinessLeaderboardSerializer
+    pagination_class = LeaderboardPagination
+    queryset = BusinessLeaderboardEntry.objects.select_related('business__user')
@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class ReviewsAppConfig(AppConfig):
     name = 'reviews_app'
+
+    def ready(self):
+        from reviews_app import signals  # noqa: F401
@@ -0,0 +1,51 @@
+import numpy as np
+
+from django.db import transaction
+from django.utils import timezone
+
+from reviews_app.models import BusinessRatingStats, BusinessLeaderboardEntry
+
+
+DEFAULT_PRIOR_WEIGHT = 10
+
+
+def bayesian_scores(counts, sums, prior_weight):
+    """Shrink each business average towards the global mean by prior_weight virtual reviews"""
+
+    global_mean = sums.sum() / counts.sum()
+    return (prior_weight * global_mean + sums) / (prior_weight + counts)
+
+
+def rank_order(business_ids, counts, scores):
+    """Indices sorted by score, then review count (both descending), then business id"""
+
+    return np.lexsort((business_ids, -counts, -scores))
+
+
+def rebuild_leaderboard(prior_weight=DEFAULT_PRIOR_WEIGHT, batch_size=1000):
+    """Recompute every rank from the maintained rating stats and replace the stored leaderboard"""
+
+    rows = np.array(
+        BusinessRatingStats.objects.filter(review_count__gt=0).values_list('business_id', 'review_count', 'rating_sum'),
+        dtype=np.int64
+    ).reshape(-1, 3)
+    business_ids, counts, sums = rows[:, 0], rows[:, 1], rows[:, 2]
+
+    entries = []
+    if len(rows):
+        scores = bayesian_scores(counts, sums, prior_weight)
+        averages = sums / counts
+        computed_at = timezone.now()
+        entries = [
+            BusinessLeaderboardEntry(
+                business_id=int(business_ids[index]), rank=rank, score=round(float(scores[index]), 4),
+                review_count=int(counts[index]), average_rating=round(float(averages[index]), 1),
+                computed_at=computed_at
+            )
+            for rank, index in enumerate(rank_order(business_ids, counts, scores), start=1)
+        ]
+
+    with transaction.atomic():
+        BusinessLeaderboardEntry.objects.all().delete()
+        BusinessLeaderboardEntry.objects.bulk_create(entries, batch_size=batch_size)
+    return len(entries)
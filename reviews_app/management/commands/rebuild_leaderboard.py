@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from reviews_app.leaderboard import DEFAULT_PRIOR_WEIGHT, rebuild_leaderboard
+
+
+class Command(BaseCommand):
+    """Recompute the Bayesian-weighted business leaderboard from the rating stats"""
+
+    help = (
+        "Rank all reviewed businesses by Bayesian average (global mean weighted by --prior-weight "
+        "virtual reviews) and store the result for /api/review-leaderboard/. Run it periodically, e.g. from cron."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--prior-weight', type=float, default=DEFAULT_PRIOR_WEIGHT,
+            help="Number of virtual reviews at the global mean added to every business."
+        )
+        parser.add_argument('--batch-size', type=int, default=1000, help="Rows per INSERT.")
+
+    def handle(self, *args, **options):
+        if options['prior_weight'] < 0 or options['batch_size'] < 1:
+            raise CommandError("--prior-weight must not be negative and --batch-size must be at least 1.")
+
+        ranked = rebuild_leaderboard(options['prior_weight'], options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"Ranked {ranked} businesses."))
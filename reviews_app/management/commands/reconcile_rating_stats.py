@@ -0,0 +1,53 @@
+from django.db import transaction
+from django.core.management.base import BaseCommand, CommandError
+
+from reviews_app.models import Reviews, BusinessRatingStats
+from reviews_app.stats import aggregate_rating_stats
+
+
+class Command(BaseCommand):
+    """Rebuild the business rating stats from Reviews, one chunk of businesses per transaction"""
+
+    help = (
+        "Recompute BusinessRatingStats from the reviews table in chunks of --batch-size businesses "
+        "and report how many rows had drifted."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help="Number of businesses per transaction.")
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        if batch_size < 1:
+            raise CommandError("--batch-size must be at least 1.")
+
+        business_ids = sorted(
+            set(Reviews.objects.values_list('business_id', flat=True).distinct())
+            | set(BusinessRatingStats.objects.values_list('business_id', flat=True))
+        )
+        drifted = 0
+        for start in range(0, len(business_ids), batch_size):
+            drifted += self.rebuild_chunk(business_ids[start:start + batch_size])
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Reconciled rating stats for {len(business_ids)} businesses, {drifted} had drifted."
+        ))
+
+    def rebuild_chunk(self, business_ids):
+        """Replace the chunk's stats rows with freshly aggregated ones and count the changed rows"""
+
+        with transaction.atomic():
+            current = {
+                stats.business_id: self.snapshot(stats)
+                for stats in BusinessRatingStats.objects.select_for_update().filter(business_id__in=business_ids)
+            }
+            fresh = aggregate_rating_stats(business_ids)
+            drifted = sum(current.pop(stats.business_id, None) != self.snapshot(stats) for stats in fresh)
+            drifted += sum(snapshot[0] != 0 for snapshot in current.values())
+
+            BusinessRatingStats.objects.filter(business_id__in=business_ids).delete()
+            BusinessRatingStats.objects.bulk_create(fresh)
+        return drifted
+
+    def snapshot(self, stats):
+        return (stats.review_count, stats.rating_sum, *stats.histogram.values())
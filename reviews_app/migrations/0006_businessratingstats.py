@@ -0,0 +1,45 @@
+# Generated by Django 6.0.1 on 2026-10-19 10:59
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum
+
+
+def build_rating_stats(apps, schema_editor):
+    """Aggregate the existing reviews into one stats row per business"""
+
+    Reviews = apps.get_model('reviews_app', 'Reviews')
+    BusinessRatingStats = apps.get_model('reviews_app', 'BusinessRatingStats')
+
+    rows = Reviews.objects.values('business_id').annotate(
+        review_count=Count('id'),
+        rating_sum=Sum('rating'),
+        **{f'rating_{rating}': Count('id', filter=Q(rating=rating)) for rating in range(1, 6)}
+    ).order_by()
+    BusinessRatingStats.objects.bulk_create([BusinessRatingStats(**row) for row in rows], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles_app', '0004_remove_profile_email_remove_profile_first_name_and_more'),
+        ('reviews_app', '0005_alter_reviews_rating'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BusinessRatingStats',
+            fields=[
+                ('business', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='rating_stats', serialize=False, to='profiles_app.profile')),
+                ('review_count', models.IntegerField(default=0)),
+                ('rating_sum', models.IntegerField(default=0)),
+                ('rating_1', models.IntegerField(default=0)),
+                ('rating_2', models.IntegerField(default=0)),
+                ('rating_3', models.IntegerField(default=0)),
+                ('rating_4', models.IntegerField(default=0)),
+                ('rating_5', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.RunPython(build_rating_stats, migrations.RunPython.noop),
+    ]
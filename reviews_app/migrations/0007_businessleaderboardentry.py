@@ -0,0 +1,29 @@
+# Generated by Django 6.0.1 on 2026-10-19 11:08
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles_app', '0004_remove_profile_email_remove_profile_first_name_and_more'),
+        ('reviews_app', '0006_businessratingstats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BusinessLeaderboardEntry',
+            fields=[
+                ('business', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='leaderboard_entry', serialize=False, to='profiles_app.profile')),
+                ('rank', models.PositiveIntegerField(unique=True)),
+                ('score', models.FloatField()),
+                ('review_count', models.IntegerField()),
+                ('average_rating', models.FloatField()),
+                ('computed_at', models.DateTimeField()),
+            ],
+            options={
+                'ordering': ['rank'],
+            },
+        ),
+    ]
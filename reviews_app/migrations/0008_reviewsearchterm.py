@@ -0,0 +1,63 @@
+# Generated by Django 6.0.1 on 2026-10-19 11:12
+
+import re
+from collections import Counter
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+# Frozen copy of reviews_app.search.tokenize as of this migration
+WORD_PATTERN = re.compile(r'\w+')
+MAX_TERM_LENGTH = 64
+STOP_WORDS = frozenset([
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'but', 'by', 'for', 'if', 'in', 'is', 'it', 'no', 'not',
+    'of', 'on', 'or', 'so', 'the', 'to', 'was', 'we', 'with',
+    'der', 'die', 'das', 'und', 'ist', 'ein', 'eine', 'nicht', 'mit', 'zu',
+])
+
+
+def tokenize(text):
+    terms = (word[:MAX_TERM_LENGTH] for word in WORD_PATTERN.findall(text.lower()))
+    return Counter(term for term in terms if len(term) > 1 and term not in STOP_WORDS)
+
+
+def index_existing_reviews(apps, schema_editor):
+    """Build the search terms of all existing reviews"""
+
+    Reviews = apps.get_model('reviews_app', 'Reviews')
+    ReviewSearchTerm = apps.get_model('reviews_app', 'ReviewSearchTerm')
+
+    batch = []
+    for review_id, description in Reviews.objects.values_list('id', 'description').iterator(chunk_size=2000):
+        batch.extend(
+            ReviewSearchTerm(review_id=review_id, term=term, frequency=frequency)
+            for term, frequency in tokenize(description).items()
+        )
+        if len(batch) >= 2000:
+            ReviewSearchTerm.objects.bulk_create(batch)
+            batch = []
+    ReviewSearchTerm.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews_app', '0007_businessleaderboardentry'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReviewSearchTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=64)),
+                ('frequency', models.PositiveSmallIntegerField(default=1)),
+                ('review', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_terms', to='reviews_app.reviews')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('term', 'review'), name='unique_review_search_term')],
+            },
+        ),
+        migrations.RunPython(index_existing_reviews, migrations.RunPython.noop),
+    ]
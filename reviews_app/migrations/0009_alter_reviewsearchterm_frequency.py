@@ -0,0 +1,18 @@
+# Generated by Django 6.0.1 on 2026-10-19 13:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews_app', '0008_reviewsearchterm'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='reviewsearchterm',
+            name='frequency',
+            field=models.PositiveIntegerField(default=1),
+        ),
+    ]
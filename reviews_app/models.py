@@ -1,4 +1,4 @@
-from django.db import models
+from django.db import models, transaction
 from django.core.validators import MinValueValidator, MaxValueValidator
 
 
@@ -20,4 +20,80 @@ class Reviews(models.Model):
 
     def __str__(self):
         return f"Review {self.id} for business {self.business.user.username} by {self.reviewer.user.username}"
-    
\ No newline at end of file
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the stored rating and description so changes can be applied to stats and search terms"""
+
+        instance = super().from_db(db, field_names, values)
+        instance._stored_rating = instance.__dict__.get('rating')
+        instance._stored_description = instance.__dict__.get('description')
+        return instance
+
+    def save(self, *args, **kwargs):
+        """Write the review and its rating stats in one transaction"""
+
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
+
+class ReviewSearchTerm(models.Model):
+    """Model for the inverted index over review descriptions, one row per distinct term of a review."""
+
+    review = models.ForeignKey(Reviews, on_delete=models.CASCADE, related_name='search_terms')
+    term = models.CharField(max_length=64)
+    frequency = models.PositiveIntegerField(default=1)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['term', 'review'], name='unique_review_search_term'),
+        ]
+
+    def __str__(self):
+        return f"{self.term} in review {self.review_id}"
+
+
+class BusinessRatingStats(models.Model):
+    """Model holding the review count, rating sum and rating histogram of one business profile."""
+
+    business = models.OneToOneField(
+        'profiles_app.Profile', on_delete=models.CASCADE, primary_key=True, related_name='rating_stats'
+    )
+    review_count = models.IntegerField(default=0)
+    rating_sum = models.IntegerField(default=0)
+    rating_1 = models.IntegerField(default=0)
+    rating_2 = models.IntegerField(default=0)
+    rating_3 = models.IntegerField(default=0)
+    rating_4 = models.IntegerField(default=0)
+    rating_5 = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Rating stats for business profile {self.business_id}"
+
+    @property
+    def average_rating(self):
+        return round(self.rating_sum / self.review_count, 1) if self.review_count else 0.0
+
+    @property
+    def histogram(self):
+        return {str(rating): getattr(self, f'rating_{rating}') for rating in range(1, 6)}
+
+
+class BusinessLeaderboardEntry(models.Model):
+    """Model storing the precomputed Bayesian-weighted rank of a business, rebuilt by rebuild_leaderboard."""
+
+    business = models.OneToOneField(
+        'profiles_app.Profile', on_delete=models.CASCADE, primary_key=True, related_name='leaderboard_entry'
+    )
+    rank = models.PositiveIntegerField(unique=True)
+    score = models.FloatField()
+    review_count = models.IntegerField()
+    average_rating = models.FloatField()
+    computed_at = models.DateTimeField()
+
+    class Meta:
+        ordering = ['rank']
+
+    def __str__(self):
+        return f"#{self.rank} business profile {self.business_id}"
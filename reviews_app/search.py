@@ -0,0 +1,53 @@
+import re
+from collections import Counter
+
+from django.db.models import OuterRef, Subquery, Value, Count, Sum
+
+from reviews_app.models import ReviewSearchTerm
+
+
+WORD_PATTERN = re.compile(r'\w+')
+MAX_TERM_LENGTH = 64
+STOP_WORDS = frozenset([
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'but', 'by', 'for', 'if', 'in', 'is', 'it', 'no', 'not',
+    'of', 'on', 'or', 'so', 'the', 'to', 'was', 'we', 'with',
+    'der', 'die', 'das', 'und', 'ist', 'ein', 'eine', 'nicht', 'mit', 'zu',
+])
+
+
+def tokenize(text):
+    """Split text into lower-cased terms with their frequencies, skipping stop words and single characters"""
+
+    terms = (word[:MAX_TERM_LENGTH] for word in WORD_PATTERN.findall(text.lower()))
+    return Counter(term for term in terms if len(term) > 1 and term not in STOP_WORDS)
+
+
+def index_review(review, created=False):
+    """Replace the search terms of one review, a new review has none to delete"""
+
+    if not created:
+        ReviewSearchTerm.objects.filter(review=review).delete()
+    ReviewSearchTerm.objects.bulk_create([
+        ReviewSearchTerm(review=review, term=term, frequency=frequency)
+        for term, frequency in tokenize(review.description).items()
+    ])
+
+
+def search_reviews(queryset, query):
+    """
+    Keep reviews containing every term of the query, annotated with search_rank (total term frequency).
+
+    A query made only of stop words has nothing to match and leaves the queryset unfiltered.
+    """
+
+    terms = list(tokenize(query))
+    if not terms:
+        return queryset.annotate(search_rank=Value(0))
+
+    matching_ids = ReviewSearchTerm.objects.filter(term__in=terms).values('review_id').annotate(
+        matched=Count('term')
+    ).filter(matched=len(terms)).values('review_id')
+    rank = ReviewSearchTerm.objects.filter(review=OuterRef('pk'), term__in=terms).values('review_id').annotate(
+        total=Sum('frequency')
+    ).values('total')
+    return queryset.filter(id__in=matching_ids).annotate(search_rank=Subquery(rank))
@@ -0,0 +1,50 @@
+from django.dispatch import receiver
+from django.db.models.signals import post_save, post_delete
+
+from reviews_app.models import Reviews
+from reviews_app.search import index_review
+from profiles_app.models import Profile
+from reviews_app.stats import (
+    record_review_added, record_review_removed, record_rating_changed, invalidate_distribution
+)
+
+
+def business_user_id(review):
+    """Look up the business user without loading the profile unless it is already cached"""
+
+    if Reviews.business.is_cached(review):
+        return review.business.user_id
+    return Profile.objects.filter(pk=review.business_id).values_list('user_id', flat=True).first()
+
+
+@receiver(post_save, sender=Reviews)
+def update_search_terms_on_save(sender, instance, created, raw=False, **kwargs):
+    """Re-index the description of new and edited reviews, deleted reviews drop their terms by cascade"""
+
+    if raw:
+        return
+    if created or getattr(instance, '_stored_description', None) != instance.description:
+        index_review(instance, created)
+        instance._stored_description = instance.description
+
+
+@receiver(post_save, sender=Reviews)
+def update_stats_on_save(sender, instance, created, raw=False, **kwargs):
+    """Keep the business rating stats in step with created and re-rated reviews"""
+
+    if raw:
+        return
+    if created:
+        record_review_added(instance.business_id, instance.rating)
+    elif getattr(instance, '_stored_rating', None) not in (None, instance.rating):
+        record_rating_changed(instance.business_id, instance._stored_rating, instance.rating)
+    else:
+        return
+    instance._stored_rating = instance.rating
+    invalidate_distribution(business_user_id(instance))
+
+
+@receiver(post_delete, sender=Reviews)
+def update_stats_on_delete(sender, instance, **kwargs):
+    record_review_removed(instance.business_id, instance.rating)
+    invalidate_distribution(business_user_id(instance))
@@ -0,0 +1,78 @@
+from django.db import IntegrityError, transaction
+from django.core.cache import cache
+from django.db.models import Count, F, Q, Sum
+
+from reviews_app.models import Reviews, BusinessRatingStats
+
+
+DISTRIBUTION_CACHE_TIMEOUT = 300
+
+
+def distribution_cache_key(business_user_id):
+    return f'reviews:distribution:{business_user_id}'
+
+
+def invalidate_distribution(business_user_id):
+    """Drop the cached distribution once the current transaction has committed"""
+
+    if business_user_id is None:
+        return
+    transaction.on_commit(lambda: cache.delete(distribution_cache_key(business_user_id)), robust=True)
+
+
+def rating_field(rating):
+    return f'rating_{rating}'
+
+
+def record_review_added(business_id, rating):
+    """Count a new review, creating the stats row on the business's first review"""
+
+    stats = BusinessRatingStats.objects.filter(business_id=business_id)
+    changes = {
+        'review_count': F('review_count') + 1,
+        'rating_sum': F('rating_sum') + rating,
+        rating_field(rating): F(rating_field(rating)) + 1,
+    }
+    if stats.update(**changes):
+        return
+
+    try:
+        with transaction.atomic():
+            BusinessRatingStats.objects.create(
+                business_id=business_id, review_count=1, rating_sum=rating, **{rating_field(rating): 1}
+            )
+    except IntegrityError:
+        stats.update(**changes)
+
+
+def record_review_removed(business_id, rating):
+    BusinessRatingStats.objects.filter(business_id=business_id).update(
+        review_count=F('review_count') - 1,
+        rating_sum=F('rating_sum') - rating,
+        **{rating_field(rating): F(rating_field(rating)) - 1}
+    )
+
+
+def record_rating_changed(business_id, previous_rating, rating):
+    """Move one review from its previous histogram bucket into the current one"""
+
+    if rating == previous_rating:
+        return
+    BusinessRatingStats.objects.filter(business_id=business_id).update(
+        rating_sum=F('rating_sum') + rating - previous_rating,
+        **{
+            rating_field(previous_rating): F(rating_field(previous_rating)) - 1,
+            rating_field(rating): F(rating_field(rating)) + 1,
+        }
+    )
+
+
+def aggregate_rating_stats(business_ids):
+    """Compute fresh stats rows for the given businesses in one grouped query"""
+
+    rows = Reviews.objects.filter(business_id__in=business_ids).values('business_id').annotate(
+        review_count=Count('id'),
+        rating_sum=Sum('rating'),
+        **{rating_field(rating): Count('id', filter=Q(rating=rating)) for rating in range(1, 6)}
+    ).order_by()
+    return [BusinessRatingStats(**row) for row in rows]
@@ -0,0 +1,97 @@
+from django.db import connection
+from django.urls import reverse
+from django.core.cache import cache
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth.models import User
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework.authtoken.models import Token
+
+from profiles_app.models import Profile
+from reviews_app.models import Reviews
+
+
+class ReviewDistributionTests(APITestCase):
+    """Tests for GET /api/review-distribution/{business_user_id}/ and the review list queries"""
+
+    def setUp(self):
+        """Create test data"""
+
+        cache.clear()
+        self.customers = []
+        for index in range(3):
+            user = User.objects.create_user(
+                username=f"customer{index}",
+                email=f"customer{index}@example.com",
+                password="password123"
+            )
+            self.customers.append(Profile.objects.create(user=user, type='customer'))
+        self.customer_token = Token.objects.create(user=self.customers[0].user)
+
+        self.business_user = User.objects.create_user(
+            username="business1",
+            email="business1@example.com",
+            password="password123"
+        )
+        self.business_profile = Profile.objects.create(user=self.business_user, type='business')
+
+        self.url = reverse('review-distribution', kwargs={'business_user_id': self.business_user.id})
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.customer_token.key)
+
+    def create_review(self, reviewer, rating):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Reviews.objects.create(business=self.business_profile, reviewer=reviewer, rating=rating)
+
+    def test_distribution_histogram(self):
+        """Test: Histogram, count and mean of the business"""
+
+        self.create_review(self.customers[0], 5)
+        self.create_review(self.customers[1], 5)
+        self.create_review(self.customers[2], 2)
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['histogram'], {'1': 0, '2': 1, '3': 0, '4': 0, '5': 2})
+        self.assertEqual(response.data['review_count'], 3)
+        self.assertEqual(response.data['average_rating'], 4.0)
+
+    def test_distribution_cached_until_review_write(self):
+        """Test: Repeated reads hit the cache, a new review invalidates it"""
+
+        self.create_review(self.customers[0], 4)
+        self.client.get(self.url)
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(self.url)
+        self.assertFalse(any('reviews_app' in query['sql'] or 'profiles_app' in query['sql'] for query in queries))
+
+        review = self.create_review(self.customers[1], 1)
+        self.assertEqual(self.client.get(self.url).data['review_count'], 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            review.delete()
+        self.assertEqual(self.client.get(self.url).data['histogram']['1'], 0)
+
+    def test_distribution_unknown_business(self):
+        """Test: Unknown business users return 404"""
+
+        response = self.client.get(reverse('review-distribution', kwargs={'business_user_id': 99999}))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_review_list_query_count(self):
+        """Test: Listing reviews does not query the business or reviewer per review"""
+
+        self.create_review(self.customers[0], 4)
+        url = reverse('reviews-list-create')
+        self.client.get(url)
+        with CaptureQueriesContext(connection) as few:
+            self.client.get(url)
+
+        self.create_review(self.customers[1], 3)
+        self.create_review(self.customers[2], 5)
+        with CaptureQueriesContext(connection) as many:
+            response = self.client.get(url)
+
+        self.assertEqual(len(many), len(few))
+        self.assertEqual(response.data[0]['business_user'], self.business_user.id)
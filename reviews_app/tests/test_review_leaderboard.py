@@ -0,0 +1,109 @@
+from io import StringIO
+
+import numpy as np
+
+from django.urls import reverse
+from django.core.management import call_command
+from django.contrib.auth.models import User
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework.authtoken.models import Token
+
+from profiles_app.models import Profile
+from reviews_app.models import Reviews, BusinessLeaderboardEntry
+from reviews_app.leaderboard import bayesian_scores
+
+
+class BusinessLeaderboardTests(APITestCase):
+    """Tests for the rebuild_leaderboard command and GET /api/review-leaderboard/"""
+
+    def setUp(self):
+        """Create test data"""
+
+        self.customers = []
+        for index in range(6):
+            user = User.objects.create_user(
+                username=f"customer{index}",
+                email=f"customer{index}@example.com",
+                password="password123"
+            )
+            self.customers.append(Profile.objects.create(user=user, type='customer'))
+        self.customer_token = Token.objects.create(user=self.customers[0].user)
+
+        self.single_review, self.many_reviews, self.low_rated = [
+            Profile.objects.create(
+                user=User.objects.create_user(username=username, email=f"{username}@example.com", password="password123"),
+                type='business'
+            )
+            for username in ["single", "many", "low"]
+        ]
+        self.add_reviews(self.single_review, [5])
+        self.add_reviews(self.many_reviews, [5, 5, 5, 5, 5, 4])
+        self.add_reviews(self.low_rated, [1, 1])
+
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.customer_token.key)
+
+    def add_reviews(self, business, ratings):
+        for reviewer, rating in zip(self.customers, ratings):
+            Reviews.objects.create(business=business, reviewer=reviewer, rating=rating)
+
+    def test_bayesian_scores(self):
+        """Test: Scores shrink towards the global mean by the prior weight"""
+
+        scores = bayesian_scores(np.array([1, 6, 2]), np.array([5, 29, 2]), 10)
+
+        np.testing.assert_allclose(scores, [45 / 11, 69 / 16, 42 / 12])
+
+    def test_rebuild_ranks_many_reviews_above_single_review(self):
+        """Test: A single 5-star review does not outrank a long record of high ratings"""
+
+        call_command('rebuild_leaderboard', stdout=StringIO())
+        response = self.client.get(reverse('review-leaderboard'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 3)
+        self.assertEqual([entry['username'] for entry in response.data['results']], ["many", "single", "low"])
+        self.assertEqual(response.data['results'][0]['rank'], 1)
+        self.assertEqual(response.data['results'][0]['review_count'], 6)
+        self.assertEqual(response.data['results'][0]['average_rating'], 4.8)
+
+    def test_leaderboard_pages_by_rank(self):
+        """Test: Pages are read by rank range and out-of-range pages return 404"""
+
+        call_command('rebuild_leaderboard', stdout=StringIO())
+        url = reverse('review-leaderboard')
+
+        response = self.client.get(url, {'page': 2, 'page_size': 1})
+        self.assertEqual(response.data['results'][0]['username'], "single")
+        self.assertIn('page=3', response.data['next'])
+        self.assertNotIn('page=', response.data['previous'])
+
+        response = self.client.get(url, {'page': 4, 'page_size': 1})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_leaderboard_pages_around_deleted_entries(self):
+        """Test: A rank gap left by a deleted profile does not shorten pages or break the count"""
+
+        call_command('rebuild_leaderboard', stdout=StringIO())
+        self.single_review.delete()
+        url = reverse('review-leaderboard')
+
+        response = self.client.get(url, {'page': 2, 'page_size': 1})
+        self.assertEqual(response.data['count'], 2)
+        self.assertEqual([entry['username'] for entry in response.data['results']], ["low"])
+        self.assertIsNone(response.data['next'])
+
+        response = self.client.get(url, {'page': 3, 'page_size': 1})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_rebuild_replaces_previous_ranks(self):
+        """Test: Businesses without reviews drop out on the next rebuild"""
+
+        call_command('rebuild_leaderboard', stdout=StringIO())
+        Reviews.objects.filter(business=self.low_rated).delete()
+        call_command('rebuild_leaderboard', prior_weight=0, stdout=StringIO())
+
+        self.assertEqual(list(BusinessLeaderboardEntry.objects.values_list('rank', 'business_id')), [
+            (1, self.single_review.id), (2, self.many_reviews.id)
+        ])
@@ -0,0 +1,121 @@
+from django.urls import reverse
+from django.contrib.auth.models import User
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework.authtoken.models import Token
+
+from profiles_app.models import Profile
+from reviews_app.models import Reviews, ReviewSearchTerm
+from reviews_app.search import tokenize
+
+
+class ReviewSearchTests(APITestCase):
+    """Tests for the search filter on GET /api/reviews/"""
+
+    def setUp(self):
+        """Create test data"""
+
+        self.customers = []
+        for index in range(3):
+            user = User.objects.create_user(
+                username=f"customer{index}",
+                email=f"customer{index}@example.com",
+                password="password123"
+            )
+            self.customers.append(Profile.objects.create(user=user, type='customer'))
+        self.customer_token = Token.objects.create(user=self.customers[0].user)
+
+        self.business_user1 = User.objects.create_user(
+            username="business1",
+            email="business1@example.com",
+            password="password123"
+        )
+        self.business_profile1 = Profile.objects.create(user=self.business_user1, type='business')
+        self.business_user2 = User.objects.create_user(
+            username="business2",
+            email="business2@example.com",
+            password="password123"
+        )
+        self.business_profile2 = Profile.objects.create(user=self.business_user2, type='business')
+
+        self.late_once = Reviews.objects.create(
+            business=self.business_profile1, reviewer=self.customers[0], rating=3,
+            description="Nice logo, but late delivery."
+        )
+        self.late_twice = Reviews.objects.create(
+            business=self.business_profile1, reviewer=self.customers[1], rating=1,
+            description="Late delivery, and the second delivery was late again!"
+        )
+        self.other_business = Reviews.objects.create(
+            business=self.business_profile2, reviewer=self.customers[0], rating=2,
+            description="Delivery came late."
+        )
+        self.on_time = Reviews.objects.create(
+            business=self.business_profile2, reviewer=self.customers[2], rating=5,
+            description="Fast delivery, great work."
+        )
+
+        self.url = reverse('reviews-list-create')
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.customer_token.key)
+
+    def test_tokenize(self):
+        """Test: Terms are lower-cased and counted, stop words and single characters are dropped"""
+
+        self.assertEqual(tokenize("The LATE delivery was late, a shame"), {'late': 2, 'delivery': 1, 'shame': 1})
+
+    def test_search_requires_all_terms_and_ranks_matches(self):
+        """Test: Only reviews with every term match, more mentions rank higher"""
+
+        response = self.client.get(self.url, {'search': 'late delivery'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [review['id'] for review in response.data],
+            [self.late_twice.id, self.late_once.id, self.other_business.id]
+        )
+
+    def test_search_combines_with_business_filter(self):
+        """Test: Search narrows the business filter"""
+
+        response = self.client.get(self.url, {'search': 'late', 'business_user_id': self.business_user2.id})
+
+        self.assertEqual([review['id'] for review in response.data], [self.other_business.id])
+
+    def test_explicit_ordering_overrides_rank(self):
+        """Test: ?ordering wins over the search rank"""
+
+        response = self.client.get(self.url, {'search': 'delivery', 'ordering': '-rating'})
+
+        self.assertEqual([review['rating'] for review in response.data], [5, 3, 2, 1])
+
+    def test_index_follows_description_changes(self):
+        """Test: Editing a description re-indexes it, deleting the review drops its terms"""
+
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.customer_token.key)
+        self.client.patch(
+            reverse('review-detail', kwargs={'pk': self.late_once.id}), {'description': "Superb timing"}, format='json'
+        )
+
+        response = self.client.get(self.url, {'search': 'superb'})
+        self.assertEqual([review['id'] for review in response.data], [self.late_once.id])
+        self.assertEqual(len(self.client.get(self.url, {'search': 'late delivery'}).data), 2)
+
+        self.late_once.delete()
+        self.assertFalse(ReviewSearchTerm.objects.filter(review_id=self.late_once.id).exists())
+
+    def test_search_of_stop_words_only(self):
+        """Test: A query without searchable terms does not filter the reviews"""
+
+        response = self.client.get(self.url, {'search': 'the and'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), Reviews.objects.count())
+
+    def test_long_descriptions_count_beyond_small_integers(self):
+        """Test: Term frequencies above 32767 are stored"""
+
+        self.late_once.description = 'late ' * 40000
+        self.late_once.save()
+
+        self.assertEqual(ReviewSearchTerm.objects.get(review=self.late_once, term='late').frequency, 40000)
@@ -0,0 +1,105 @@
+from io import StringIO
+
+from django.urls import reverse
+from django.core.management import call_command
+from django.contrib.auth.models import User
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework.authtoken.models import Token
+
+from profiles_app.models import Profile
+from reviews_app.models import Reviews, BusinessRatingStats
+
+
+class ReviewStatsTests(APITestCase):
+    """Tests for the maintained business rating stats and GET /api/review-summary/{business_user_id}/"""
+
+    def setUp(self):
+        """Create test data"""
+
+        self.customer_user = User.objects.create_user(
+            username="customer1",
+            email="customer@example.com",
+            password="password123"
+        )
+        self.customer_profile = Profile.objects.create(user=self.customer_user, type='customer')
+        self.customer_token = Token.objects.create(user=self.customer_user)
+
+        self.customer_user2 = User.objects.create_user(
+            username="customer2",
+            email="customer2@example.com",
+            password="password123"
+        )
+        self.customer_profile2 = Profile.objects.create(user=self.customer_user2, type='customer')
+
+        self.business_user = User.objects.create_user(
+            username="business1",
+            email="business1@example.com",
+            password="password123"
+        )
+        self.business_profile = Profile.objects.create(user=self.business_user, type='business')
+
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.customer_token.key)
+
+    def stats(self):
+        stats = BusinessRatingStats.objects.get(business=self.business_profile)
+        return stats.review_count, stats.rating_sum, stats.histogram
+
+    def test_stats_follow_review_writes(self):
+        """Test: Creating, re-rating and deleting reviews keep count, sum and histogram up to date"""
+
+        response = self.client.post(
+            reverse('reviews-list-create'), {'business_user': self.business_user.id, 'rating': 4}, format='json'
+        )
+        Reviews.objects.create(business=self.business_profile, reviewer=self.customer_profile2, rating=2)
+        self.assertEqual(self.stats(), (2, 6, {'1': 0, '2': 1, '3': 0, '4': 1, '5': 0}))
+
+        self.client.patch(reverse('review-detail', kwargs={'pk': response.data['id']}), {'rating': 5}, format='json')
+        self.assertEqual(self.stats(), (2, 7, {'1': 0, '2': 1, '3': 0, '4': 0, '5': 1}))
+
+        self.client.delete(reverse('review-detail', kwargs={'pk': response.data['id']}))
+        self.assertEqual(self.stats(), (1, 2, {'1': 0, '2': 1, '3': 0, '4': 0, '5': 0}))
+
+    def test_summary_endpoint(self):
+        """Test: The summary returns count and average of the business, zeros without reviews"""
+
+        url = reverse('review-summary', kwargs={'business_user_id': self.business_user.id})
+        response = self.client.get(url)
+        self.assertEqual(response.data, {'business_user': self.business_user.id, 'review_count': 0, 'average_rating': 0.0})
+
+        Reviews.objects.create(business=self.business_profile, reviewer=self.customer_profile, rating=5)
+        Reviews.objects.create(business=self.business_profile, reviewer=self.customer_profile2, rating=4)
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['review_count'], 2)
+        self.assertEqual(response.data['average_rating'], 4.5)
+
+    def test_summary_unknown_business(self):
+        """Test: Customers and unknown users return 404"""
+
+        response = self.client.get(reverse('review-summary', kwargs={'business_user_id': self.customer_user.id}))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_business_list_shows_stats(self):
+        """Test: The business profile list includes review count and average rating"""
+
+        Reviews.objects.create(business=self.business_profile, reviewer=self.customer_profile, rating=3)
+        response = self.client.get(reverse('businessprofiles'))
+
+        self.assertEqual(response.data[0]['review_count'], 1)
+        self.assertEqual(response.data[0]['average_rating'], 3.0)
+
+    def test_reconcile_repairs_drift(self):
+        """Test: The reconcile command rebuilds rows that no longer match the reviews"""
+
+        Reviews.objects.create(business=self.business_profile, reviewer=self.customer_profile, rating=5)
+        Reviews.objects.create(business=self.business_profile, reviewer=self.customer_profile2, rating=1)
+        BusinessRatingStats.objects.filter(business=self.business_profile).update(review_count=7, rating_5=0)
+
+        out = StringIO()
+        call_command('reconcile_rating_stats', batch_size=1, stdout=out)
+
+        self.assertEqual(self.stats(), (2, 6, {'1': 1, '2': 0, '3': 0, '4': 0, '5': 1}))
+        self.assertIn("1 had drifted", out.getvalue())
@@ -1,4 +1,8 @@
+from unittest import mock
+
+from django.db import connection, IntegrityError
 from django.urls import reverse
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth.models import User
 
 from rest_framework import status
@@ -153,6 +157,9 @@ class ReviewsTests(APITestCase):
         
         self.assertEqual(response1.status_code, status.HTTP_201_CREATED)
         self.assertEqual(response2.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response2.data, {
+            'non_field_errors': ["You have already submitted a review for this business user."]
+        })
         self.assertEqual(Reviews.objects.count(), 1)
         
     def test_create_review_for_different_business(self):
@@ -177,4 +184,44 @@ class ReviewsTests(APITestCase):
         self.assertEqual(response1.status_code, status.HTTP_201_CREATED)
         self.assertEqual(response2.status_code, status.HTTP_201_CREATED)
         self.assertEqual(Reviews.objects.count(), 2)
-        
\ No newline at end of file
+        
+    def test_create_review_query_count(self):
+        """Test that creating a review does not re-fetch the reviewer or pre-check duplicates"""
+        
+        url = reverse('reviews-list-create')
+        data = {
+            "business_user": self.business_user1.id,
+            "rating": 4,
+            "description": "Great service!"
+        }
+        
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.customer_token.key)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(url, data, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        statements = [query['sql'] for query in queries if not query['sql'].startswith(('SAVEPOINT', 'RELEASE'))]
+        creation = [
+            sql for sql in statements
+            if 'authtoken_token' not in sql and ('profiles_app_profile' in sql or '"reviews_app_reviews"' in sql)
+        ]
+        # The business lookup and the insert; the reviewer comes with the authenticated user.
+        self.assertEqual(len(creation), 2)
+        self.assertTrue(creation[0].startswith('SELECT') and creation[1].startswith('INSERT'))
+        # Plus the token lookup, the search terms and the rating stats update and first-review insert.
+        self.assertEqual(len(statements), 6)
+        
+    def test_create_review_other_integrity_errors_are_not_duplicates(self):
+        """Test that only the reviewer/business constraint is reported as an existing review"""
+        
+        url = reverse('reviews-list-create')
+        data = {
+            "business_user": self.business_user1.id,
+            "rating": 4,
+            "description": "Great service!"
+        }
+        
+        self.client.credentials(HTTP_AUTHORIZATION='Token ' + self.customer_token.key)
+        with mock.patch('reviews_app.api.serializers.serializers.ModelSerializer.create', side_effect=IntegrityError):
+            with self.assertRaises(IntegrityError):
+                self.client.post(url, data, format='json')